@@ -1,3 +1,19 @@
+from .constraints import *
 from .traits import *
 from .selections import *
-from .organism import Organism
\ No newline at end of file
+from .surrogates import *
+from .adaptation import *
+from .localsearch import *
+from .engines import *
+from .metrictree import MetricTree
+from .niching import *
+from .kdtree import KDTree
+from .novelty import *
+from .problemcontext import ProblemContext, SharedArray
+from .executors import *
+from .fidelity import *
+from .sinks import *
+from .genomeindex import GenomeIndex, GenomeKey
+from .lineagerecorder import LineageRecorder
+from .organism import Organism
+from .tuning import *
\ No newline at end of file
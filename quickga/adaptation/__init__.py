@@ -0,0 +1 @@
+from .adaptivecontrol import AdaptiveControl
\ No newline at end of file
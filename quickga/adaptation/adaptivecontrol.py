@@ -0,0 +1,207 @@
+import math
+import random
+
+class AdaptiveControl:
+    """A class to adapt mutation rates and crossover/mutation operators while evolving
+
+    self-adaptive rates:
+        Each Organism carries its own mutation rate for every trait (in its 'mutation_rates' attribute)
+        A child inherits the geometric mean of its parents rates, perturbed by a log-normal factor, and the
+        rate is used to mutate the childs own trait values. Good rates spread because the organisms using them survive
+
+    operator selection:
+        For traits with 'crossover_functions' and 'mutation_functions' dictionaries (the sequence traits)
+        the operator is chosen for every child instead of being fixed in the constructor
+        Operators are credited by the fitness improvement of the children they produced over their best parent
+        Currently implemented operator selection methods include
+            - probability matching
+            - bandit (UCB1)
+    """
+
+    def __init__(self, self_adaptive_rates: bool=True, operator_selection: str='probability-matching', tau: float=0.2,
+            min_rate: float=0.001, max_rate: float=0.5, adaptation_rate: float=0.3, min_probability: float=0.05,
+            exploration: float=0.5):
+        """
+        Args:
+            self_adaptive_rates: bool
+                Whether each Organism should carry and evolve its own mutation rates
+            operator_selection: str
+                One of ['probability-matching', 'bandit'] or None to keep the operators from the constructor
+            tau: float
+                The strength of the log-normal perturbation applied to inherited mutation rates
+            min_rate: float
+                The lowest a self-adapted mutation rate can be
+            max_rate: float
+                The highest a self-adapted mutation rate can be
+            adaptation_rate: [0,1]
+                How quickly an operators quality estimate follows its most recent rewards
+            min_probability: [0,1]
+                The lowest chance any operator has of being chosen with probability matching
+            exploration: float
+                How strongly rarely used operators are favoured with bandit selection
+        """
+        self.self_adaptive_rates = self_adaptive_rates
+        self.operator_selection = operator_selection
+        self.tau = tau
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.adaptation_rate = adaptation_rate
+        self.min_probability = min_probability
+        self.exploration = exploration
+
+        self.operator_selection_functions = {
+            'probability-matching': self.probability_matching_choice,
+            'bandit': self.bandit_choice
+        }
+
+        if operator_selection is not None and operator_selection not in self.operator_selection_functions:
+            raise Exception("Invalid operator selection type provided")
+
+        # quality estimates and number of uses, keyed by (trait name, 'crossover' or 'mutation') and then operator name
+        self.qualities = {}
+        self.uses = {}
+
+    def inherit_rate(self, trait_name: str, trait, a, b) -> float:
+        """Creates a childs mutation rate for a trait from the rates of both parents"""
+        rate_a = a.mutation_rates.get(trait_name, trait.mutation_rate)
+        rate_b = b.mutation_rates.get(trait_name, trait.mutation_rate)
+        # a rate of 0 would never change again, so the lower bound is applied before averaging
+        rate = math.sqrt(max(rate_a, self.min_rate)*max(rate_b, self.min_rate))
+        rate *= math.exp(self.tau*random.gauss(0, 1))
+        return min(max(rate, self.min_rate), self.max_rate)
+
+    def probabilities(self, key: tuple, options: list) -> dict:
+        """The chance of each operator being chosen with probability matching"""
+        qualities = self.qualities.setdefault(key, {})
+        total_quality = sum(qualities.get(option, 0) for option in options)
+        if total_quality == 0:
+            return {option: 1/len(options) for option in options}
+        min_probability = min(self.min_probability, 1/len(options))
+        scale = 1-len(options)*min_probability
+        return {option: min_probability+scale*qualities.get(option, 0)/total_quality for option in options}
+
+    def probability_matching_choice(self, key: tuple, options: list) -> str:
+        probabilities = self.probabilities(key, options)
+        return random.choices(options, weights=[probabilities[option] for option in options])[0]
+
+    def bandit_choice(self, key: tuple, options: list) -> str:
+        qualities = self.qualities.setdefault(key, {})
+        uses = self.uses.setdefault(key, {})
+        # every operator is tried once before the upper confidence bounds are used
+        untried = [option for option in options if not uses.get(option)]
+        if untried:
+            return random.choice(untried)
+        total_uses = sum(uses[option] for option in options)
+        upper_bound = lambda option: qualities.get(option, 0)+self.exploration*math.sqrt(2*math.log(total_uses)/uses[option])
+        return max(options, key=upper_bound)
+
+    def choose(self, trait_name: str, kind: str, options: list) -> str:
+        """Chooses the operator of type 'kind' ('crossover' or 'mutation') for a trait"""
+        key = (trait_name, kind)
+        option = self.operator_selection_functions[self.operator_selection](key, options)
+        uses = self.uses.setdefault(key, {})
+        uses[option] = uses.get(option, 0)+1
+        return option
+
+    def crossover_options(self, trait) -> list:
+        # n-point crossover can only be used if the user defined n
+        if trait.crossover_type == 'n-point':
+            return list(trait.crossover_functions)
+        return [option for option in trait.crossover_functions if option != 'n-point']
+
+    def from_parent_values(self, trait_name: str, trait, a, b, child):
+        """Creates the childs value for a trait using the adapted mutation rate and operators
+
+        Args:
+            trait_name: str
+                The name of the trait
+            trait:
+                The trait object of the first parent
+            a:
+                The first parent Organism
+            b:
+                The second parent Organism
+            child:
+                The Organism being created
+
+        Returns:
+            The value for the childs trait
+        """
+        # the parents trait settings are temporarily replaced and restored afterwards
+        saved_settings = {attr: vars(trait)[attr] for attr in ['mutation_rate', 'crossover_type', 'mutation_type', 'n']
+            if attr in vars(trait)}
+
+        if self.self_adaptive_rates and 'mutation_rate' in saved_settings:
+            rate = self.inherit_rate(trait_name, trait, a, b)
+            child.mutation_rates[trait_name] = rate
+            trait.mutation_rate = rate
+        if self.operator_selection and hasattr(trait, 'crossover_functions') and hasattr(trait, 'mutation_functions'):
+            trait.crossover_type = self.choose(trait_name, 'crossover', self.crossover_options(trait))
+            trait.mutation_type = self.choose(trait_name, 'mutation', list(trait.mutation_functions))
+            child.operators[trait_name] = (trait.crossover_type, trait.mutation_type)
+
+        try:
+            return trait.from_parent_values(vars(a)[trait_name], vars(b)[trait_name])
+        finally:
+            vars(trait).update(saved_settings)
+
+    def credit(self, offspring: list):
+        """Rewards the operators used to create the offspring by their fitness improvement
+
+        The improvement of each child over its best parent is divided by the range of fitnesses in the offspring
+        so that rewards are comparable regardless of the scale of the fitness function
+
+        Args:
+            offspring: list
+                The newly created and evaluated Organisms
+        """
+        credited = [organism for organism in offspring if organism.operators and not organism.fitness_estimated]
+        if not credited:
+            return
+        fitnesses = [organism.fitness for organism in credited]
+        fitness_range = (max(fitnesses)-min(fitnesses)) or 1
+
+        for organism in credited:
+            reward = max(0, organism.fitness-organism.parent_fitness)/fitness_range
+            for trait_name, operators in organism.operators.items():
+                for kind, option in zip(['crossover', 'mutation'], operators):
+                    qualities = self.qualities.setdefault((trait_name, kind), {})
+                    quality = qualities.get(option, 0)
+                    qualities[option] = quality+self.adaptation_rate*(reward-quality)
+
+    def statistics(self, population: list) -> dict:
+        """Creates a dictionary of the current adaptation state for a population
+
+        Returns:
+            A dict with the mean mutation rate of each trait and, for each operator, how many organisms
+            in the population it created along with its quality estimate, total uses and (with probability matching)
+            its chance of being chosen
+        """
+        mutation_rates = {}
+        for organism in population:
+            for trait_name, rate in organism.mutation_rates.items():
+                mutation_rates.setdefault(trait_name, []).append(rate)
+
+        operators = {}
+        for key in self.uses:
+            trait_name, kind = key
+            population_uses = {}
+            for organism in population:
+                if trait_name in organism.operators:
+                    option = organism.operators[trait_name][0 if kind == 'crossover' else 1]
+                    population_uses[option] = population_uses.get(option, 0)+1
+            options = list(self.uses[key])
+            operators.setdefault(trait_name, {})[kind] = {option: {
+                'population_uses': population_uses.get(option, 0),
+                'total_uses': self.uses[key][option],
+                'quality': self.qualities.get(key, {}).get(option, 0)
+            } for option in options}
+            if self.operator_selection == 'probability-matching':
+                probabilities = self.probabilities(key, options)
+                for option in options:
+                    operators[trait_name][kind][option]['probability'] = probabilities[option]
+
+        return {
+            'mutation_rates': {trait_name: sum(rates)/len(rates) for trait_name, rates in mutation_rates.items()},
+            'operators': operators
+        }
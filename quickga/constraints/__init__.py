@@ -0,0 +1,4 @@
+from .baseconstraint import BaseConstraint
+from .sumconstraint import SumConstraint
+from .cardinalityconstraint import CardinalityConstraint
+from .permutationconstraint import PermutationConstraint
\ No newline at end of file
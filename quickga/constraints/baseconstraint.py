@@ -0,0 +1,36 @@
+class BaseConstraint:
+    """A class to represent a constraint on the values of a trait
+
+    Constraints are added to traits with 'add_constraint', and are checked and repaired by 'evolve'
+    before offspring are evaluated, so evaluations are not spent on infeasible genomes
+
+    The methods is_feasible and repair MUST be overwritten
+    """
+
+    def is_feasible(self, value) -> bool:
+        """Checks whether a value satisfies the constraint (this should be much cheaper than evaluating an organism)
+
+        THIS METHOD MUST BE OVERWRITTEN
+
+        Args:
+            value:
+                A value of the trait
+
+        Returns:
+            True if the value satisfies the constraint
+        """
+        raise Exception(f"The Class '{self.__class__.__name__}' has not implemented 'is_feasible' method")
+
+    def repair(self, value):
+        """Creates a value which satisfies the constraint and is as close as possible to an infeasible value
+
+        THIS METHOD MUST BE OVERWRITTEN
+
+        Args:
+            value:
+                An infeasible value of the trait (which must not be changed in place)
+
+        Returns:
+            The repaired value
+        """
+        raise Exception(f"The Class '{self.__class__.__name__}' has not implemented 'repair' method")
\ No newline at end of file
@@ -0,0 +1,45 @@
+import random
+from .baseconstraint import BaseConstraint
+
+class CardinalityConstraint(BaseConstraint):
+    """A constraint which limits how many items of a sequence are selected (not equal to 'off_value')
+
+    For example, at most 10 of the bits of a BinarySequenceTrait being 1. Repairing turns randomly chosen
+    selected items off (or unselected items on) until the count is within the limits
+    """
+
+    def __init__(self, min_count: int=None, max_count: int=None, off_value=0, on_value=1):
+        """
+        Args:
+            min_count: int
+                The fewest items which must be selected, no limit if not provided
+            max_count: int
+                The most items which may be selected, no limit if not provided
+            off_value:
+                The value of an unselected item
+            on_value:
+                The value given to an item turned on when repairing
+        """
+        if min_count is not None and max_count is not None and min_count > max_count:
+            raise Exception("min_count cannot be greater than max_count")
+
+        self.min_count = min_count
+        self.max_count = max_count
+        self.off_value = off_value
+        self.on_value = on_value
+
+    def is_feasible(self, value: list) -> bool:
+        count = len(value)-list(value).count(self.off_value)
+        return (self.min_count is None or count >= self.min_count) and (self.max_count is None or count <= self.max_count)
+
+    def repair(self, value: list) -> list:
+        value = list(value)
+        selected = [i for i, v in enumerate(value) if v != self.off_value]
+        if self.max_count is not None and len(selected) > self.max_count:
+            for i in random.sample(selected, len(selected)-self.max_count):
+                value[i] = self.off_value
+        elif self.min_count is not None and len(selected) < self.min_count:
+            unselected = [i for i, v in enumerate(value) if v == self.off_value]
+            for i in random.sample(unselected, min(self.min_count-len(selected), len(unselected))):
+                value[i] = self.on_value
+        return value
\ No newline at end of file
@@ -0,0 +1,42 @@
+import random
+from .baseconstraint import BaseConstraint
+
+class PermutationConstraint(BaseConstraint):
+    """A constraint which requires a sequence to contain each of the elements exactly once
+
+    Useful for sequence traits (such as an IntSequenceTrait) whose operators do not keep permutations valid
+    Repairing keeps the first occurrence of each element and replaces repeated or unknown items with the missing
+    elements in a random order
+    """
+
+    def __init__(self, elements):
+        """
+        Args:
+            elements:
+                The elements the sequence must be a permutation of
+        """
+        self.elements = list(elements)
+        self.element_set = set(self.elements)
+        if len(self.element_set) != len(self.elements):
+            raise Exception("The elements of a permutation must be unique")
+
+    def is_feasible(self, value: list) -> bool:
+        return len(value) == len(self.elements) and len(set(value)) == len(self.elements) and self.element_set.issuperset(value)
+
+    def repair(self, value: list) -> list:
+        seen = set()
+        keep = []
+        for v in value:
+            keep.append(v in self.element_set and v not in seen)
+            seen.add(v)
+        missing = [e for e in self.elements if e not in seen]
+        random.shuffle(missing)
+
+        repaired = []
+        for v, kept in zip(value, keep):
+            if kept:
+                repaired.append(v)
+            elif missing:
+                repaired.append(missing.pop())
+        # a sequence of the wrong length is truncated or extended with the remaining elements
+        return repaired[:len(self.elements)]+missing
\ No newline at end of file
@@ -0,0 +1,80 @@
+import math
+from .baseconstraint import BaseConstraint
+
+class SumConstraint(BaseConstraint):
+    """A constraint which bounds the sum of a sequence of numbers (such as a budget or a capacity)
+
+    Repairing moves each number towards its bound in proportion to how far it can move, so the shape of the sequence
+    is kept. Sequences of integers are repaired with integers (the leftover units are given to the numbers with the
+    largest remainders), so the repaired sum lands exactly on the violated bound, or on the nearest feasible integer
+    """
+
+    def __init__(self, min_sum: float=None, max_sum: float=None, lower: float=0, upper: float=None):
+        """
+        Args:
+            min_sum: float
+                The lowest the sum can be, no limit if not provided
+            max_sum: float
+                The highest the sum can be, no limit if not provided
+            lower: float
+                The lowest a number can be moved to when repairing
+            upper: float
+                The highest a number can be moved to when repairing, no limit if not provided
+        """
+        if min_sum is not None and max_sum is not None and min_sum > max_sum:
+            raise Exception("min_sum cannot be greater than max_sum")
+
+        self.min_sum = min_sum
+        self.max_sum = max_sum
+        self.lower = lower
+        self.upper = upper
+
+    def is_feasible(self, value: list) -> bool:
+        total = sum(value)
+        # repaired float sequences may miss the bound by rounding error
+        return ((self.min_sum is None or total >= self.min_sum-self.tolerance(self.min_sum)) and
+            (self.max_sum is None or total <= self.max_sum+self.tolerance(self.max_sum)))
+
+    @staticmethod
+    def tolerance(bound: float) -> float:
+        return 1e-9*max(1, abs(bound))
+
+    def move(self, value: list, amount: float, room: list) -> list:
+        """Moves the numbers by 'amount' in total (negative to decrease), each in proportion to its room to move"""
+        total_room = sum(room)
+        if total_room <= 0:
+            return list(value)
+        # no number can move further than its room
+        amount = math.copysign(min(abs(amount), total_room), amount)
+        changes = [amount*r/total_room for r in room]
+
+        if all(isinstance(v, int) for v in value):
+            # rounded away from zero, so a bound between two integers is still satisfied
+            units = math.floor(amount) if amount < 0 else math.ceil(amount)
+            whole = [math.trunc(change) for change in changes]
+            leftover = units-sum(whole)
+            # the numbers with the largest remainders (which still have room) take the leftover units
+            order = sorted(range(len(value)), key=lambda i: abs(changes[i]-whole[i]), reverse=True)
+            step = 1 if leftover > 0 else -1
+            for i in order:
+                if not leftover:
+                    break
+                if abs(whole[i]+step) <= room[i]:
+                    whole[i] += step
+                    leftover -= step
+            changes = whole
+
+        return [v+change for v, change in zip(value, changes)]
+
+    def repair(self, value: list) -> list:
+        total = sum(value)
+        if self.max_sum is not None and total > self.max_sum:
+            return self.move(value, self.max_sum-total, [max(v-self.lower, 0) for v in value])
+        if self.min_sum is not None and total < self.min_sum:
+            if self.upper is None:
+                # without an upper bound every number can take the whole deficit, so it is shared equally
+                room = [self.min_sum-total]*len(value)
+            else:
+                room = [max(self.upper-v, 0) for v in value]
+            return self.move(value, self.min_sum-total, room)
+        return list(value)
\ No newline at end of file
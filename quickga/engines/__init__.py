@@ -0,0 +1,3 @@
+from .baseengine import BaseEngine
+from .differentialevolution import DifferentialEvolution
+from .cmaes import CMAES
\ No newline at end of file
@@ -0,0 +1,47 @@
+import random
+
+class BaseEngine:
+    """A class to represent an optimizer which can be used instead of the Genetic Algorithm in Organism.evolve
+
+    Engines work on the real vectors created by the Organism's 'encode' method, so only traits which implement
+    'bounds' and 'decode' (the float, int and binary traits and their sequences) can be optimized by them
+    The Organism's 'evaluate' method, the generational callback and the info for each generation are the same as the GA
+
+    The method run MUST be overwritten
+    """
+
+    def run(self, cls, population_size: int, generations: int, generate_population_info, generational_callback=None) -> list:
+        """This method is responsible for optimizing the traits of the Organism class
+
+        THIS METHOD MUST BE OVERWRITTEN
+
+        Args:
+            cls:
+                The Organism class being optimized
+            population_size: int
+                The number of Organisms evaluated each generation
+            generations: int
+                How many generations of optimization should take place
+            generate_population_info:
+                A function which creates the info dict for a list of evaluated Organisms
+            generational_callback:
+                A function called with the info of each generation
+
+        Returns:
+            A list of the info for each generation
+        """
+
+        raise Exception(f"The Class '{self.__class__.__name__}' has not implemented 'run' method")
+
+    def create_organism(self, cls, vector: list):
+        """Creates an evaluated Organism whose traits are decoded from the vector"""
+        organism = cls()
+        organism.decode(vector)
+        organism.fitness = organism.evaluate()
+        return organism
+
+    def random_vector(self, bounds: list) -> list:
+        return [random.uniform(low, high) for low, high in bounds]
+
+    def clip(self, vector: list, bounds: list) -> list:
+        return [min(max(x, low), high) for x, (low, high) in zip(vector, bounds)]
\ No newline at end of file
@@ -0,0 +1,133 @@
+import math
+import random
+from .baseengine import BaseEngine
+
+def symmetric_eigen(matrix: list, tolerance: float=1e-12, max_sweeps: int=100) -> tuple:
+    """Calculates the eigenvalues and eigenvectors of a symmetric matrix with the cyclic Jacobi method
+
+    Args:
+        matrix: list
+            A symmetric matrix as a list of rows
+
+    Returns:
+        A tuple of (eigenvalues, eigenvectors) where eigenvectors[i][k] is the i-th value of the k-th eigenvector
+    """
+    n = len(matrix)
+    a = [list(row) for row in matrix]
+    v = [[1.0 if i == j else 0.0 for j in range(n)] for i in range(n)]
+
+    for sweep in range(max_sweeps):
+        off_diagonal = sum(a[i][j]**2 for i in range(n) for j in range(i+1, n))
+        if off_diagonal < tolerance:
+            break
+        for p in range(n):
+            for q in range(p+1, n):
+                if abs(a[p][q]) < 1e-300:
+                    continue
+                # the rotation which makes a[p][q] zero
+                theta = (a[q][q]-a[p][p])/(2*a[p][q])
+                t = (1 if theta >= 0 else -1)/(abs(theta)+math.sqrt(theta*theta+1))
+                c = 1/math.sqrt(t*t+1)
+                s = t*c
+                for k in range(n):
+                    a_kp, a_kq = a[k][p], a[k][q]
+                    a[k][p] = c*a_kp-s*a_kq
+                    a[k][q] = s*a_kp+c*a_kq
+                for k in range(n):
+                    a_pk, a_qk = a[p][k], a[q][k]
+                    a[p][k] = c*a_pk-s*a_qk
+                    a[q][k] = s*a_pk+c*a_qk
+                for k in range(n):
+                    v_kp, v_kq = v[k][p], v[k][q]
+                    v[k][p] = c*v_kp-s*v_kq
+                    v[k][q] = s*v_kp+c*v_kq
+
+    return [a[i][i] for i in range(n)], v
+
+
+class CMAES(BaseEngine):
+    """Covariance Matrix Adaptation Evolution Strategy over the real vector encoding of an Organism's traits
+
+    Each generation samples the population from a multivariate normal distribution, then moves the mean towards the most fit
+    samples and adapts the covariance matrix and step size so that successful search directions become more likely
+
+    The search runs in coordinates scaled so that the bounds of every value are [0,1],
+    samples outside of the bounds are clipped before they are decoded into an Organism
+    """
+
+    def __init__(self, initial_sigma: float=0.3, initial_mean: list=None):
+        """
+        Args:
+            initial_sigma: float
+                The initial step size as a fraction of the range of each value
+            initial_mean: list
+                The starting point as a list of values in [0,1] (scaled to each value's bounds), the center if not provided
+        """
+        self.initial_sigma = initial_sigma
+        self.initial_mean = initial_mean
+
+    def run(self, cls, population_size: int, generations: int, generate_population_info, generational_callback=None) -> list:
+        if population_size < 2:
+            raise Exception("Population size must be at least 2 for CMA-ES")
+
+        bounds = cls().bounds()
+        n = len(bounds)
+        to_vector = lambda x: [low+min(max(x[i], 0), 1)*(high-low) for i, (low, high) in enumerate(bounds)]
+
+        # strategy parameters (the defaults recommended by Hansen)
+        mu = population_size//2
+        weights = [math.log(mu+0.5)-math.log(i+1) for i in range(mu)]
+        weights = [w/sum(weights) for w in weights]
+        mueff = 1/sum(w*w for w in weights)
+        cc = (4+mueff/n)/(n+4+2*mueff/n)
+        cs = (mueff+2)/(n+mueff+5)
+        c1 = 2/((n+1.3)**2+mueff)
+        cmu = min(1-c1, 2*(mueff-2+1/mueff)/((n+2)**2+mueff))
+        damps = 1+2*max(0, math.sqrt((mueff-1)/(n+1))-1)+cs
+        chi_n = math.sqrt(n)*(1-1/(4*n)+1/(21*n*n))
+
+        mean = list(self.initial_mean) if self.initial_mean else [0.5]*n
+        sigma = self.initial_sigma
+        pc = [0.0]*n
+        ps = [0.0]*n
+        covariance = [[1.0 if i == j else 0.0 for j in range(n)] for i in range(n)]
+
+        evolution_info = []
+        for generation in range(generations):
+            eigenvalues, basis = symmetric_eigen(covariance)
+            scales = [math.sqrt(max(value, 1e-20)) for value in eigenvalues]
+
+            samples = []
+            for k in range(population_size):
+                z = [random.gauss(0, 1) for i in range(n)]
+                y = [sum(basis[i][j]*scales[j]*z[j] for j in range(n)) for i in range(n)]
+                x = [mean[i]+sigma*y[i] for i in range(n)]
+                samples.append((self.create_organism(cls, to_vector(x)), x))
+
+            samples.sort(key=lambda sample: sample[0].fitness, reverse=True)
+            old_mean = mean
+            mean = [sum(weights[k]*samples[k][1][i] for k in range(mu)) for i in range(n)]
+            mean_step = [(mean[i]-old_mean[i])/sigma for i in range(n)]
+
+            # C^(-1/2) * mean_step, calculated with the eigendecomposition
+            projected = [sum(basis[j][i]*mean_step[j] for j in range(n))/scales[i] for i in range(n)]
+            whitened_step = [sum(basis[i][j]*projected[j] for j in range(n)) for i in range(n)]
+
+            ps = [(1-cs)*ps[i]+math.sqrt(cs*(2-cs)*mueff)*whitened_step[i] for i in range(n)]
+            ps_norm = math.sqrt(sum(p*p for p in ps))
+            hsig = ps_norm/math.sqrt(1-(1-cs)**(2*(generation+1)))/chi_n < 1.4+2/(n+1)
+            pc = [(1-cc)*pc[i]+hsig*math.sqrt(cc*(2-cc)*mueff)*mean_step[i] for i in range(n)]
+
+            steps = [[(samples[k][1][i]-old_mean[i])/sigma for i in range(n)] for k in range(mu)]
+            decay = 1-c1-cmu+(1-hsig)*c1*cc*(2-cc)
+            covariance = [[decay*covariance[i][j]+c1*pc[i]*pc[j]+cmu*sum(weights[k]*steps[k][i]*steps[k][j] for k in range(mu))
+                for j in range(n)] for i in range(n)]
+            sigma *= math.exp((cs/damps)*(ps_norm/chi_n-1))
+
+            info = generate_population_info([sample[0] for sample in samples])
+            info['evaluations'] = population_size
+            evolution_info.append(info)
+            if generational_callback:
+                generational_callback(info)
+
+        return evolution_info
\ No newline at end of file
@@ -0,0 +1,88 @@
+import random
+from .baseengine import BaseEngine
+
+class DifferentialEvolution(BaseEngine):
+    """Differential Evolution over the real vector encoding of an Organism's traits
+
+    Each generation every member of the population creates a trial vector by adding the scaled difference
+    of two other members to a base vector and crossing it over with itself, the trial replaces the member if it is at least as fit
+
+    Currently implemented strategies include
+        - rand/1/bin (the base vector is a random member)
+        - best/1/bin (the base vector is the most fit member)
+        - current-to-best/1/bin (the base vector is the member moved towards the most fit member)
+    """
+
+    def __init__(self, strategy: str='rand/1/bin', differential_weight: float=0.8, crossover_rate: float=0.9):
+        """
+        Args:
+            strategy: str
+                One of ['rand/1/bin', 'best/1/bin', 'current-to-best/1/bin']
+            differential_weight: [0,2]
+                The scale (often called F) applied to the difference vectors
+            crossover_rate: [0,1]
+                The chance (often called CR) of each value of the trial vector coming from the mutant vector
+        """
+        self.strategy = strategy
+        self.differential_weight = differential_weight
+        self.crossover_rate = crossover_rate
+
+        self.strategy_functions = {
+            'rand/1/bin': self.rand_mutant,
+            'best/1/bin': self.best_mutant,
+            'current-to-best/1/bin': self.current_to_best_mutant
+        }
+
+        if strategy not in self.strategy_functions:
+            raise Exception("Invalid differential evolution strategy provided")
+
+    def difference(self, vectors: list, excluded: list) -> tuple:
+        """Returns a random member not in 'excluded' and the scaled difference of two others"""
+        indices = random.sample([i for i in range(len(vectors)) if i not in excluded], 3)
+        a, b, c = [vectors[i] for i in indices]
+        return a, [self.differential_weight*(b[k]-c[k]) for k in range(len(b))]
+
+    def rand_mutant(self, vectors: list, i: int, best: int) -> list:
+        base, difference = self.difference(vectors, [i])
+        return [base[k]+difference[k] for k in range(len(base))]
+
+    def best_mutant(self, vectors: list, i: int, best: int) -> list:
+        ignored, difference = self.difference(vectors, [i, best])
+        return [vectors[best][k]+difference[k] for k in range(len(difference))]
+
+    def current_to_best_mutant(self, vectors: list, i: int, best: int) -> list:
+        ignored, difference = self.difference(vectors, [i, best])
+        current = vectors[i]
+        return [current[k]+self.differential_weight*(vectors[best][k]-current[k])+difference[k] for k in range(len(current))]
+
+    def run(self, cls, population_size: int, generations: int, generate_population_info, generational_callback=None) -> list:
+        if population_size < 5:
+            raise Exception("Population size must be at least 5 for Differential Evolution")
+
+        bounds = cls().bounds()
+        vectors = [self.random_vector(bounds) for i in range(population_size)]
+        population = [self.create_organism(cls, vector) for vector in vectors]
+        evolution_info = []
+
+        for generation in range(generations):
+            if generation > 0:
+                best = max(range(population_size), key=lambda i: population[i].fitness)
+                for i in range(population_size):
+                    mutant = self.strategy_functions[self.strategy](vectors, i, best)
+                    # at least one value always comes from the mutant
+                    forced_index = random.randrange(len(bounds))
+                    trial = [mutant[k] if k == forced_index or random.random() < self.crossover_rate else vectors[i][k]
+                        for k in range(len(bounds))]
+                    trial = self.clip(trial, bounds)
+                    organism = self.create_organism(cls, trial)
+                    if organism.fitness >= population[i].fitness:
+                        vectors[i] = trial
+                        population[i] = organism
+
+            info = generate_population_info(list(population))
+            info['evaluations'] = population_size
+            evolution_info.append(info)
+            if generational_callback:
+                generational_callback(info)
+
+        return evolution_info
\ No newline at end of file
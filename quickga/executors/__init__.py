@@ -0,0 +1,2 @@
+from .evaluationexecutor import EvaluationExecutor
+from .parallelbreeder import ParallelBreeder
\ No newline at end of file
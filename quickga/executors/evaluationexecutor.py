@@ -0,0 +1,298 @@
+import copy
+import itertools
+import multiprocessing
+import multiprocessing.pool
+import queue
+import statistics
+import time
+from quickga.problemcontext import install_problem_contexts
+
+# the queue a worker process reports each evaluation it starts to, set when the worker process starts
+started_queue = None
+
+def initialize_worker(contexts: list, started):
+    """Gives a worker process the problem contexts and the queue evaluations are reported to when they start"""
+    global started_queue
+    started_queue = started
+    install_problem_contexts(contexts)
+
+
+def evaluate_organism(organism, fidelity: float=None, task: int=None, started=None) -> tuple:
+    """Evaluates an organism inside a worker
+
+    Returns:
+        A tuple of the fitness and the number of seconds the evaluation took
+    """
+    started = started if started is not None else started_queue
+    if started is not None:
+        # the timeout of an evaluation only starts once a worker is running it
+        started.put(task)
+    start_time = time.perf_counter()
+    if fidelity is None:
+        fitness = organism.evaluate()
+    else:
+        fitness = organism.evaluate(fidelity=fidelity)
+    return fitness, time.perf_counter()-start_time
+
+
+class EvaluationExecutor:
+    """A class to evaluate Organisms in parallel while isolating failures and bounding the time taken by slow evaluations
+
+    Each evaluation which raises an exception or runs longer than the timeout is retried up to 'retries' times,
+    after which the Organism is given the penalty fitness. Once most of the evaluations have finished, evaluations
+    running much longer than the typical one (stragglers) are started again on a free worker and the first result is kept
+
+    Timeouts are measured from when a worker starts an evaluation, not from when it is queued. Evaluations which are
+    abandoned (timed out, or beaten by a speculative copy) keep their worker busy until they return. Worker processes
+    stuck in a timed out evaluation cannot be stopped individually, so the pool is replaced once every worker is stuck
+    or after the evaluations finish
+
+    'evaluate' must be deterministic for speculative re-execution to be safe
+    With the 'process' backend, Organisms are copied to the workers, so their class must be importable (defined at module level)
+    The problem contexts of the Organism classes are attached to by each worker once when it starts
+    """
+
+    def __init__(self, workers: int=None, backend: str='process', timeout: float=None, retries: int=0, penalty_fitness: float=0,
+            speculative_quantile: float=0.9, speculative_factor: float=2, poll_interval: float=0.005):
+        """
+        Args:
+            workers: int
+                The number of worker processes (or threads), the number of CPUs if not provided
+            backend: str
+                One of ['process', 'thread']
+            timeout: float
+                The maximum number of seconds a single evaluation may take, no limit if not provided
+            retries: int
+                How many times a failed or timed out evaluation is started again before the penalty fitness is used
+            penalty_fitness: float
+                The fitness given to Organisms whose evaluations all failed or timed out
+            speculative_quantile: [0,1]
+                The fraction of evaluations that must be finished before stragglers are started again (None to disable)
+            speculative_factor: float
+                An evaluation is a straggler once it has run this many times longer than the median finished evaluation
+            poll_interval: float
+                How many seconds to wait between checks of the running evaluations
+        """
+        self.backends = {
+            'process': multiprocessing.Pool,
+            'thread': multiprocessing.pool.ThreadPool
+        }
+
+        if backend not in self.backends:
+            raise Exception("Invalid executor backend provided")
+
+        self.workers = workers or multiprocessing.cpu_count()
+        self.backend = backend
+        self.timeout = timeout
+        self.retries = retries
+        self.penalty_fitness = penalty_fitness
+        self.speculative_quantile = speculative_quantile
+        self.speculative_factor = speculative_factor
+        self.poll_interval = poll_interval
+
+        self.pool = None
+        self.started = None
+        self.context_classes = set()
+        # a unique number for every evaluation started, reported by the worker when it starts the evaluation
+        self.tasks = itertools.count()
+        # when each started task was seen to start, and the (task, async result) of every abandoned evaluation still running
+        self.start_times = {}
+        self.abandoned = []
+        self.reset_statistics()
+
+    def __enter__(self) -> 'EvaluationExecutor':
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """Stops all of the workers
+
+        Worker processes are terminated immediately, while threads cannot be stopped
+        so they are left to exit once their current evaluation returns
+        """
+        if self.pool:
+            if self.backend == 'process':
+                self.pool.terminate()
+                self.pool.join()
+            else:
+                self.pool.close()
+            self.pool = None
+            self.started = None
+            self.start_times = {}
+            self.abandoned = []
+
+    @staticmethod
+    def problem_context_classes(organisms: list) -> set:
+        """Returns the classes of the organisms which use a problem context"""
+        return {organism_class for organism_class in {type(organism) for organism in organisms} if organism_class.uses_problem_context()}
+
+    def create_pool(self, organisms: list):
+        """Starts the workers, giving them the problem contexts of the organisms classes"""
+        self.context_classes |= self.problem_context_classes(organisms)
+        if self.backend == 'process':
+            contexts = [(organism_class, organism_class.problem_context()) for organism_class in self.context_classes]
+            self.started = multiprocessing.Queue()
+            self.pool = self.backends[self.backend](self.workers, initialize_worker, (contexts, self.started))
+        else:
+            self.started = queue.SimpleQueue()
+            self.pool = self.backends[self.backend](self.workers)
+
+    def record_starts(self, now: float):
+        """Records the time of every evaluation the workers reported starting since the last call"""
+        while True:
+            try:
+                task = self.started.get_nowait()
+            except queue.Empty:
+                return
+            self.start_times[task] = now
+
+    def running_time(self, task: int, now: float) -> float:
+        """Returns how long a worker has been running a task, 0 if it has not started yet"""
+        return now-self.start_times[task] if task in self.start_times else 0
+
+    def num_stuck(self, now: float) -> int:
+        """Returns the number of workers busy with abandoned evaluations which have run past the timeout"""
+        if self.timeout is None:
+            return 0
+        return sum(self.running_time(task, now) > self.timeout for task, result in self.abandoned)
+
+    def reset_statistics(self):
+        self.counts = {'failed': 0, 'timed_out': 0, 'retried': 0, 'speculative': 0, 'penalized': 0}
+
+    def statistics(self) -> dict:
+        """Returns the number of failed, timed out, retried, speculatively restarted and penalized evaluations since the last reset"""
+        return dict(self.counts)
+
+    def detach(self, organism):
+        """Creates a shallow copy of an organism without references to other organisms, which is cheap to send to a worker"""
+        detached = copy.copy(organism)
+        detached.parents = []
+        detached.adaptive_control = None
+        return detached
+
+    def evaluate(self, organisms: list, fidelity: float=None) -> list:
+        """Evaluates the organisms in parallel
+
+        Args:
+            organisms: list
+                The organisms to be evaluated (they are not changed)
+            fidelity: float
+                If provided, passed to each organisms 'evaluate' method (used by a MultiFidelityScheduler)
+
+        Returns:
+            A list with the fitness of each organism
+        """
+        if not organisms:
+            return []
+        if self.pool is not None and self.backend == 'process':
+            # workers started before a class with a problem context was evaluated are replaced
+            if not self.problem_context_classes(organisms) <= self.context_classes:
+                self.close()
+        if self.pool is None:
+            self.create_pool(organisms)
+
+        fitnesses = [None]*len(organisms)
+        attempts_left = [self.retries+1]*len(organisms)
+        # (organism index, task, async result) of every evaluation which has been started and not given up on
+        running = []
+        queue = list(range(len(organisms)))
+        durations = []
+        restarted = set()
+        # the queue of the thread backend is shared directly, worker processes were given theirs when they started
+        started = self.started if self.backend == 'thread' else None
+
+        def start(index):
+            attempts_left[index] -= 1
+            task = next(self.tasks)
+            result = self.pool.apply_async(evaluate_organism, (self.detach(organisms[index]), fidelity, task, started))
+            running.append((index, task, result))
+
+        def give_up(index):
+            # the organism is retried if it has attempts left and no other evaluation of it is running
+            if fitnesses[index] is not None or any(i == index for i, task, result in running):
+                return
+            if attempts_left[index] > 0:
+                self.counts['retried'] += 1
+                queue.append(index)
+            else:
+                self.counts['penalized'] += 1
+                fitnesses[index] = self.penalty_fitness
+
+        def num_busy():
+            return len(running)+len(self.abandoned)
+
+        while queue or running:
+            # evaluations of organisms which already have a fitness (from a speculative copy) are no longer waited for,
+            # but their workers stay busy until they return
+            self.abandoned += [(task, result) for index, task, result in running if fitnesses[index] is not None]
+            running[:] = [attempt for attempt in running if fitnesses[attempt[0]] is None]
+            if not queue and not running:
+                break
+
+            while queue and num_busy() < self.workers:
+                index = queue.pop(0)
+                if fitnesses[index] is None:
+                    start(index)
+
+            time.sleep(self.poll_interval)
+            now = time.monotonic()
+            self.record_starts(now)
+            self.abandoned = [(task, result) for task, result in self.abandoned if not result.ready()]
+
+            still_running = []
+            finished = []
+            for index, task, result in running:
+                if result.ready():
+                    finished.append((index, result))
+                elif self.timeout is not None and self.running_time(task, now) > self.timeout:
+                    self.counts['timed_out'] += 1
+                    self.abandoned.append((task, result))
+                    finished.append((index, None))
+                else:
+                    still_running.append((index, task, result))
+            running[:] = still_running
+
+            for index, result in finished:
+                if result is not None:
+                    try:
+                        fitness, duration = result.get()
+                    except Exception:
+                        self.counts['failed'] += 1
+                    else:
+                        durations.append(duration)
+                        if fitnesses[index] is None:
+                            fitnesses[index] = fitness
+                        continue
+                give_up(index)
+
+            if self.num_stuck(now) >= self.workers:
+                # every worker is stuck, so the pool is replaced and the evaluations waiting for a worker are started again
+                self.close()
+                self.create_pool(organisms)
+                started = self.started if self.backend == 'thread' else None
+                for index, task, result in running:
+                    attempts_left[index] += 1
+                    queue.insert(0, index)
+                running.clear()
+
+            # start stragglers again once most evaluations have finished
+            num_finished = sum(fitness is not None for fitness in fitnesses)
+            if self.speculative_quantile is not None and durations and num_finished >= self.speculative_quantile*len(organisms):
+                straggler_time = self.speculative_factor*statistics.median(durations)
+                for index, task, result in list(running):
+                    if index not in restarted and self.running_time(task, now) > straggler_time and num_busy() < self.workers:
+                        restarted.add(index)
+                        self.counts['speculative'] += 1
+                        attempts_left[index] += 1
+                        start(index)
+
+        if self.num_stuck(time.monotonic()):
+            self.close()
+        else:
+            # only the start times of evaluations which are still running are needed by the next call
+            tasks = {task for task, result in self.abandoned}
+            self.start_times = {task: start_time for task, start_time in self.start_times.items() if task in tasks}
+
+        return fitnesses
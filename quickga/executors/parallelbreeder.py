@@ -0,0 +1,142 @@
+import multiprocessing
+import random
+
+# an Organism of each class, created once per worker process to provide the trait objects
+templates = {}
+
+def breed_offspring(organism_class, trait_names: list, genomes: list, index_pairs: list, seed: int) -> list:
+    """Breeds a slice of the offspring inside a worker
+
+    Args:
+        organism_class:
+            The class of the organisms
+        trait_names: list
+            The names of the traits, in the order of the values of each genome
+        genomes: list
+            The trait values of each parent used by this slice
+        index_pairs: list
+            The (index, index) of the two parents of each child in 'genomes'
+        seed: int
+            The seed of this slices random number stream
+
+    Returns:
+        A list of (trait values, mutated) tuples, one for each child
+    """
+    if organism_class not in templates:
+        templates[organism_class] = organism_class()
+    template = templates[organism_class]
+    # seeded after the template is created, so the stream does not depend on which slices a worker was given before
+    random.seed(seed)
+
+    parents = [template.with_values(dict(zip(trait_names, genome))) for genome in genomes]
+    offspring = []
+    for a, b in index_pairs:
+        child_vars = vars(parents[a].breed(parents[b]))
+        offspring.append(([child_vars[trait_name] for trait_name in trait_names], child_vars['mutated']))
+    return offspring
+
+
+class ParallelBreeder:
+    """A class to breed offspring in worker processes
+
+    Parents are still selected in the main process, but the index pairs of the selected parents are split into slices,
+    and each worker breeds a slice using its own random number stream. Only the genomes of the parents used by a slice
+    are sent to its worker, and only the childrens trait values are sent back
+
+    The slices and their seeds only depend on 'slice_size' and the seed (or the state of the random module), so results
+    are reproducible for any number of workers. AdaptiveControl is not supported, since its state lives in the main process
+
+    The selection function must be created from a SelectionFunctionFactory (which provides 'select_parent_pairs'),
+    and the Organism class must be importable by the workers (defined at module level)
+
+    Example:
+        with ParallelBreeder(workers=8) as breeder:
+            Organism.evolve(10000, 100, breeder=breeder)
+    """
+
+    def __init__(self, workers: int=None, slice_size: int=256, min_offspring: int=64, seed: int=None):
+        """
+        Args:
+            workers: int
+                The number of worker processes, the number of CPUs if not provided
+            slice_size: int
+                How many offspring are bred by a worker at a time (smaller slices balance uneven work better)
+            min_offspring: int
+                Fewer offspring than this are bred in the main process, where sending the parents would cost more than breeding
+            seed: int
+                The seed of the random number streams, the random module is used if not provided
+        """
+        self.workers = workers or multiprocessing.cpu_count()
+        self.slice_size = slice_size
+        self.min_offspring = min_offspring
+        self.random = random.Random(seed) if seed is not None else random
+        self.pool = None
+
+    def __enter__(self) -> 'ParallelBreeder':
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """Stops the worker processes"""
+        if self.pool:
+            self.pool.close()
+            self.pool.join()
+            self.pool = None
+
+    def breed(self, selection_function, parent_pool: list, num_offspring: int) -> list:
+        """Selects parents with the selection function and breeds the offspring in the worker processes
+
+        Args:
+            selection_function:
+                A selection function created from a SelectionFunctionFactory
+            parent_pool: list
+                The organisms which may be selected as parents
+            num_offspring: int
+                How many offspring to create
+
+        Returns:
+            A list of the new offspring
+        """
+        selector = getattr(selection_function, '__self__', None)
+        if not hasattr(selector, 'select_parent_pairs'):
+            raise Exception("Parallel breeding requires a selection function created from a SelectionFunctionFactory")
+
+        parent_pairs = selector.select_parent_pairs(parent_pool, num_offspring)
+        if any(parent.adaptive_control for pair in parent_pairs for parent in pair):
+            raise Exception("Parallel breeding does not support AdaptiveControl")
+        if len(parent_pairs) < self.min_offspring:
+            return [pair[0] + pair[1] for pair in parent_pairs]
+
+        if self.pool is None:
+            self.pool = multiprocessing.Pool(self.workers)
+
+        template = parent_pairs[0][0]
+        organism_class = type(template)
+        trait_names = list(template._traits)
+
+        slices = [parent_pairs[start:start+self.slice_size] for start in range(0, len(parent_pairs), self.slice_size)]
+        tasks = []
+        for pairs in slices:
+            # each parent used by the slice is sent once, and the pairs are converted to indices into the sent genomes
+            local_indices = {}
+            genomes = []
+            index_pairs = []
+            for pair in pairs:
+                for parent in pair:
+                    if id(parent) not in local_indices:
+                        local_indices[id(parent)] = len(genomes)
+                        parent_vars = vars(parent)
+                        genomes.append([parent_vars[trait_name] for trait_name in trait_names])
+                index_pairs.append((local_indices[id(pair[0])], local_indices[id(pair[1])]))
+            tasks.append((organism_class, trait_names, genomes, index_pairs, self.random.getrandbits(64)))
+
+        offspring = []
+        for pairs, results in zip(slices, self.pool.starmap(breed_offspring, tasks)):
+            for (a, b), (values, mutated) in zip(pairs, results):
+                child = a.with_values(dict(zip(trait_names, values)))
+                child.mutated = mutated
+                child.parents = [a, b]
+                offspring.append(child)
+        return offspring
\ No newline at end of file
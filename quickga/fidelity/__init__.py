@@ -0,0 +1 @@
+from .multifidelityscheduler import MultiFidelityScheduler
\ No newline at end of file
@@ -0,0 +1,104 @@
+import math
+
+class MultiFidelityScheduler:
+    """A class to evaluate each generation with successive halving over increasing fidelities
+
+    For 'evaluate' methods whose accuracy and cost both grow with a fidelity (such as the number of samples of a
+    Monte-Carlo simulation), every new organism is first evaluated at the lowest fidelity, and only the most fit
+    'promotion_rate' percent are evaluated again at the next fidelity, until the full (last) fidelity is reached
+
+    Organisms must implement 'evaluate' with a 'fidelity' argument:
+        def evaluate(self, fidelity: float=1) -> float:
+
+    An Organism's 'fitness' always holds the value from the highest fidelity it was evaluated at (recorded in its
+    'fidelity' attribute), and elites which were only evaluated at a lower fidelity are evaluated at full fidelity
+
+    Example:
+        # 100 offspring cost 100*0.1 + 34*0.3 + 12*1 = 32.2 full evaluations instead of 100
+        Organism.evolve(100, 50, fidelity_scheduler=MultiFidelityScheduler([0.1, 0.3, 1], promotion_rate=1/3))
+    """
+
+    def __init__(self, fidelities: list=(0.1, 0.3, 1), promotion_rate: float=1/3, rescore_elites: bool=True):
+        """
+        Args:
+            fidelities: list
+                The increasing fidelities passed to 'evaluate', the last is full fidelity
+            promotion_rate: (0,1]
+                The percent of organisms evaluated at a fidelity which are evaluated again at the next fidelity
+            rescore_elites: bool
+                Whether elites evaluated below full fidelity are evaluated again at full fidelity
+        """
+        if not fidelities or any(a >= b for a, b in zip(fidelities, fidelities[1:])):
+            raise Exception("Fidelities must be increasing")
+        if not 0 < promotion_rate <= 1:
+            raise Exception("Promotion rate must be in (0,1]")
+
+        self.fidelities = list(fidelities)
+        self.promotion_rate = promotion_rate
+        self.rescore_elites = rescore_elites
+        self.reset_statistics()
+
+    def reset_statistics(self):
+        self.counts = [0]*len(self.fidelities)
+
+    def evaluate_at(self, organisms: list, level: int, executor=None):
+        """Evaluates the organisms at the fidelity of a level, using the executor if one is provided"""
+        fidelity = self.fidelities[level]
+        if executor:
+            fitnesses = executor.evaluate(organisms, fidelity)
+        else:
+            fitnesses = [organism.evaluate(fidelity=fidelity) for organism in organisms]
+        for organism, fitness in zip(organisms, fitnesses):
+            organism.fitness = fitness
+            organism.fitness_estimated = False
+            organism.fidelity = fidelity
+        self.counts[level] += len(organisms)
+
+    def evaluate(self, organisms: list, elites: list=None, executor=None) -> list:
+        """Evaluates new organisms with successive halving, and elites below full fidelity at full fidelity
+
+        Args:
+            organisms: list
+                The organisms which need a fitness
+            elites: list
+                The elites of the generation, none if not provided
+            executor:
+                An optional EvaluationExecutor
+
+        Returns:
+            A list of every organism which was evaluated
+        """
+        evaluated = {}
+        candidates = list(organisms)
+        for level in range(len(self.fidelities)):
+            if not candidates:
+                break
+            self.evaluate_at(candidates, level, executor)
+            evaluated.update((id(organism), organism) for organism in candidates)
+            if level < len(self.fidelities)-1:
+                num_promoted = max(math.ceil(self.promotion_rate*len(candidates)), 1)
+                candidates = sorted(candidates, key=lambda x: x.fitness, reverse=True)[:num_promoted]
+
+        if self.rescore_elites:
+            full_fidelity = self.fidelities[-1]
+            stale_elites = [organism for organism in elites or [] if organism.fidelity is not None and organism.fidelity < full_fidelity]
+            if stale_elites:
+                self.evaluate_at(stale_elites, len(self.fidelities)-1, executor)
+                evaluated.update((id(organism), organism) for organism in stale_elites)
+
+        return list(evaluated.values())
+
+    def num_evaluations(self) -> int:
+        """Returns how many times the organisms 'evaluate' was called since the last reset"""
+        return sum(self.counts)
+
+    def statistics(self) -> dict:
+        """Returns the evaluations at each fidelity and their cost (in full fidelity evaluations) since the last reset
+
+        The cost assumes the cost of an evaluation is proportional to its fidelity
+        """
+        return {
+            'fidelities': list(self.fidelities),
+            'evaluations': list(self.counts),
+            'cost': sum(count*fidelity for count, fidelity in zip(self.counts, self.fidelities))/self.fidelities[-1]
+        }
\ No newline at end of file
@@ -0,0 +1,72 @@
+class GenomeKey(tuple):
+    """A hashable snapshot of an Organism's trait values whose hash is only calculated once"""
+
+    def __hash__(self):
+        if '_hash' not in vars(self):
+            self._hash = tuple.__hash__(self)
+        return self._hash
+
+    @staticmethod
+    def freeze(value):
+        """Recursively converts lists (and other unhashable sequences) into tuples"""
+        if isinstance(value, (list, tuple)):
+            return tuple(GenomeKey.freeze(v) for v in value)
+        if isinstance(value, (bytearray, memoryview)):
+            return bytes(value)
+        return value
+
+
+class GenomeIndex:
+    """A population-wide index of genomes used to find genetically identical Organisms
+
+    Organisms are indexed by their 'genome_key', so checking whether a genome
+    is already present costs a single hash lookup regardless of the population size
+
+    Example:
+        index = GenomeIndex(population)
+        if child in index:
+            # the child is a clone of an organism already in the population
+    """
+
+    def __init__(self, organisms: list=None):
+        """
+        Args:
+            organisms: list
+                The Organisms the index initially contains, empty if not provided
+        """
+        self.counts = {}
+        for organism in organisms or []:
+            self.add(organism)
+
+    def __contains__(self, organism) -> bool:
+        return organism.genome_key() in self.counts
+
+    def __len__(self) -> int:
+        return sum(self.counts.values())
+
+    def add(self, organism) -> bool:
+        """Adds an Organism to the index
+
+        Returns:
+            True if the Organism's genome was not already in the index
+        """
+        key = organism.genome_key()
+        count = self.counts.get(key, 0)
+        self.counts[key] = count+1
+        return count == 0
+
+    def remove(self, organism):
+        """Removes one occurrence of an Organism's genome from the index"""
+        key = organism.genome_key()
+        if self.counts.get(key, 0) <= 1:
+            self.counts.pop(key, None)
+        else:
+            self.counts[key] -= 1
+
+    def count(self, organism) -> int:
+        """Returns how many indexed Organisms share the genome of the Organism"""
+        return self.counts.get(organism.genome_key(), 0)
+
+    def unique_count(self) -> int:
+        """Returns the number of distinct genomes in the index"""
+        return len(self.counts)
\ No newline at end of file
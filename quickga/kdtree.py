@@ -0,0 +1,159 @@
+import heapq
+import math
+
+class KDNode:
+    """A node of a KDTree, either a leaf holding point indices or a split of the points along one dimension"""
+
+    __slots__ = ('indices', 'dimension', 'split', 'left', 'right')
+
+    def __init__(self, indices: list):
+        self.indices = indices
+        self.dimension = None
+        self.split = None
+        self.left = None
+        self.right = None
+
+
+class KDTree:
+    """A k-d tree of points (sequences of numbers) supporting insertion, replacement and k nearest neighbor queries
+
+    Points are kept in small leaves which are split along their widest dimension once they grow past 'leaf_size',
+    and the whole tree is rebuilt once as many points have been inserted or replaced as it held when last built,
+    so it stays balanced while the cost of every change is amortized to O(log n)
+
+    Example:
+        tree = KDTree([(0, 0), (1, 1)])
+        tree.insert((2, 2))
+        tree.nearest((0.9, 0.9), 2)
+    """
+
+    def __init__(self, points: list=(), leaf_size: int=16):
+        """
+        Args:
+            points: list
+                The initial points
+            leaf_size: int
+                The maximum number of points in a leaf before it is split
+        """
+        self.leaf_size = leaf_size
+        self.points = [tuple(point) for point in points]
+        self.rebuild()
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    def rebuild(self):
+        """Rebuilds the tree from scratch so that it is balanced"""
+        self.changes = 0
+        self.root = KDNode(list(range(len(self.points))))
+        nodes = [self.root]
+        while nodes:
+            nodes += self.split(nodes.pop())
+
+    def split(self, node: KDNode) -> list:
+        """Splits a leaf holding too many points in two along its widest dimension
+
+        Returns:
+            The new leaves (which may need to be split again), or an empty list if the leaf is not split
+        """
+        if len(node.indices) <= self.leaf_size:
+            return []
+
+        points = self.points
+        dimensions = range(len(points[node.indices[0]]))
+        spread = lambda d: max(points[i][d] for i in node.indices)-min(points[i][d] for i in node.indices)
+        dimension = max(dimensions, key=spread)
+        values = sorted(points[i][dimension] for i in node.indices)
+        if values[0] == values[-1]:
+            # every point is the same, so the leaf cannot be split
+            return []
+
+        split = values[len(values)//2]
+        if split == values[0]:
+            # the lower half must not be empty
+            split = next(value for value in values if value > values[0])
+
+        node.dimension = dimension
+        node.split = split
+        node.left = KDNode([i for i in node.indices if points[i][dimension] < split])
+        node.right = KDNode([i for i in node.indices if points[i][dimension] >= split])
+        node.indices = None
+        return [node.left, node.right]
+
+    def leaf(self, point: tuple) -> KDNode:
+        """Finds the leaf a point belongs in"""
+        node = self.root
+        while node.indices is None:
+            node = node.left if point[node.dimension] < node.split else node.right
+        return node
+
+    def record_change(self):
+        self.changes += 1
+        if self.changes > max(len(self.points), self.leaf_size):
+            self.rebuild()
+
+    def insert(self, point) -> int:
+        """Adds a point to the tree and returns its index"""
+        point = tuple(point)
+        self.points.append(point)
+        index = len(self.points)-1
+        node = self.leaf(point)
+        node.indices.append(index)
+        self.split(node)
+        self.record_change()
+        return index
+
+    def replace(self, index: int, point):
+        """Replaces the point at an index with a new point"""
+        point = tuple(point)
+        self.leaf(self.points[index]).indices.remove(index)
+        self.points[index] = point
+        node = self.leaf(point)
+        node.indices.append(index)
+        self.split(node)
+        self.record_change()
+
+    def nearest(self, query, k: int, exclude: int=None) -> list:
+        """Finds the k points closest to the query (by euclidean distance)
+
+        Args:
+            query:
+                The point to search around
+            k: int
+                How many points to find
+            exclude: int
+                An optional index of a point which is skipped (such as the query itself)
+
+        Returns:
+            A list of (index, distance) tuples sorted from nearest to furthest
+        """
+        points = self.points
+        dimensions = range(len(query))
+        # a max heap of the best points found so far, stored as (-squared distance, index)
+        best = []
+
+        # each node is stored with the squared distance from the query to the split plane which separates it
+        nodes = [(self.root, 0)]
+        while nodes:
+            node, plane_distance = nodes.pop()
+            if len(best) == k and plane_distance >= -best[0][0]:
+                continue
+
+            if node.indices is None:
+                difference = query[node.dimension]-node.split
+                near, far = (node.left, node.right) if difference < 0 else (node.right, node.left)
+                nodes.append((far, max(plane_distance, difference*difference)))
+                nodes.append((near, plane_distance))
+                continue
+
+            for i in node.indices:
+                if i == exclude:
+                    continue
+                point = points[i]
+                squared_distance = sum([(query[d]-point[d])**2 for d in dimensions])
+                if len(best) < k:
+                    heapq.heappush(best, (-squared_distance, i))
+                elif squared_distance < -best[0][0]:
+                    heapq.heapreplace(best, (-squared_distance, i))
+
+        return sorted([(i, math.sqrt(-d)) for d, i in best], key=lambda x: x[1])
\ No newline at end of file
@@ -0,0 +1,153 @@
+import array
+
+class LineageRecorder:
+    """A class to record the genealogy of every generation as compact integer arrays
+
+    For each generation the recorder stores, per organism, the indices of its parents in the previous generation,
+    how it entered the generation, whether it was mutated and its fitness. Genealogy queries run on these arrays,
+    so the Organisms themselves do not need to keep references to their parents (and can be garbage collected)
+
+    Organisms whose parents were not in the previous generation (such as migrated organisms) have parent indices of -1
+
+    Example:
+        lineage = LineageRecorder()
+        Organism.evolve(100, 50, lineage=lineage)
+        print(lineage.ancestry_of_best())
+    """
+
+    RANDOM = 0
+    OFFSPRING = 1
+    ELITE = 2
+    CARRIED_OVER = 3
+
+    status_names = ['random', 'offspring', 'elite', 'carried_over']
+
+    def __init__(self, keep_parents: bool=False):
+        """
+        Args:
+            keep_parents: bool
+                Whether Organisms should keep references to their parents after they are recorded
+        """
+        self.keep_parents = keep_parents
+        self.parents_a = []
+        self.parents_b = []
+        self.statuses = []
+        self.mutated = []
+        self.fitnesses = []
+
+    def num_generations(self) -> int:
+        return len(self.statuses)
+
+    def record(self, population: list, elites: list=None, carried_over: list=None):
+        """Records a new generation
+
+        Args:
+            population: list
+                The evaluated organisms of the generation
+            elites: list
+                The organisms carried down because they were the most fit, none if not provided
+            carried_over: list
+                The organisms carried down without crossover, none if not provided
+        """
+        generation = len(self.statuses)
+        elite_ids = {id(organism) for organism in elites or []}
+        carried_over_ids = {id(organism) for organism in carried_over or []}
+        index_of = lambda organism: organism.lineage_index[1] if organism.lineage_index and organism.lineage_index[0] == generation-1 else -1
+
+        parents_a = array.array('i', [-1])*len(population)
+        parents_b = array.array('i', [-1])*len(population)
+        statuses = array.array('b', [self.RANDOM])*len(population)
+        mutated = array.array('b', [0])*len(population)
+        fitnesses = array.array('d', [organism.fitness for organism in population])
+
+        for i, organism in enumerate(population):
+            if id(organism) in elite_ids or id(organism) in carried_over_ids:
+                # an organism carried down is its own parent
+                parents_a[i] = index_of(organism)
+                statuses[i] = self.ELITE if id(organism) in elite_ids else self.CARRIED_OVER
+            elif organism.parents:
+                parents_a[i] = index_of(organism.parents[0])
+                parents_b[i] = index_of(organism.parents[-1])
+                statuses[i] = self.OFFSPRING
+                mutated[i] = organism.mutated
+
+        # the indices are assigned after every parent has been looked up
+        for i, organism in enumerate(population):
+            organism.lineage_index = (generation, i)
+            if not self.keep_parents:
+                organism.parents = []
+
+        self.parents_a.append(parents_a)
+        self.parents_b.append(parents_b)
+        self.statuses.append(statuses)
+        self.mutated.append(mutated)
+        self.fitnesses.append(fitnesses)
+
+    def parents(self, generation: int, index: int) -> list:
+        """Returns the indices of an organism's parents in the previous generation"""
+        parents = [self.parents_a[generation][index], self.parents_b[generation][index]]
+        return sorted({parent for parent in parents if parent >= 0})
+
+    def best_index(self, generation: int=-1) -> int:
+        """Returns the index of the most fit organism of a generation"""
+        fitnesses = self.fitnesses[generation]
+        return max(range(len(fitnesses)), key=lambda i: fitnesses[i])
+
+    def ancestry(self, generation: int, index: int, depth: int=None) -> dict:
+        """Finds every ancestor of an organism
+
+        Args:
+            generation: int
+                The generation of the organism (negative values count from the last generation)
+            index: int
+                The index of the organism in its generation
+            depth: int
+                How many generations back to search, all generations if not provided
+
+        Returns:
+            A Dict of form {generation: set of indices} of the organism and its ancestors in each previous generation
+        """
+        generation = generation % self.num_generations()
+        ancestry = {generation: {index}}
+        current = {index}
+        last_generation = 0 if depth is None else max(generation-depth, 0)
+        for g in range(generation, last_generation, -1):
+            parents_a, parents_b = self.parents_a[g], self.parents_b[g]
+            current = {parent for i in current for parent in [parents_a[i], parents_b[i]] if parent >= 0}
+            if not current:
+                break
+            ancestry[g-1] = current
+        return ancestry
+
+    def ancestry_of_best(self, generation: int=-1, depth: int=None) -> dict:
+        """Finds every ancestor of the most fit organism of a generation, see 'ancestry'"""
+        return self.ancestry(generation, self.best_index(generation), depth)
+
+    def offspring_counts(self, generation: int) -> dict:
+        """Returns how many times each organism of the previous generation was a parent (or was carried down) in a generation"""
+        counts = {}
+        for parents in [self.parents_a[generation], self.parents_b[generation]]:
+            for parent in parents:
+                if parent >= 0:
+                    counts[parent] = counts.get(parent, 0)+1
+        return counts
+
+    def effective_number_of_parents(self, generation: int) -> float:
+        """Returns the effective number of parents which produced a generation
+
+        This is the number of equally contributing parents which would give the same spread of contributions,
+        (sum of contributions)^2 / (sum of squared contributions), and falls as a few organisms dominate breeding
+        """
+        counts = self.offspring_counts(generation).values()
+        if not counts:
+            return 0
+        return sum(counts)**2/sum(count**2 for count in counts)
+
+    def status_counts(self, generation: int) -> dict:
+        """Returns how many organisms of a generation were random, offspring, elites or carried over"""
+        statuses = self.statuses[generation]
+        return {name: statuses.count(status) for status, name in enumerate(self.status_names)}
+
+    def mutation_count(self, generation: int) -> int:
+        """Returns how many offspring of a generation were mutated"""
+        return sum(self.mutated[generation])
\ No newline at end of file
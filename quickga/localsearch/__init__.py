@@ -0,0 +1,4 @@
+from .baselocalsearch import BaseLocalSearch
+from .permutationlocalsearch import PermutationLocalSearch
+from .floathillclimb import FloatHillClimb
+from .bitfliphillclimb import BitFlipHillClimb
\ No newline at end of file
@@ -0,0 +1,158 @@
+import math
+import random
+from quickga.traits import Genome
+
+class BaseLocalSearch:
+    """A class to represent a budgeted improvement operator applied to Organisms while evolving (a memetic algorithm)
+
+    Each generation, after the population is evaluated, a fraction of the population is chosen
+    and the value of one of their traits is improved in place of the Organism
+
+    The method improve MUST be overwritten
+    """
+
+    def __init__(self, trait_name: str, rate: float=0.1, selection: str='best'):
+        """
+        Args:
+            trait_name: str
+                The name of the trait which is improved
+            rate: [0,1]
+                The fraction of the population which is improved each generation
+            selection: str
+                One of ['best', 'random'], whether the most fit or random organisms are improved
+        """
+        if selection not in ['best', 'random']:
+            raise Exception("Invalid local search selection type provided")
+
+        self.trait_name = trait_name
+        self.rate = rate
+        self.selection = selection
+        # the feasibility handling of the organism being improved, candidates which break its constraints are rejected
+        self.feasibility = None
+        # the executor and fidelity the population is evaluated with, used for every evaluation of a candidate
+        self.executor = None
+        self.fidelity = None
+
+    def select(self, population: list) -> list:
+        """Chooses the organisms of the population which should be improved"""
+        num_selected = math.ceil(self.rate*len(population))
+        if self.selection == 'best':
+            return sorted(population, key=lambda x: x.fitness, reverse=True)[:num_selected]
+        return random.sample(population, num_selected)
+
+    def apply(self, organism, feasibility: str=None, executor=None, fidelity: float=None) -> tuple:
+        """Improves an organism and updates its fitness
+
+        Args:
+            organism:
+                The Organism being improved
+            feasibility: str
+                The feasibility handling used by 'evolve', one of [None, 'repair', 'penalize']
+                An improved value which breaks the constraints is repaired (if enabled), and the improvement is rejected
+                if the organism is still infeasible or the repaired organism is no more fit than before
+            executor:
+                An optional EvaluationExecutor which evaluates the candidates
+            fidelity: float
+                If provided, the fidelity the candidates are evaluated at (the full fidelity of a MultiFidelityScheduler)
+
+        Returns:
+            A tuple of whether the organism was improved and the number of times 'evaluate' was called
+        """
+        self.feasibility = feasibility
+        self.executor = executor
+        self.fidelity = fidelity
+        num_evaluations = 0
+        # the improvement operators need the true fitness at the candidates fidelity to compare against
+        # (infeasible organisms keep the infeasible fitness)
+        stale = organism.fitness_estimated or (fidelity is not None and organism.fidelity != fidelity)
+        if stale and organism.feasible:
+            organism.fitness = self.evaluate(organism)
+            organism.fitness_estimated = False
+            organism.fidelity = fidelity
+            num_evaluations += 1
+
+        organism_vars = vars(organism)
+        value = organism_vars[self.trait_name]
+        new_value, new_fitness, improve_evaluations = self.improve(organism, value)
+        num_evaluations += improve_evaluations
+
+        if new_value is None:
+            return False, num_evaluations
+
+        # the improved value is always a new object so that other references to the old value are unaffected
+        if isinstance(value, Genome):
+            new_value = Genome(new_value)
+        # repairing may change any trait, so every value is kept in case the improvement is rejected
+        saved_values = {trait_name: organism_vars[trait_name] for trait_name in organism._traits}
+        organism_vars[self.trait_name] = new_value
+        organism.clear_genome_key()
+
+        repaired = False
+        if feasibility and not organism.is_feasible():
+            if feasibility == 'repair':
+                organism.repair()
+                repaired = True
+                # the repaired value was never evaluated
+                new_fitness = None
+            if not organism.is_feasible():
+                self.restore(organism, saved_values)
+                return False, num_evaluations
+
+        if new_fitness is None:
+            new_fitness = self.evaluate(organism)
+            num_evaluations += 1
+        if repaired and organism.feasible and new_fitness <= organism.fitness:
+            self.restore(organism, saved_values)
+            return False, num_evaluations
+
+        organism.fitness = new_fitness
+        if fidelity is not None:
+            organism.fidelity = fidelity
+        if feasibility:
+            organism.feasible = True
+        return True, num_evaluations
+
+    @staticmethod
+    def restore(organism, values: dict):
+        """Gives an organism back the trait values it had before a rejected improvement"""
+        vars(organism).update(values)
+        organism.clear_genome_key()
+
+    def evaluate(self, organism) -> float:
+        """Evaluates an organism the way 'evolve' evaluates the population, with its executor and at its fidelity"""
+        if self.executor:
+            return self.executor.evaluate([organism], self.fidelity)[0]
+        if self.fidelity is None:
+            return organism.evaluate()
+        return organism.evaluate(fidelity=self.fidelity)
+
+    def evaluate_with(self, organism, value) -> float:
+        """Evaluates an organism as if its trait had the provided value, -inf if that value breaks its constraints"""
+        organism_vars = vars(organism)
+        original_value = organism_vars[self.trait_name]
+        organism_vars[self.trait_name] = value
+        try:
+            if self.feasibility and not organism.is_feasible():
+                return -math.inf
+            return self.evaluate(organism)
+        finally:
+            organism_vars[self.trait_name] = original_value
+
+    def improve(self, organism, value) -> tuple:
+        """This method is responsible for searching for a better value of the trait
+
+        THIS METHOD MUST BE OVERWRITTEN
+
+        Args:
+            organism:
+                The Organism being improved (its fitness is the true fitness of the current value)
+            value:
+                The current value of the trait, which must not be changed in place
+
+        Returns:
+            A tuple of (new_value, new_fitness, num_evaluations)
+            new_value should be None if no improvement was found
+            new_fitness may be None if it is unknown, in which case the organism is evaluated once more
+        """
+
+        raise Exception(f"The Class '{self.__class__.__name__}' has not implemented 'improve' method")
\ No newline at end of file
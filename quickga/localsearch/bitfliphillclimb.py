@@ -0,0 +1,43 @@
+import random
+from .baselocalsearch import BaseLocalSearch
+
+class BitFlipHillClimb(BaseLocalSearch):
+    """First-improvement bit-flip hill-climbing for BinarySequenceTrait values
+
+    Bits are flipped one at a time in a random order and each flip is kept if the fitness improves
+    """
+
+    def __init__(self, trait_name: str, budget: int=20, rate: float=0.1, selection: str='best'):
+        """
+        Args:
+            trait_name: str
+                The name of the BinarySequenceTrait which is improved
+            budget: int
+                The maximum number of times 'evaluate' is called per organism
+            rate: [0,1]
+                The fraction of the population which is improved each generation
+            selection: str
+                One of ['best', 'random'], whether the most fit or random organisms are improved
+        """
+        super().__init__(trait_name, rate, selection)
+        self.budget = budget
+
+    def improve(self, organism, value: list) -> tuple:
+        best_value = list(value)
+        best_fitness = organism.fitness
+        indices = list(range(len(value)))
+        random.shuffle(indices)
+
+        num_evaluations = 0
+        improved = False
+        for index in indices[:self.budget]:
+            best_value[index] = 1-best_value[index]
+            fitness = self.evaluate_with(organism, best_value)
+            num_evaluations += 1
+            if fitness > best_fitness:
+                best_fitness = fitness
+                improved = True
+            else:
+                best_value[index] = 1-best_value[index]
+
+        return (best_value, best_fitness, num_evaluations) if improved else (None, None, num_evaluations)
\ No newline at end of file
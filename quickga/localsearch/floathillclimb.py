@@ -0,0 +1,73 @@
+import random
+from .baselocalsearch import BaseLocalSearch
+
+class FloatHillClimb(BaseLocalSearch):
+    """Coordinate hill-climbing for FloatSequenceTrait values
+
+    Each step moves a single coordinate up or down by its step size and keeps the change if the fitness improves
+    Unsuccessful coordinates have their step size halved, so the search refines around good solutions
+    """
+
+    def __init__(self, trait_name: str, step_size: float=0.05, budget: int=20, rate: float=0.1, selection: str='best'):
+        """
+        Args:
+            trait_name: str
+                The name of the FloatSequenceTrait which is improved
+            step_size: float
+                The initial step as a fraction of the traits range [min_value, max_value]
+            budget: int
+                The maximum number of times 'evaluate' is called per organism
+            rate: [0,1]
+                The fraction of the population which is improved each generation
+            selection: str
+                One of ['best', 'random'], whether the most fit or random organisms are improved
+        """
+        super().__init__(trait_name, rate, selection)
+        if step_size <= 0:
+            raise Exception("Step size must be positive")
+        self.step_size = step_size
+        self.budget = budget
+
+    def improve(self, organism, value: list) -> tuple:
+        float_trait = organism._traits[self.trait_name].trait
+        min_value, max_value = float_trait.min_value, float_trait.max_value
+        # there is nothing to climb when the trait is empty or every value of it is the same
+        if max_value <= min_value or not value:
+            return None, None, 0
+
+        best_value = list(value)
+        best_fitness = organism.fitness
+        steps = [self.step_size*(max_value-min_value)]*len(value)
+        coordinates = list(range(len(value)))
+        random.shuffle(coordinates)
+
+        num_evaluations = 0
+        improved = False
+        i = 0
+        pass_start_evaluations = 0
+        while num_evaluations < self.budget:
+            if i and i % len(coordinates) == 0:
+                # the steps have shrunk so far that no coordinate can move anymore
+                if num_evaluations == pass_start_evaluations:
+                    break
+                pass_start_evaluations = num_evaluations
+            coordinate = coordinates[i % len(coordinates)]
+            i += 1
+            moved = False
+            for direction in [1, -1]:
+                if num_evaluations >= self.budget:
+                    break
+                candidate = list(best_value)
+                candidate[coordinate] = min(max(candidate[coordinate]+direction*steps[coordinate], min_value), max_value)
+                if candidate[coordinate] == best_value[coordinate]:
+                    continue
+                fitness = self.evaluate_with(organism, candidate)
+                num_evaluations += 1
+                if fitness > best_fitness:
+                    best_value, best_fitness = candidate, fitness
+                    improved = moved = True
+                    break
+            if not moved:
+                steps[coordinate] /= 2
+
+        return (best_value, best_fitness, num_evaluations) if improved else (None, None, num_evaluations)
\ No newline at end of file
@@ -0,0 +1,148 @@
+import heapq
+from .baselocalsearch import BaseLocalSearch
+
+class PermutationLocalSearch(BaseLocalSearch):
+    """2-opt and Or-opt local search for PermutationSequenceTrait values representing a closed tour
+
+    Moves are only considered between an element and its nearest neighbors, and the change in tour length
+    of each move is calculated from the few edges it replaces, so a pass costs O(n * num_neighbors)
+    instead of O(n^2) and 'evaluate' is only called once when the improved tour is kept
+
+    Currently implemented moves include
+        - 2-opt (reverses a section of the tour)
+        - or-opt (moves a section of 1 to 3 elements to another place in the tour)
+    """
+
+    def __init__(self, trait_name: str, distance, num_neighbors: int=8, moves: list=['2-opt', 'or-opt'],
+            max_moves: int=1000, rate: float=0.1, selection: str='best'):
+        """
+        Args:
+            trait_name: str
+                The name of the PermutationSequenceTrait which is improved
+            distance:
+                A function which takes two elements of the permutation and returns the distance between them
+            num_neighbors: int
+                How many of the nearest elements are considered as new neighbors for each element
+            moves: list
+                Which of ['2-opt', 'or-opt'] to use
+            max_moves: int
+                The maximum number of improving moves applied per organism
+            rate: [0,1]
+                The fraction of the population which is improved each generation
+            selection: str
+                One of ['best', 'random'], whether the most fit or random organisms are improved
+        """
+        super().__init__(trait_name, rate, selection)
+        self.distance = distance
+        self.num_neighbors = num_neighbors
+        self.moves = moves
+        self.max_moves = max_moves
+
+        self.move_functions = {
+            '2-opt': self.two_opt_move,
+            'or-opt': self.or_opt_move
+        }
+
+        for move in moves:
+            if move not in self.move_functions:
+                raise Exception("Invalid local search move provided")
+
+        # the neighbor lists are created from the elements of the first tour improved
+        self.neighbors = None
+
+    def build_neighbors(self, elements: list):
+        self.neighbors = {a: [b for b in heapq.nsmallest(self.num_neighbors+1, elements, key=lambda b: self.distance(a, b)) if b != a]
+            [:self.num_neighbors] for a in elements}
+
+    def two_opt_move(self, tour: list, position: dict) -> bool:
+        """Applies the first improving 2-opt move found, returns False if there is none"""
+        n = len(tour)
+        d = self.distance
+        for i in range(n):
+            a = tour[i]
+            for direction in [1, -1]:
+                # b is the successor (or predecessor) of a, the edge (a, b) is replaced by (a, c)
+                b = tour[(i+direction) % n]
+                removed = d(a, b)
+                for c in self.neighbors[a]:
+                    added = d(a, c)
+                    # neighbors are sorted, so no later neighbor can improve the tour
+                    if added >= removed:
+                        break
+                    j = position[c]
+                    e = tour[(j+direction) % n]
+                    if c == b or e == a:
+                        continue
+                    delta = added+d(b, e)-removed-d(c, e)
+                    if delta < -1e-12:
+                        if direction == 1:
+                            start, end = (i+1, j) if i < j else (j+1, i)
+                        else:
+                            start, end = (i, j-1) if i < j else (j, i-1)
+                        self.reverse(tour, position, start, end)
+                        return True
+        return False
+
+    def or_opt_move(self, tour: list, position: dict) -> bool:
+        """Applies the first improving Or-opt move found, returns False if there is none"""
+        n = len(tour)
+        d = self.distance
+        for segment_length in [1, 2, 3]:
+            if n < segment_length+3:
+                break
+            for i in range(n-segment_length+1):
+                segment = tour[i:i+segment_length]
+                first, last = segment[0], segment[-1]
+                before, after = tour[i-1], tour[(i+segment_length) % n]
+                removal_gain = d(before, first)+d(last, after)-d(before, after)
+                if removal_gain <= 1e-12:
+                    continue
+                # the segment is inserted between c and e so that c touches either end of the segment
+                for end, other_end, oriented_segment in [(first, last, segment), (last, first, segment[::-1])]:
+                    for c in self.neighbors[end]:
+                        if d(c, end) >= removal_gain:
+                            break
+                        if c in segment:
+                            continue
+                        j = position[c]
+                        for e in [tour[(j+1) % n], tour[j-1]]:
+                            if e in segment:
+                                continue
+                            if d(c, end)+d(other_end, e)-d(c, e)-removal_gain < -1e-12:
+                                self.insert_segment(tour, position, i, segment_length, [c]+oriented_segment+[e])
+                                return True
+        return False
+
+    def reverse(self, tour: list, position: dict, start: int, end: int):
+        """Reverses tour[start:end+1] and updates the positions of the reversed elements"""
+        tour[start:end+1] = tour[start:end+1][::-1]
+        for k in range(start, end+1):
+            position[tour[k]] = k
+
+    def insert_segment(self, tour: list, position: dict, start: int, length: int, path: list):
+        """Moves tour[start:start+length] so the tour contains 'path' (the segment between two adjacent elements)"""
+        del tour[start:start+length]
+        c, e = path[0], path[-1]
+        index_c = tour.index(c)
+        if tour[(index_c+1) % len(tour)] == e:
+            tour[index_c+1:index_c+1] = path[1:-1]
+        else:
+            # e comes directly before c, so the path is inserted backwards
+            index_e = tour.index(e)
+            tour[index_e+1:index_e+1] = path[-2:0:-1]
+        for k, element in enumerate(tour):
+            position[element] = k
+
+    def improve(self, organism, value: list) -> tuple:
+        if self.neighbors is None:
+            self.build_neighbors(list(value))
+
+        tour = list(value)
+        position = {element: i for i, element in enumerate(tour)}
+        num_moves = 0
+        improved = True
+        while improved and num_moves < self.max_moves:
+            improved = any(self.move_functions[move](tour, position) for move in self.moves)
+            num_moves += improved
+
+        return (tour, None, 0) if num_moves else (None, None, 0)
\ No newline at end of file
@@ -0,0 +1,122 @@
+import heapq
+import math
+import random
+
+class MetricTree:
+    """A vantage point tree which finds the points near a query without measuring the distance to every point
+
+    Each node splits its points into those inside and outside a ball around a vantage point, and the triangle
+    inequality is used to skip whole subtrees which cannot contain a match. Any distance function which is a
+    metric can be used (euclidean distance between encodings, hamming distance, kendall-tau distance, ...)
+
+    Example:
+        tree = MetricTree(population, lambda a, b: a.distance(b))
+        neighbors = tree.within(organism, 0.5)
+    """
+
+    def __init__(self, points: list, distance, leaf_size: int=8):
+        """
+        Args:
+            points: list
+                The points to be searched (any objects the distance function accepts)
+            distance:
+                A function which returns the distance between two points
+            leaf_size: int
+                The maximum number of points in a node which is searched by measuring the distance to each point
+        """
+        self.points = list(points)
+        self.distance = distance
+        self.leaf_size = leaf_size
+        self.root = self.build(list(range(len(self.points))))
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    def build(self, indices: list):
+        """Creates a node, which is either a list of point indices (a leaf) or a (vantage, radius, inside, outside) tuple"""
+        if len(indices) <= self.leaf_size:
+            return indices
+
+        vantage = indices.pop(random.randrange(len(indices)))
+        distances = [self.distance(self.points[vantage], self.points[i]) for i in indices]
+        radius = sorted(distances)[len(distances)//2]
+        inside = [i for i, d in zip(indices, distances) if d <= radius]
+        outside = [i for i, d in zip(indices, distances) if d > radius]
+        return (vantage, radius, self.build(inside), self.build(outside))
+
+    def within(self, query, radius: float) -> list:
+        """Finds every point closer to the query than the radius
+
+        Returns:
+            A list of (index, distance) tuples, where index is the position of the point in 'points'
+        """
+        found = []
+        nodes = [self.root]
+        while nodes:
+            node = nodes.pop()
+            if isinstance(node, list):
+                for i in node:
+                    d = self.distance(query, self.points[i])
+                    if d < radius:
+                        found.append((i, d))
+                continue
+
+            vantage, split, inside, outside = node
+            d = self.distance(query, self.points[vantage])
+            if d < radius:
+                found.append((vantage, d))
+            if d-radius <= split:
+                nodes.append(inside)
+            if d+radius > split:
+                nodes.append(outside)
+        return found
+
+    def nearest(self, query, k: int, exclude=None) -> list:
+        """Finds the k points closest to the query
+
+        Args:
+            query:
+                The point to search around
+            k: int
+                How many points to find
+            exclude:
+                An optional index of a point which is skipped (such as the query itself)
+
+        Returns:
+            A list of (index, distance) tuples sorted from nearest to furthest
+        """
+        # a max heap of the best points found so far, stored as (-distance, index)
+        best = []
+        furthest = lambda: -best[0][0] if len(best) == k else math.inf
+
+        def consider(i, d):
+            if i == exclude:
+                return
+            if len(best) < k:
+                heapq.heappush(best, (-d, i))
+            elif d < -best[0][0]:
+                heapq.heapreplace(best, (-d, i))
+
+        # each node is stored with a lower bound on the distance from the query to any of its points
+        nodes = [(self.root, 0)]
+        while nodes:
+            node, bound = nodes.pop()
+            if bound >= furthest():
+                continue
+            if isinstance(node, list):
+                for i in node:
+                    consider(i, self.distance(query, self.points[i]))
+                continue
+
+            vantage, split, inside, outside = node
+            d = self.distance(query, self.points[vantage])
+            consider(vantage, d)
+            # the side the query falls on is searched first (pushed last), as it most likely holds the nearest points
+            if d <= split:
+                nodes.append((outside, split-d))
+                nodes.append((inside, 0))
+            else:
+                nodes.append((inside, d-split))
+                nodes.append((outside, 0))
+
+        return sorted([(i, -d) for d, i in best], key=lambda x: x[1])
\ No newline at end of file
@@ -0,0 +1 @@
+from .niching import Niching
\ No newline at end of file
@@ -0,0 +1,146 @@
+import math
+from quickga.metrictree import MetricTree
+from quickga.selections import select_with_scores
+
+class Niching:
+    """A class to keep a population spread over several peaks of a multimodal fitness landscape
+
+    Organisms closer than 'radius' to each other are in the same niche. Distances are measured either with each traits
+    'distance' method (hamming distance for binary and char traits, euclidean distance for float traits, edge or
+    kendall-tau distance for permutations) or as the euclidean distance between the 'encode'd genomes
+
+    The neighbors of every organism are found with a MetricTree, so the distance between every pair of organisms
+    does not need to be measured
+
+    Currently implemented modes include
+        - sharing: the fitness used for selection is divided by the number of organisms sharing the niche
+        - clearing: only the 'capacity' most fit organisms of each niche keep their fitness for selection
+        - crowding: each offspring competes with its most similar parent, and the parent survives instead
+            of the offspring if it is more fit (deterministic crowding)
+
+    Sharing and clearing only change the 'selection_fitness' seen by the selection function, the 'fitness' of each organism
+    (and every statistic of the generation) is left unchanged
+    """
+
+    def __init__(self, mode: str='sharing', radius: float=1, alpha: float=1, capacity: int=1, space: str='traits'):
+        """
+        Args:
+            mode: str
+                One of ['sharing', 'clearing', 'crowding']
+            radius: float
+                The distance within which organisms share a niche (not used by crowding)
+            alpha: float
+                The shape of the sharing function 1-(distance/radius)**alpha
+            capacity: int
+                How many organisms of each niche keep their fitness when clearing
+            space: str
+                One of ['traits', 'encoding'], how the distance between organisms is measured
+        """
+        if mode not in ['sharing', 'clearing', 'crowding']:
+            raise Exception("Invalid niching mode provided")
+        if space not in ['traits', 'encoding']:
+            raise Exception("Invalid niching space provided")
+        if radius <= 0:
+            raise Exception("Niching radius must be positive")
+
+        self.mode = mode
+        self.radius = radius
+        self.alpha = alpha
+        self.capacity = capacity
+        self.space = space
+        self.last_statistics = {}
+
+    def distance(self, a, b) -> float:
+        """Returns the distance between two organisms"""
+        if self.space == 'encoding':
+            return math.dist(a.encode(), b.encode())
+        return a.distance(b)
+
+    def tree(self, population: list) -> MetricTree:
+        """Creates a MetricTree of the population, whose point indices are the organisms indices"""
+        if self.space == 'encoding':
+            return MetricTree([organism.encode() for organism in population], math.dist)
+        return MetricTree(population, lambda a, b: a.distance(b))
+
+    def neighborhoods(self, population: list) -> list:
+        """Finds the (index, distance) of every organism within 'radius' of each organism (including itself)"""
+        tree = self.tree(population)
+        return [tree.within(point, self.radius) for point in tree.points]
+
+    def shared_fitnesses(self, population: list) -> list:
+        fitnesses = [organism.fitness for organism in population]
+        # sharing divides fitness, so negative fitnesses are shifted to start at 0
+        offset = min(min(fitnesses), 0)
+        niche_counts = [sum([1-(d/self.radius)**self.alpha for j, d in neighbors]) for neighbors in self.neighborhoods(population)]
+        self.last_statistics = {'mean_niche_count': sum(niche_counts)/len(niche_counts)}
+        return [(fitness-offset)/niche_count for fitness, niche_count in zip(fitnesses, niche_counts)]
+
+    def cleared_fitnesses(self, population: list) -> list:
+        fitnesses = [organism.fitness for organism in population]
+        cleared_fitness = min(min(fitnesses), 0)
+        order = sorted(range(len(population)), key=lambda i: fitnesses[i], reverse=True)
+        rank = [0]*len(population)
+        for position, i in enumerate(order):
+            rank[i] = position
+
+        neighborhoods = self.neighborhoods(population)
+        cleared = [False]*len(population)
+        num_winners = 0
+        for i in order:
+            if cleared[i]:
+                continue
+            num_winners += 1
+            # the most fit organisms of the niche (after i) keep their fitness until the niche is full
+            kept = 1
+            for j in sorted([j for j, d in neighborhoods[i] if rank[j] > rank[i] and not cleared[j]], key=lambda j: rank[j]):
+                if kept < self.capacity:
+                    kept += 1
+                else:
+                    cleared[j] = True
+
+        self.last_statistics = {'winners': num_winners, 'cleared': sum(cleared)}
+        return [cleared_fitness if cleared[i] else fitnesses[i] for i in range(len(population))]
+
+    def selection_fitnesses(self, population: list) -> list:
+        """Returns the fitness of each organism as seen by the selection function"""
+        if self.mode == 'sharing':
+            return self.shared_fitnesses(population)
+        if self.mode == 'clearing':
+            return self.cleared_fitnesses(population)
+        return [organism.fitness for organism in population]
+
+    def select(self, selection_function, parent_pool: list, num_offspring: int) -> list:
+        """Calls the selection function with the parents niched fitnesses in place of their fitnesses"""
+        if self.mode == 'crowding':
+            return selection_function(parent_pool, num_offspring)
+        return select_with_scores(selection_function, parent_pool, num_offspring, self.selection_fitnesses(parent_pool))
+
+    def crowd(self, population: list, offspring: list) -> tuple:
+        """Replaces each evaluated offspring by its most similar parent if that parent is more fit
+
+        Args:
+            population: list
+                The new generation, which contains the offspring
+            offspring: list
+                The offspring bred this generation
+
+        Returns:
+            The new population and a list of the parents which survived
+        """
+        present = {id(organism) for organism in population}
+        replacements = {}
+        for child in offspring:
+            if not child.parents:
+                continue
+            parent = min(child.parents, key=lambda parent: self.distance(child, parent))
+            if parent.fitness > child.fitness and id(parent) not in present:
+                present.add(id(parent))
+                replacements[id(child)] = parent
+
+        self.last_statistics = {'replaced': len(replacements)}
+        population = [replacements.get(id(organism), organism) for organism in population]
+        return population, list(replacements.values())
+
+    def statistics(self) -> dict:
+        """Returns the statistics of the last niching step (niche counts, cleared organisms or replaced offspring)"""
+        return dict(self.last_statistics)
\ No newline at end of file
@@ -0,0 +1 @@
+from .noveltysearch import BehaviorArchive, NoveltySearch
\ No newline at end of file
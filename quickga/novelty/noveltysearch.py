@@ -0,0 +1,165 @@
+import math
+import random
+from quickga.kdtree import KDTree
+from quickga.selections import select_with_scores
+
+class BehaviorArchive:
+    """A bounded archive of behavior descriptors held in a KDTree
+
+    Once the archive is full each new descriptor replaces either the oldest descriptor or a random one
+    """
+
+    def __init__(self, capacity: int=10000, replacement: str='oldest', leaf_size: int=16):
+        """
+        Args:
+            capacity: int
+                The maximum number of descriptors kept
+            replacement: str
+                One of ['oldest', 'random'], which descriptor a new one replaces once the archive is full
+            leaf_size: int
+                The leaf size of the KDTree
+        """
+        if replacement not in ['oldest', 'random']:
+            raise Exception("Invalid archive replacement type provided")
+
+        self.capacity = capacity
+        self.replacement = replacement
+        self.tree = KDTree(leaf_size=leaf_size)
+        # the index of the oldest descriptor once the archive is full
+        self.oldest = 0
+
+    def __len__(self) -> int:
+        return len(self.tree)
+
+    def add(self, behavior: list):
+        if len(self.tree) < self.capacity:
+            self.tree.insert(behavior)
+        elif self.replacement == 'oldest':
+            self.tree.replace(self.oldest, behavior)
+            self.oldest = (self.oldest+1) % self.capacity
+        else:
+            self.tree.replace(random.randrange(self.capacity), behavior)
+
+    def nearest(self, behavior: list, k: int) -> list:
+        """Returns the distances to the k nearest archived descriptors"""
+        if not len(self.tree):
+            return []
+        return [distance for index, distance in self.tree.nearest(behavior, k)]
+
+
+class NoveltySearch:
+    """A class to select parents by how novel their behavior is instead of (or as well as) their fitness
+
+    Organisms must implement the 'behavior' method, which returns a list of numbers describing what the organism does
+    (for example the final position of a robot) rather than how well it does it
+
+    The novelty of an organism is the mean euclidean distance to the k nearest behaviors among the rest of the
+    population and the archive of past behaviors. Only the fitness seen by the selection function is replaced,
+    so any selection function can be used and the 'fitness' of each organism (and every statistic) is left unchanged
+
+    Currently implemented archive insertion types include
+        - threshold: behaviors more novel than a threshold are archived, the threshold rises when too many are added
+            in a generation and falls when none are
+        - random: each behavior is archived with a chance of 'insertion_rate'
+        - most-novel: the 'insertion_rate' most novel percent of each generation is archived
+    """
+
+    def __init__(self, k: int=15, archive_size: int=10000, insertion_type: str='threshold', insertion_rate: float=0.02,
+            threshold: float=None, fitness_weight: float=0, replacement: str='oldest'):
+        """
+        Args:
+            k: int
+                How many neighbors the novelty is measured against
+            archive_size: int
+                The maximum number of behaviors in the archive
+            insertion_type: str
+                One of ['threshold', 'random', 'most-novel']
+            insertion_rate: [0,1]
+                The chance (random), percent of the population (most-novel) or target percent of the population
+                (threshold) archived each generation
+            threshold: float
+                The initial novelty threshold, the median novelty of the first generation if not provided
+            fitness_weight: [0,1]
+                The weight of fitness in the selection score, both novelty and fitness are scaled to [0,1] first
+            replacement: str
+                One of ['oldest', 'random'], which behavior a new one replaces once the archive is full
+        """
+        if insertion_type not in ['threshold', 'random', 'most-novel']:
+            raise Exception("Invalid archive insertion type provided")
+
+        self.k = k
+        self.insertion_type = insertion_type
+        self.insertion_rate = insertion_rate
+        self.threshold = threshold
+        self.fitness_weight = fitness_weight
+        self.archive = BehaviorArchive(archive_size, replacement)
+        self.population_tree = None
+        self.last_statistics = {}
+
+    def novelty(self, behavior: list, exclude: int=None) -> float:
+        """Returns the mean distance from a behavior to its k nearest neighbors in the last scored population and the archive"""
+        distances = [distance for index, distance in self.population_tree.nearest(behavior, self.k, exclude)]
+        distances = sorted(distances+self.archive.nearest(behavior, self.k))[:self.k]
+        return sum(distances)/len(distances) if distances else 0
+
+    def update(self, population: list):
+        """Scores the novelty of an evaluated generation and adds some of its behaviors to the archive"""
+        behaviors = [organism.behavior() for organism in population]
+        self.population_tree = KDTree(behaviors)
+        for i, organism in enumerate(population):
+            organism.novelty = self.novelty(behaviors[i], exclude=i)
+
+        novelties = [organism.novelty for organism in population]
+        target = self.insertion_rate*len(population)
+        if self.insertion_type == 'threshold':
+            if self.threshold is None:
+                self.threshold = sorted(novelties)[len(novelties)//2]
+            added = [i for i in range(len(population)) if novelties[i] > self.threshold]
+            if len(added) > target:
+                self.threshold *= 1.2
+            elif not added:
+                self.threshold *= 0.95
+        elif self.insertion_type == 'random':
+            added = [i for i in range(len(population)) if random.random() < self.insertion_rate]
+        else:
+            added = sorted(range(len(population)), key=lambda i: novelties[i], reverse=True)[:math.ceil(target)]
+
+        for i in added:
+            self.archive.add(behaviors[i])
+
+        self.last_statistics = {
+            'archive_size': len(self.archive),
+            'archived': len(added),
+            'threshold': self.threshold,
+            'mean_novelty': sum(novelties)/len(novelties),
+            'max_novelty': max(novelties)
+        }
+
+    @staticmethod
+    def scale(values: list) -> list:
+        """Scales values to [0,1]"""
+        low = min(values)
+        high = max(values)
+        return [(value-low)/(high-low) if high > low else 0 for value in values]
+
+    def selection_scores(self, parent_pool: list) -> list:
+        """Returns the score of each organism as seen by the selection function"""
+        # organisms which were not in the last scored population (such as migrated organisms) are scored now
+        for organism in parent_pool:
+            if organism.novelty is None:
+                organism.novelty = self.novelty(organism.behavior())
+
+        novelties = [organism.novelty for organism in parent_pool]
+        if not self.fitness_weight:
+            return novelties
+
+        fitnesses = self.scale([organism.fitness for organism in parent_pool])
+        return [(1-self.fitness_weight)*novelty+self.fitness_weight*fitness for novelty, fitness in zip(self.scale(novelties), fitnesses)]
+
+    def select(self, selection_function, parent_pool: list, num_offspring: int) -> list:
+        """Calls the selection function with the parents selection scores in place of their fitnesses"""
+        return select_with_scores(selection_function, parent_pool, num_offspring, self.selection_scores(parent_pool))
+
+    def statistics(self) -> dict:
+        """Returns the archive size, how many behaviors were archived, the threshold and the novelty of the last generation"""
+        return dict(self.last_statistics)
\ No newline at end of file
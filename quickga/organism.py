@@ -1,7 +1,10 @@
+import functools
 import math
 import random
 
-from quickga import BaseTrait, ProportionalSelection
+from quickga import (AdaptiveControl, BaseEngine, BaseLocalSearch, BaseSurrogate, BaseTrait, EvaluationExecutor, MultiFidelityScheduler,
+    GenomeIndex, GenomeKey, LineageRecorder, Niching, NoveltySearch, ParallelBreeder, ProblemContext,
+    ProportionalSelection, SelectionFunctionFactory)
 
 class Organism:
     """A class to represent an Organism with Traits capable of simulated evolution
@@ -12,17 +15,60 @@ class Organism:
     All derived classes must implement the 'evaluate' method
     This method recieves no arguments and returns a numeric value representing a fitness score (higher value means more fit)
 
+    Derived classes may overwrite the 'build_context' classmethod to create expensive read-only data used by 'evaluate'
+    (such as a distance matrix), which is built once and shared with every worker process through 'problem_context'
+
     Attributes:
         fitness:
             A number assigned to the organism representing its fitness levelt (higher means more fit)
+        fitness_estimated:
+            True if the fitness was predicted by a surrogate model instead of calculated by 'evaluate'
         parents:
             The Organisms which were bred to produce this Organism
+        adaptive_control:
+            The AdaptiveControl used when breeding this Organism (set by 'evolve')
+        mutation_rates:
+            The self-adapted mutation rate of each trait (only used with an AdaptiveControl)
+        operators:
+            The (crossover_type, mutation_type) chosen for each trait by an AdaptiveControl when this Organism was bred
+        mutated:
+            True if any trait value was mutated when this Organism was bred
+        lineage_index:
+            The (generation, index) this Organism was last recorded at by a LineageRecorder
+        novelty:
+            The novelty of this Organism's behavior, scored by a NoveltySearch
+        fidelity:
+            The fidelity 'fitness' was evaluated at by a MultiFidelityScheduler (None if evaluated normally)
+        feasible:
+            False if the Organism was found infeasible (and could not be repaired) by 'evolve', in which case it is not evaluated
+        context_storage:
+            The storage type of the ProblemContext created from 'build_context', one of ['shared-memory', 'mmap']
     """
 
+    context_storage = 'shared-memory'
+    # set while 'with_values' runs a constructor, so 'add_trait' does not generate values that are about to be replaced
+    _skips_initial_values = False
+
     def __init__(self):
         self._traits = {}
         self.fitness = 0
+        self.fitness_estimated = False
         self.parents = []
+        self.adaptive_control = None
+        self.mutation_rates = {}
+        self.operators = {}
+        self._genome_key = None
+        self.mutated = False
+        self.lineage_index = None
+        self.novelty = None
+        self.feasible = True
+        self.fidelity = None
+        self.selection_score = None
+
+    @property
+    def selection_fitness(self) -> float:
+        """The value parents are selected by, the selection score while niching or novelty search provide one"""
+        return self.fitness if self.selection_score is None else self.selection_score
 
     def __add__(self, other) -> 'Organism':
         """Creates a new object of the same class whose traits are generated from the parents"""
@@ -51,11 +97,58 @@ class Organism:
             # we need the trait object because it contains the logic for creating a new value from the parents values
             trait_obj = self._traits[trait_name]
             # sets the child objects actual instance attribute to the value derived from both the parents
-            child_vars[trait_name] = trait_obj.from_parent_values(parent1_vars[trait_name], parent2_vars[trait_name])
+            if self.adaptive_control:
+                child_vars[trait_name] = self.adaptive_control.from_parent_values(trait_name, trait_obj, self, other, child)
+            else:
+                child_vars[trait_name] = trait_obj.from_parent_values(parent1_vars[trait_name], parent2_vars[trait_name])
 
+        child.mutated = any(trait_obj.mutated for trait_obj in self._traits.values())
         child.parents = [self, other]
+        if self.adaptive_control:
+            child.adaptive_control = self.adaptive_control
+            # cached so operators can be credited by the childs improvement over its best parent
+            # (niching and novelty search only replace the 'selection_fitness', so this is always the true fitness)
+            child.parent_fitness = max(self.fitness, other.fitness)
         return child
 
+    def clone(self) -> 'Organism':
+        """Creates a copy of the Organism which shares its trait values
+
+        Cloning is free for immutable values (numbers, characters and the Genomes of copy_on_write sequence traits)
+        Mutable values such as lists are shared too, so they must not be changed in place afterwards
+
+        Returns:
+            An Organism of the same class with the same traits and fitness
+        """
+        clone = self.__class__.__new__(self.__class__)
+        vars(clone).update(vars(self))
+        clone.mutation_rates = dict(self.mutation_rates)
+        clone.operators = dict(self.operators)
+        clone.parents = [self]
+        return clone
+
+    def with_values(self, values: dict) -> 'Organism':
+        """Creates a new Organism of the same class with the given trait values, sharing this Organism's trait objects
+
+        The Organism is created through its class, so any other attributes set by the derived classes constructor
+        are its own rather than shared with this Organism. No initial trait values are generated, so the constructor
+        must not read its trait values
+
+        Args:
+            values: dict
+                A Dict of form {trait_name: value} with a value for every trait
+
+        Returns:
+            An unevaluated Organism with the given trait values
+        """
+        organism = self.__class__.__new__(self.__class__)
+        organism._skips_initial_values = True
+        organism.__init__()
+        del organism._skips_initial_values
+        organism._traits = dict(self._traits)
+        vars(organism).update(values)
+        return organism
+
     def add_trait(self, variable_name: str, trait: BaseTrait):
         """Adds a new trait capable of optimization to the organism
         
@@ -75,7 +168,8 @@ class Organism:
                 An object of a class derived from BaseTrait containing the logic for how the trait should be passed down
         """
         self._traits[variable_name] = trait
-        vars(self)[variable_name] = trait.inital_value()
+        if not self._skips_initial_values:
+            vars(self)[variable_name] = trait.inital_value()
 
     def set_traits(self, traits: dict):
         """Sets all of the traits capable of optimization in the organism
@@ -97,6 +191,98 @@ class Organism:
         for trait_name, trait in traits.items:
             self.add_trait(trait_name, trait)
 
+    def encode(self) -> list:
+        """Converts the values of all the traits into a single list of numbers
+
+        Returns:
+            A list of floats made by concatenating the encoding of each trait value
+        """
+        organism_vars = vars(self)
+        return [x for trait_name, trait in self._traits.items() for x in trait.encode(organism_vars[trait_name])]
+
+    def bounds(self) -> list:
+        """Returns the (min, max) range of each number returned by 'encode', used by the continuous optimization engines"""
+        return [bound for trait in self._traits.values() for bound in trait.bounds()]
+
+    def decode(self, vector: list):
+        """Sets the values of all the traits from a list of numbers, the inverse of 'encode'
+
+        Args:
+            vector: list
+                A list of floats the same length as 'bounds'
+        """
+        organism_vars = vars(self)
+        start = 0
+        for trait_name, trait in self._traits.items():
+            size = len(trait.bounds())
+            organism_vars[trait_name] = trait.decode(vector[start:start+size])
+            start += size
+        self.clear_genome_key()
+
+    def is_feasible(self) -> bool:
+        """Checks the constraints of every trait, may be overwritten to check constraints between traits
+
+        Called by 'evolve' before evaluation, so it should be much cheaper than 'evaluate'
+        """
+        organism_vars = vars(self)
+        return all(trait.is_feasible(organism_vars[trait_name]) for trait_name, trait in self._traits.items())
+
+    def repair(self):
+        """Repairs the value of every trait which does not satisfy its constraints, may be overwritten"""
+        organism_vars = vars(self)
+        for trait_name, trait in self._traits.items():
+            if not trait.is_feasible(organism_vars[trait_name]):
+                organism_vars[trait_name] = trait.repair(organism_vars[trait_name])
+        self.clear_genome_key()
+
+    def distance(self, other: 'Organism') -> float:
+        """Measures how genetically different two Organisms are, the sum of each traits 'distance'"""
+        organism_vars = vars(self)
+        other_vars = vars(other)
+        return sum([trait.distance(organism_vars[trait_name], other_vars[trait_name]) for trait_name, trait in self._traits.items()])
+
+    def genome_key(self) -> GenomeKey:
+        """Returns a hashable snapshot of the trait values, two Organisms with equal keys are genetically identical
+
+        The key is cached after it is first created, so 'clear_genome_key' must be called if trait values are changed in place
+        """
+        if self._genome_key is None:
+            organism_vars = vars(self)
+            self._genome_key = GenomeKey(GenomeKey.freeze(organism_vars[trait_name]) for trait_name in self._traits)
+        return self._genome_key
+
+    def clear_genome_key(self):
+        """Discards the cached genome key, must be called after trait values are changed in place"""
+        self._genome_key = None
+
+    @classmethod
+    def build_context(cls) -> dict:
+        """Creates the read-only problem data shared by every Organism of the class, may be overwritten by derived classes
+
+        Returns:
+            A Dict of form {name: values} where values is a sequence of numbers or a sequence of rows of numbers
+        """
+        return {}
+
+    @classmethod
+    def uses_problem_context(cls) -> bool:
+        """Returns True if the class has overwritten 'build_context'"""
+        return cls.build_context.__func__ is not Organism.build_context.__func__
+
+    @classmethod
+    def problem_context(cls) -> ProblemContext:
+        """Returns the ProblemContext of the class, which is built from 'build_context' the first time it is used
+
+        Example:
+            distances = self.problem_context()['distances']
+            distances[i, j]
+        """
+        context = cls.__dict__.get('_problem_context')
+        if context is None:
+            context = ProblemContext(cls.build_context(), cls.context_storage)
+            cls._problem_context = context
+        return context
+
     @staticmethod
     def __generate_population_info(population: list) -> dict:
         """Creates a dictionary of stats and info for a population"""
@@ -111,10 +297,106 @@ class Organism:
             'min_fitness': least_fit.fitness
         }
 
+    @staticmethod
+    def __callback_with_sinks(generational_callback, sinks: list):
+        """Creates a callback which writes the info to every sink before calling the generational callback"""
+        def callback(info):
+            for sink in sinks:
+                sink.write(info)
+            if generational_callback:
+                generational_callback(info)
+        return callback
+
+    @staticmethod
+    def __close_sinks(sinks: list):
+        for sink in sinks or []:
+            sink.close()
+
+    @staticmethod
+    def __evaluate_organisms(organisms: list, executor: EvaluationExecutor=None):
+        """Sets the fitness of each organism, using the executor if one is provided"""
+        if executor:
+            fitnesses = executor.evaluate(organisms)
+        else:
+            fitnesses = [organism.evaluate() for organism in organisms]
+        for organism, fitness in zip(organisms, fitnesses):
+            organism.fitness = fitness
+            organism.fitness_estimated = False
+
+    @staticmethod
+    def __check_feasibility(organisms: list, feasibility: str, infeasible_fitness: float, counts: dict) -> list:
+        """Repairs (if enabled) the infeasible organisms, and gives those which are still infeasible the infeasible fitness
+
+        Returns:
+            A list of the feasible organisms
+        """
+        feasible = []
+        for organism in organisms:
+            if not organism.is_feasible():
+                counts['infeasible'] += 1
+                if feasibility == 'repair':
+                    organism.repair()
+                if feasibility != 'repair' or not organism.is_feasible():
+                    organism.feasible = False
+                    organism.fitness = infeasible_fitness
+                    organism.fitness_estimated = False
+                    counts['penalized'] += 1
+                    continue
+                counts['repaired'] += 1
+            feasible.append(organism)
+        return feasible
+
+    @classmethod
+    def __remove_duplicates(cls, offspring: list, genome_index: GenomeIndex, duplicate_handling: str, breed_offspring,
+            adaptive_control: AdaptiveControl, max_attempts: int=5) -> tuple:
+        """Removes offspring whose genome is already in the genome index (adding the others to it)
+
+        Args:
+            offspring: list
+                The newly bred organisms
+            genome_index: GenomeIndex
+                The index of genomes already in the next generation
+            duplicate_handling: str
+                'reject' breeds new offspring in place of duplicates, 'replace' creates random organisms
+            breed_offspring:
+                A function which takes a number and returns that many new offspring
+            max_attempts: int
+                How many times duplicates are bred again before the remaining ones are replaced by random organisms
+
+        Returns:
+            A tuple of the unique offspring and the number of duplicates removed
+        """
+        unique_offspring = [organism for organism in offspring if genome_index.add(organism)]
+        num_duplicates = len(offspring) - len(unique_offspring)
+        num_missing = num_duplicates
+
+        attempts = 0
+        while num_missing and duplicate_handling == 'reject' and attempts < max_attempts:
+            rebred = breed_offspring(num_missing)
+            unique_rebred = [organism for organism in rebred if genome_index.add(organism)]
+            unique_offspring += unique_rebred
+            num_duplicates += len(rebred) - len(unique_rebred)
+            num_missing -= len(unique_rebred)
+            attempts += 1
+
+        if num_missing:
+            # a random organism is almost certainly unique, so it is not checked against the index
+            replacements = [cls() for j in range(num_missing)]
+            for organism in replacements:
+                organism.adaptive_control = adaptive_control
+                genome_index.add(organism)
+            unique_offspring += replacements
+
+        return unique_offspring, num_duplicates
+
     @classmethod
     def evolve(cls, population_size: int, generations: int, selection_function=ProportionalSelection(),
             crossover_rate: float=0.85, elite_rate: float=0, incel_rate: float=0, migration_rate: float=0,
-            generational_callback=None) -> dict:
+            generational_callback=None, surrogate: BaseSurrogate=None, adaptive_control: AdaptiveControl=None,
+            duplicate_handling: str=None, local_search: BaseLocalSearch=None, engine: BaseEngine=None,
+            executor: EvaluationExecutor=None, sinks: list=None, lineage: LineageRecorder=None, niching: Niching=None,
+            novelty_search: NoveltySearch=None, breeder: ParallelBreeder=None, feasibility: str=None,
+            infeasible_fitness: float=0, fidelity_scheduler: MultiFidelityScheduler=None) -> dict:
         """The magic method responsible for optimizing the traits using a Genetic Algorithm
         
         Args:
@@ -124,6 +406,7 @@ class Organism:
                 How many generations of evolution should take place
             selection_function:
                 A function discribing the way of selecting and breeding parents from the population
+                (parents should be compared by 'selection_fitness', so niching and novelty search can replace their fitness)
             crossover_rate: [0,1]
                 The chance that two parents will crossover and add an offspring to the next generation
                 (as opposed to being directly carried down to the next generation)
@@ -133,66 +416,275 @@ class Organism:
                 The lowest X percent of the population that will be removed from the parent pool
             migration_rate: [0,]
                 Adds X percent of the population as random organisms to the parent pool
+            surrogate:
+                An optional BaseSurrogate used to pre-screen offspring so only the most promising are evaluated
+                Once the surrogate is trained, organisms carried down with a known fitness are not re-evaluated
+            adaptive_control:
+                An optional AdaptiveControl which adapts mutation rates and operators as the population evolves
+                Its statistics are added to each generations info under the key 'adaptation'
+            duplicate_handling: str
+                One of [None, 'reject', 'replace']
+                If set, organisms carried down without crossover and offspring whose genome is already in the next
+                generation are removed before evaluation. Removed offspring are either bred again ('reject')
+                or replaced by random organisms ('replace'). The count is added to the info under the key 'duplicates'
+            local_search:
+                An optional BaseLocalSearch (or list of them) which improves some organisms after each generation is evaluated
+                The number of improved organisms is added to the info under the key 'locally_improved'
+            engine:
+                An optional BaseEngine (such as DifferentialEvolution or CMAES) which optimizes the traits instead of the GA
+                Only population_size, generations and generational_callback are used by engines
+            executor:
+                An optional EvaluationExecutor which evaluates organisms in parallel with timeouts, retries and penalties
+                Its workers are stopped when the run ends, even if it fails
+                The counts of failed, timed out, retried, speculatively restarted and penalized evaluations
+                are added to the info under the key 'executor'
+            sinks:
+                An optional list of BaseSinks (such as JSONLSink, CSVSink or NpyChunkSink) each generations info is written to
+                The sinks are closed (and everything buffered is written) when evolution finishes
+            lineage:
+                An optional LineageRecorder which records the parents of every organism as compact index arrays
+                Unless the recorder keeps parents, organisms no longer reference their parents once recorded
+            niching:
+                An optional Niching (fitness sharing, clearing or crowding) which preserves diversity on multimodal problems
+                Its statistics are added to each generations info under the key 'niching'
+            novelty_search:
+                An optional NoveltySearch which selects parents by the novelty of their 'behavior' instead of their fitness
+                Its statistics are added to each generations info under the key 'novelty'
+            breeder:
+                An optional ParallelBreeder which breeds the offspring selected by the selection function in worker processes
+                Cannot be used with an AdaptiveControl
+            feasibility: str
+                One of [None, 'repair', 'penalize']
+                If set, new organisms are checked with 'is_feasible' before evaluation. Infeasible organisms are either
+                repaired ('repair') or not, and those still infeasible are given the infeasible fitness without being
+                evaluated. The infeasible, repaired and penalized counts are added to the info under the key 'feasibility'
+            infeasible_fitness:
+                The fitness given to infeasible organisms
+            fidelity_scheduler:
+                An optional MultiFidelityScheduler which evaluates new organisms with successive halving over increasing
+                fidelities ('evaluate' must accept a 'fidelity' argument). Organisms carried down keep their fitness,
+                except elites below full fidelity which are evaluated again at full fidelity
+                The evaluations at each fidelity and their cost are added to the info under the key 'fidelity'
         """
+        # the problem context is built before any worker is started, so every worker shares it instead of building its own
+        if cls.uses_problem_context():
+            cls.problem_context()
+
+        if sinks:
+            generational_callback = cls.__callback_with_sinks(generational_callback, sinks)
+
+        if engine:
+            try:
+                return engine.run(cls, population_size, generations, cls.__generate_population_info, generational_callback)
+            finally:
+                cls.__close_sinks(sinks)
+
+        if duplicate_handling not in [None, 'reject', 'replace']:
+            raise Exception("Invalid duplicate handling type provided")
+        # selection functions created from a SelectionFunctionFactory may keep state between generations (such as a temperature)
+        selector = getattr(selection_function, '__self__', None)
+        if isinstance(selector, SelectionFunctionFactory):
+            selector.start()
+        if feasibility not in [None, 'repair', 'penalize']:
+            raise Exception("Invalid feasibility type provided")
+        if breeder and adaptive_control:
+            raise Exception("Parallel breeding does not support AdaptiveControl")
+
         # the current collection of organisms
         population = []
         # data regarding each generation
         evolution_info = []
 
-        for i in range(generations):
-            # if the population is empty, populate it!
-            if not population:
-                population = [cls() for j in range(population_size)]
-            else:
-                # sort the population from highest to lowest fitness
-                population.sort(key=lambda x: x.fitness, reverse=True)
-                # the first 'elite_rate' percent of the list are elites (carried down to next generation)
-                elites_end_index = math.floor(elite_rate*len(population))
-                # the last 'incel_rate' percent of the list are incels (removed from the breeding pool lol)
-                incel_start_index = math.floor((1-incel_rate)*len(population))
-                # between the elites and the incels have a random chance of being carried down without crossover (dependent on crossover_rate)
-                # this mask is false for each organism that does not undergo crossover
-                crossover_mask = [random.random() < crossover_rate for i in range(incel_start_index-elites_end_index)]
-                # migrated organisms are random organisms added to the parent pool to create diversity
-                num_migrated_organisms = math.floor(migration_rate*len(population))
-
-                elites = population[:elites_end_index]
-                not_crossed_over = [population[i+elites_end_index] for i in range(incel_start_index-elites_end_index) if not crossover_mask[i]]
-                migrated = [cls() for j in range(num_migrated_organisms)]
-                # we need to evaluate the fitness for the migrated organisms so that they are properly chosen by selection_functions
-                for organism in migrated:
-                    organism.fitness = organism.evaluate()
-                
-                # elites and others chosen by crossover_rate are carried down directly to next generation
-                new_population = elites + not_crossed_over
-
-                # fill the rest of the population with new offspring
-                parent_pool = population[:incel_start_index] + migrated
-                num_offspring = len(population) - len(new_population)
-                offspring = selection_function(parent_pool, num_offspring)
-
-                new_population += offspring
-
-                population = new_population
-
-            # have each organsim cache it's fitness score to avoid inefficient redundant calls
-            for organism in population:
-                organism.fitness = organism.evaluate()
-
-            info = cls.__generate_population_info(population)
-
-            evolution_info.append(info)
-            if generational_callback:
-                generational_callback(info)
-        
+        try:
+            for i in range(generations):
+                # the number of times 'evaluate' was called this generation
+                num_evaluations = 0
+                if executor:
+                    executor.reset_statistics()
+                if fidelity_scheduler:
+                    fidelity_scheduler.reset_statistics()
+                num_duplicates = 0
+                feasibility_counts = {'infeasible': 0, 'repaired': 0, 'penalized': 0}
+                # if the population is empty, populate it!
+                if not population:
+                    population = [cls() for j in range(population_size)]
+                    for organism in population:
+                        organism.adaptive_control = adaptive_control
+                    if feasibility:
+                        cls.__check_feasibility(population, feasibility, infeasible_fitness, feasibility_counts)
+                    elites = []
+                    not_crossed_over = []
+                    carried_over = []
+                    offspring = population
+                else:
+                    # sort the population from highest to lowest fitness
+                    population.sort(key=lambda x: x.fitness, reverse=True)
+                    # the first 'elite_rate' percent of the list are elites (carried down to next generation)
+                    elites_end_index = math.floor(elite_rate*len(population))
+                    # the last 'incel_rate' percent of the list are incels (removed from the breeding pool lol)
+                    incel_start_index = math.floor((1-incel_rate)*len(population))
+                    # between the elites and the incels have a random chance of being carried down without crossover (dependent on crossover_rate)
+                    # this mask is false for each organism that does not undergo crossover
+                    crossover_mask = [random.random() < crossover_rate for i in range(incel_start_index-elites_end_index)]
+                    # migrated organisms are random organisms added to the parent pool to create diversity
+                    num_migrated_organisms = math.floor(migration_rate*len(population))
+
+                    elites = population[:elites_end_index]
+                    not_crossed_over = [population[i+elites_end_index] for i in range(incel_start_index-elites_end_index) if not crossover_mask[i]]
+                    migrated = [cls() for j in range(num_migrated_organisms)]
+                    for organism in migrated:
+                        organism.adaptive_control = adaptive_control
+                    # we need to evaluate the fitness for the migrated organisms so that they are properly chosen by selection_functions
+                    evaluated_migrated = migrated
+                    if feasibility:
+                        evaluated_migrated = cls.__check_feasibility(migrated, feasibility, infeasible_fitness, feasibility_counts)
+                    if fidelity_scheduler:
+                        fidelity_scheduler.evaluate(evaluated_migrated, executor=executor)
+                    else:
+                        cls.__evaluate_organisms(evaluated_migrated, executor)
+                        num_evaluations += len(evaluated_migrated)
+                    if surrogate:
+                        surrogate.record(evaluated_migrated)
+
+                    if duplicate_handling:
+                        # organisms carried down without crossover make room for offspring if they are clones
+                        genome_index = GenomeIndex(elites)
+                        not_crossed_over = [organism for organism in not_crossed_over if genome_index.add(organism)]
+
+                    # elites and others chosen by crossover_rate are carried down directly to next generation
+                    carried_over = elites + not_crossed_over
+                    new_population = list(carried_over)
+
+                    # fill the rest of the population with new offspring
+                    parent_pool = population[:incel_start_index] + migrated
+                    num_offspring = len(population) - len(new_population)
+                    # niching and novelty search wrap the selection function, niching sees the novelty scores if both are used
+                    select = functools.partial(breeder.breed, selection_function) if breeder else selection_function
+                    if niching:
+                        select = functools.partial(niching.select, select)
+                    if novelty_search:
+                        select = functools.partial(novelty_search.select, select)
+                    select_offspring = lambda n: select(parent_pool, n)
+                    offspring = select_offspring(num_offspring)
+
+                    if duplicate_handling:
+                        offspring, num_duplicates = cls.__remove_duplicates(offspring, genome_index, duplicate_handling,
+                            select_offspring, adaptive_control)
+
+                    if isinstance(selector, SelectionFunctionFactory):
+                        selector.step()
+
+                    if feasibility:
+                        cls.__check_feasibility(offspring, feasibility, infeasible_fitness, feasibility_counts)
+
+                    new_population += offspring
+
+                    population = new_population
+
+                if surrogate and surrogate.is_fitted:
+                    # carried down organisms keep their fitness unless it was only an estimate
+                    needs_evaluation = [organism for organism in carried_over if organism.fitness_estimated]
+                    needs_evaluation += surrogate.screen([organism for organism in offspring if organism.feasible])
+                else:
+                    needs_evaluation = population
+
+                if feasibility:
+                    # infeasible organisms already have the infeasible fitness
+                    needs_evaluation = [organism for organism in needs_evaluation if organism.feasible]
+
+                if fidelity_scheduler:
+                    # carried down organisms keep the fitness from the highest fidelity they were evaluated at
+                    carried_over_ids = {id(organism) for organism in carried_over}
+                    needs_evaluation = [organism for organism in needs_evaluation
+                        if id(organism) not in carried_over_ids or organism.fitness_estimated]
+                    needs_evaluation = fidelity_scheduler.evaluate(needs_evaluation, elites, executor)
+                    num_evaluations += fidelity_scheduler.num_evaluations()
+                else:
+                    # have each organsim cache it's fitness score to avoid inefficient redundant calls
+                    cls.__evaluate_organisms(needs_evaluation, executor)
+                    num_evaluations += len(needs_evaluation)
+
+                if surrogate:
+                    surrogate.record(needs_evaluation)
+
+                if niching and niching.mode == 'crowding' and i > 0:
+                    population, survivors = niching.crowd(population, offspring)
+                    # parents which beat their offspring are recorded as carried down
+                    not_crossed_over = not_crossed_over + survivors
+
+                if local_search:
+                    num_improved = 0
+                    # candidates are evaluated at the fidelity the population is compared at
+                    search_fidelity = fidelity_scheduler.fidelities[-1] if fidelity_scheduler else None
+                    for search in (local_search if isinstance(local_search, list) else [local_search]):
+                        for organism in search.select(population):
+                            improved, search_evaluations = search.apply(organism, feasibility, executor, search_fidelity)
+                            num_improved += improved
+                            num_evaluations += search_evaluations
+                            if improved and surrogate:
+                                surrogate.record([organism])
+
+                if surrogate:
+                    surrogate.update()
+
+                if novelty_search:
+                    novelty_search.update(population)
+
+                if lineage:
+                    lineage.record(population, elites, not_crossed_over)
+
+                info = cls.__generate_population_info(population)
+                info['evaluations'] = num_evaluations
+                if duplicate_handling:
+                    info['duplicates'] = num_duplicates
+                if local_search:
+                    info['locally_improved'] = num_improved
+                if executor:
+                    info['executor'] = executor.statistics()
+                if niching:
+                    info['niching'] = niching.statistics()
+                if novelty_search:
+                    info['novelty'] = novelty_search.statistics()
+                if feasibility:
+                    info['feasibility'] = feasibility_counts
+                if fidelity_scheduler:
+                    info['fidelity'] = fidelity_scheduler.statistics()
+                if adaptive_control:
+                    adaptive_control.credit(offspring)
+                    info['adaptation'] = adaptive_control.statistics(population)
+
+                evolution_info.append(info)
+                if generational_callback:
+                    generational_callback(info)
+        finally:
+            # the executor's workers are stopped even if the run fails (it starts new ones if it is used again)
+            if executor:
+                executor.close()
+            # buffered generations are written even if the run fails
+            cls.__close_sinks(sinks)
+
         return evolution_info
         
 
+    def behavior(self) -> list:
+        """Describes what the Organism does as a list of numbers, used by NoveltySearch
+
+        MUST BE OVERWRITTEN BY DERIVED CLASSES USED WITH NOVELTY SEARCH
+
+        Returns:
+            A list of numbers (the same length for every Organism) describing the Organisms behavior
+        """
+        raise Exception(f"The Class '{self.__class__.__name__}' has not implemented 'behavior' method")
+
     def evaluate(self) -> float:
         """The function which determines the fitness of each Organism
 
         THIS METHOD MUST BE OVERWRITTEN BY ALL DERIVED CLASSES
 
+        Derived classes used with a MultiFidelityScheduler instead accept a 'fidelity' argument
+        (for example the fraction of the full number of simulation samples to use):
+            def evaluate(self, fidelity: float=1) -> float:
+
         Args:
             None
 
@@ -0,0 +1,209 @@
+import array
+import atexit
+import math
+import mmap
+import os
+import tempfile
+from multiprocessing import shared_memory
+
+def install_problem_contexts(contexts: list):
+    """Gives the Organism classes of a worker process the problem contexts created by the main process
+
+    Args:
+        contexts: list
+            A list of (organism class, ProblemContext) tuples
+    """
+    for organism_class, context in contexts:
+        # forked workers already have the context of the main process
+        if '_problem_context' not in organism_class.__dict__:
+            organism_class._problem_context = context
+
+
+class SharedArray:
+    """A read-only 1D or 2D array of numbers backed by shared memory or a memory-mapped file
+
+    Indexing reads straight from the shared buffer, so no copy of the data is made by any process
+
+    Example:
+        distances[i, j]
+        distances.row(i)[j]
+        distances.values[i*distances.shape[1]+j]
+    """
+
+    def __init__(self, values: memoryview, shape: tuple):
+        """
+        Args:
+            values: memoryview
+                A flat read-only memoryview of the numbers (cast to the numbers type)
+            shape: tuple
+                (length,) or (rows, columns)
+        """
+        self.values = values
+        self.shape = shape
+        self.columns = shape[1] if len(shape) == 2 else 1
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    def __getitem__(self, index):
+        if isinstance(index, tuple):
+            i, j = index
+            return self.values[i*self.columns+j]
+        if len(self.shape) == 2:
+            return self.row(index)
+        return self.values[index]
+
+    def row(self, i: int) -> memoryview:
+        """Returns a row of a 2D array without copying it"""
+        return self.values[i*self.columns:(i+1)*self.columns]
+
+    def tolist(self) -> list:
+        if len(self.shape) == 2:
+            return [self.row(i).tolist() for i in range(self.shape[0])]
+        return self.values.tolist()
+
+
+class ProblemContext:
+    """A class to hold expensive read-only data (such as distance matrices or lookup indices) shared by every process
+
+    The data is stored once in a single shared memory block or memory-mapped file. Pickling a ProblemContext only sends
+    the location of the data, so worker processes attach to the same memory instead of building or copying their own
+
+    Values may be sequences of numbers (1D arrays) or sequences of equal length sequences of numbers (2D arrays)
+    Arrays containing only integers are stored as 64 bit integers, others as 64 bit floats
+
+    Organism subclasses create their context by overwriting Organism.build_context
+    """
+
+    def __init__(self, data: dict, storage: str='shared-memory'):
+        """
+        Args:
+            data: dict
+                A Dict of form {name: values}
+            storage: str
+                One of ['shared-memory', 'mmap']
+        """
+        if storage not in ['shared-memory', 'mmap']:
+            raise Exception("Invalid problem context storage type provided")
+
+        # layout is a Dict of form {name: (typecode, offset, shape)}
+        layout = {}
+        arrays = {}
+        size = 0
+        for name, values in data.items():
+            values = list(values)
+            if values and not isinstance(values[0], (int, float)):
+                shape = (len(values), len(values[0]) if values else 0)
+                flat = [x for row in values for x in row]
+                if any(len(row) != shape[1] for row in values):
+                    raise Exception(f"The rows of '{name}' must all be the same length")
+            else:
+                shape = (len(values),)
+                flat = values
+            typecode = 'q' if all(isinstance(x, int) for x in flat) else 'd'
+            arrays[name] = array.array(typecode, flat)
+            layout[name] = (typecode, size, shape)
+            # every array starts at a multiple of 8 bytes
+            size += math.ceil(len(flat)*arrays[name].itemsize/8)*8
+
+        self.storage = storage
+        self.layout = layout
+        self.owner = True
+        self.pid = os.getpid()
+
+        if storage == 'shared-memory':
+            self.shared_memory = shared_memory.SharedMemory(create=True, size=max(size, 1))
+            self.location = self.shared_memory.name
+            buffer = self.shared_memory.buf
+        else:
+            descriptor, self.location = tempfile.mkstemp(suffix='.quickga')
+            with os.fdopen(descriptor, 'wb') as file:
+                file.truncate(max(size, 1))
+            self.file = open(self.location, 'r+b')
+            self.mmap = mmap.mmap(self.file.fileno(), 0)
+            buffer = memoryview(self.mmap)
+
+        for name, (typecode, offset, shape) in layout.items():
+            data_bytes = arrays[name].tobytes()
+            buffer[offset:offset+len(data_bytes)] = data_bytes
+        if storage == 'mmap':
+            buffer.release()
+
+        self.create_arrays()
+        atexit.register(self.close)
+
+    @classmethod
+    def attach(cls, storage: str, location: str, layout: dict) -> 'ProblemContext':
+        """Attaches to the data of a ProblemContext created in another process"""
+        context = cls.__new__(cls)
+        context.storage = storage
+        context.location = location
+        context.layout = layout
+        context.owner = False
+        context.pid = os.getpid()
+
+        if storage == 'shared-memory':
+            # worker processes share the resource tracker of the main process, which removes the memory if it is leaked
+            context.shared_memory = shared_memory.SharedMemory(name=location)
+        else:
+            context.file = open(location, 'rb')
+            context.mmap = mmap.mmap(context.file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        context.create_arrays()
+        atexit.register(context.close)
+        return context
+
+    def __reduce__(self):
+        return (ProblemContext.attach, (self.storage, self.location, self.layout))
+
+    def __getitem__(self, name: str) -> SharedArray:
+        return self.arrays[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.arrays
+
+    def create_arrays(self):
+        buffer = self.shared_memory.buf if self.storage == 'shared-memory' else memoryview(self.mmap)
+        self.views = [buffer]
+        self.arrays = {}
+        for name, (typecode, offset, shape) in self.layout.items():
+            length = math.prod(shape)
+            cast = buffer[offset:offset+length*8].cast(typecode)
+            # the data is shared by every process, so it must not be changed through an array
+            view = cast.toreadonly()
+            self.views += [cast, view]
+            self.arrays[name] = SharedArray(view, shape)
+
+    def close(self):
+        """Detaches from the data, and removes it if this process created it"""
+        # forked worker processes inherit the object but must not remove the data of the main process
+        if self.arrays is None or os.getpid() != self.pid:
+            return
+        self.arrays = None
+        for view in reversed(self.views):
+            view.release()
+        self.views = []
+        if self.storage == 'shared-memory':
+            self.shared_memory.close()
+            if self.owner:
+                self.shared_memory.unlink()
+        else:
+            self.mmap.close()
+            self.file.close()
+            if self.owner:
+                os.remove(self.location)
+
+    @staticmethod
+    def distance_matrix(points: list, distance=math.dist) -> list:
+        """Creates the matrix of distances between every pair of points
+
+        Args:
+            points: list
+                A list of points (for example (x, y) tuples)
+            distance:
+                A function which returns the distance between two points, euclidean distance if not provided
+
+        Returns:
+            A list of rows where row i column j is the distance from point i to point j
+        """
+        return [[distance(a, b) for b in points] for a in points]
\ No newline at end of file
@@ -1,4 +1,10 @@
+from .selectionfunctionfactory import SelectionFunctionFactory
 from .proportionalselection import ProportionalSelection
 from .tournamentselection import TournamentSelection
 from .rankselection import RankSelection
-from .randomselection import RandomSelection
\ No newline at end of file
+from .randomselection import RandomSelection
+from .batchselection import BatchSelection
+from .stochasticuniversalsampling import StochasticUniversalSampling
+from .truncationselection import TruncationSelection
+from .boltzmannselection import BoltzmannSelection
+from .scoredselection import select_with_scores
\ No newline at end of file
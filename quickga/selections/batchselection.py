@@ -0,0 +1,79 @@
+import random
+from .selectionfunctionfactory import SelectionFunctionFactory
+
+class BatchSelection(SelectionFunctionFactory):
+    """A base class for selections which choose every parent of a generation in one pass over the parent pool
+
+    Derived classes implement 'select_indices', which returns the pool index of every parent needed (two per offspring).
+    The parents are shuffled and paired, and when unique parents are required a pair of matching parents swaps its
+    second parent with another pair, so the number of times each organism is chosen is kept
+    """
+
+    def select_indices(self, parent_pool: list, num_parents: int) -> list:
+        """Returns the indices of 'num_parents' parents chosen from the parent pool
+
+        MUST BE OVERWRITTEN BY DERIVED CLASSES
+        """
+        raise Exception("Must implement 'select_indices' method")
+
+    @staticmethod
+    def stochastic_universal_sampling(weights: list, num_samples: int) -> list:
+        """Chooses indices in proportion to their weights with a single spin of a wheel with evenly spaced pointers
+
+        Each index is chosen either floor or ceil of its expected number of times, in O(len(weights)+num_samples)
+
+        Args:
+            weights: list
+                The non-negative weight of each index
+            num_samples: int
+                How many indices to choose
+
+        Returns:
+            A list of the chosen indices in ascending order
+        """
+        total = sum(weights)
+        if total <= 0:
+            # every weight is 0, so every index is equally likely
+            weights = [1]*len(weights)
+            total = len(weights)
+
+        step = total/num_samples
+        pointer = random.uniform(0, step)
+        chosen = []
+        current_sum = 0
+        for i, weight in enumerate(weights):
+            current_sum += weight
+            while pointer < current_sum and len(chosen) < num_samples:
+                chosen.append(i)
+                pointer += step
+        # floating point error can leave the last pointer just past the end of the wheel
+        while len(chosen) < num_samples:
+            chosen.append(max(range(len(weights)), key=lambda i: weights[i]))
+        return chosen
+
+    def select_parent_indices(self, parent_pool: list, num_offspring: int) -> list:
+        self.validate_arguments(parent_pool, num_offspring)
+        indices = self.select_indices(parent_pool, 2*num_offspring)
+        random.shuffle(indices)
+        pairs = [[indices[2*i], indices[2*i+1]] for i in range(num_offspring)]
+
+        if self.enforces_unique_parents:
+            matches = lambda a, b: self.parents_match(parent_pool[a], parent_pool[b])
+            for pair in pairs:
+                attempts = 0
+                while matches(*pair) and attempts < self.max_genome_attempts:
+                    # swapping second parents keeps how many times each organism is a parent
+                    other = random.choice(pairs)
+                    if not matches(pair[0], other[1]) and not matches(other[0], pair[1]):
+                        pair[1], other[1] = other[1], pair[1]
+                    attempts += 1
+                if matches(*pair):
+                    candidates = [i for i in range(len(parent_pool)) if not matches(pair[0], i)]
+                    # a converged population may not contain two different genomes at all
+                    if candidates:
+                        pair[1] = random.choice(candidates)
+
+        return [tuple(pair) for pair in pairs]
+
+    def select_parent_pairs(self, parent_pool: list, num_offspring: int) -> list:
+        return [[parent_pool[a], parent_pool[b]] for a, b in self.select_parent_indices(parent_pool, num_offspring)]
\ No newline at end of file
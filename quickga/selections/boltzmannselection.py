@@ -0,0 +1,48 @@
+import math
+from .batchselection import BatchSelection
+
+class BoltzmannSelection(BatchSelection):
+    """Selection in proportion to exp(fitness/temperature) (a softmax of the fitnesses), sampled with stochastic universal sampling
+
+    A high temperature makes every organism about equally likely to breed, while a low temperature favors the most fit
+    The temperature is reset to its initial value when 'evolve' starts and multiplied by 'cooling_rate' once per generation,
+    so selection pressure rises as evolution continues. Only differences in fitness matter, so negative fitness values are allowed
+    """
+
+    def __init__(self, temperature: float=1, cooling_rate: float=0.95, min_temperature: float=0.01, unique_parents: bool=False,
+            compare_genomes: bool=False):
+        """
+        Args:
+            temperature: float
+                The initial temperature, in units of fitness
+            cooling_rate: (0,1]
+                The factor the temperature is multiplied by after each generation (1 keeps it constant)
+            min_temperature: float
+                The lowest the temperature can be cooled to
+            unique_parents: bool
+                Whether the two parents of an offspring must be different organisms
+            compare_genomes: bool
+                Whether unique parents must also have different genomes
+        """
+        if temperature <= 0 or min_temperature <= 0:
+            raise Exception("Temperature must be greater than 0")
+
+        self.initial_temperature = temperature
+        self.temperature = temperature
+        self.cooling_rate = cooling_rate
+        self.min_temperature = min_temperature
+        self.enforces_unique_parents = unique_parents
+        self.compares_genomes = compare_genomes
+
+    def start(self):
+        self.temperature = self.initial_temperature
+
+    def step(self):
+        self.temperature = max(self.temperature*self.cooling_rate, self.min_temperature)
+
+    def select_indices(self, parent_pool: list, num_parents: int) -> list:
+        fitnesses = [organism.selection_fitness for organism in parent_pool]
+        highest = max(fitnesses)
+        # subtracting the highest fitness keeps exp from overflowing
+        weights = [math.exp((fitness-highest)/self.temperature) for fitness in fitnesses]
+        return self.stochastic_universal_sampling(weights, num_parents)
\ No newline at end of file
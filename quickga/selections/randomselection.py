@@ -2,19 +2,16 @@ import random
 from .selectionfunctionfactory import SelectionFunctionFactory
 
 class RandomSelection(SelectionFunctionFactory):
-    def __init__(self, unique_parents: bool=False):
+    def __init__(self, unique_parents: bool=False, compare_genomes: bool=False):
         self.enforces_unique_parents = unique_parents
+        self.compares_genomes = compare_genomes
 
-    def selection_function(self, parent_pool: list, num_offspring: int) -> list:
+    def select_parent_pairs(self, parent_pool: list, num_offspring: int) -> list:
         self.validate_arguments(parent_pool, num_offspring)
         parent_pairs = []
         select_parent = lambda : random.choice(parent_pool)
 
         for i in range(num_offspring):
-            new_parent_group = [select_parent(), select_parent()]
-            # if we require unique parents but they are the same, keep replacing one parent until it is different
-            while self.enforces_unique_parents and new_parent_group[0] == new_parent_group[1]:
-                new_parent_group[1] = select_parent()
-            parent_pairs.append(new_parent_group)
+            parent_pairs.append(self.select_parent_pair(select_parent))
 
-        return [pair[0] + pair[1] for pair in parent_pairs]
\ No newline at end of file
+        return parent_pairs
\ No newline at end of file
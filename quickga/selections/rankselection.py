@@ -2,8 +2,9 @@ import random
 from .selectionfunctionfactory import SelectionFunctionFactory
 
 class RankSelection(SelectionFunctionFactory):
-    def __init__(self, unique_parents: bool = False):
+    def __init__(self, unique_parents: bool=False, compare_genomes: bool=False):
         self.enforces_unique_parents = unique_parents
+        self.compares_genomes = compare_genomes
 
     def select_parent_index(self, ranks: list, rank_sum: int) -> int:
         current_sum = 0
@@ -13,22 +14,18 @@ class RankSelection(SelectionFunctionFactory):
             if current_sum >= stop:
                 return i
 
-    def selection_function(self, parent_pool: list, num_offspring: int) -> int:
+    def select_parent_pairs(self, parent_pool: list, num_offspring: int) -> list:
         self.validate_arguments(parent_pool, num_offspring)
         parent_pairs = []
 
-        parent_pool.sort(key=lambda x: x.fitness)
+        parent_pool.sort(key=lambda x: x.selection_fitness)
         ranks = [i+1 for i in range(len(parent_pool))]
         rank_sum = (ranks[-1]-ranks[0]+1)*(ranks[0]+ranks[-1])/2
 
         select_parent = lambda: parent_pool[self.select_parent_index(ranks, rank_sum)]
 
         for i in range(num_offspring):
-            new_parent_group = [select_parent(), select_parent()]
-            # if we require unique parents but they are the same, keep replacing one parent until it is different
-            while self.enforces_unique_parents and new_parent_group[0] == new_parent_group[1]:
-                new_parent_group[1] = select_parent()
-            parent_pairs.append(new_parent_group)
+            parent_pairs.append(self.select_parent_pair(select_parent))
 
-        return [pair[0] + pair[1] for pair in parent_pairs]
+        return parent_pairs
         
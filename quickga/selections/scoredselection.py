@@ -0,0 +1,27 @@
+def select_with_scores(selection_function, parent_pool: list, num_offspring: int, scores: list) -> list:
+    """Calls a selection function which ranks the parents by the given scores instead of their fitness
+
+    The scores are held in each organisms 'selection_score', which the selections of this package read through
+    'selection_fitness'. The fitness itself is never changed, so breeding (and the credit given by an AdaptiveControl)
+    still sees the true fitness of the parents
+
+    Args:
+        selection_function:
+            The selection function which selects and breeds the parents
+        parent_pool: list
+            The organisms which may be chosen as parents
+        num_offspring: int
+            How many offspring to create
+        scores: list
+            The score of each organism in the parent pool (higher scores are more likely to be chosen)
+
+    Returns:
+        The offspring created by the selection function
+    """
+    for organism, score in zip(parent_pool, scores):
+        organism.selection_score = score
+    try:
+        return selection_function(parent_pool, num_offspring)
+    finally:
+        for organism in parent_pool:
+            organism.selection_score = None
@@ -1,15 +1,75 @@
 class SelectionFunctionFactory:
+    # when true, unique parents must have different genomes rather than just being different objects
+    compares_genomes = False
+    # the number of times a parent is reselected when it shares a genome with the other parent
+    # (a converged population may not contain two different genomes at all)
+    max_genome_attempts = 20
+
     def __new__(cls, *args, **kargs):
         obj = object.__new__(cls)
         obj.__init__(*args, **kargs)
+        # kept so that the selection function can be pickled (and sent to other processes)
+        obj.init_arguments = (args, kargs)
 
         return obj.selection_function
 
+    def __reduce__(self):
+        return (build_selection_object, (self.__class__,)+self.init_arguments)
+
     def selection_function(self, parent_pool: list, num_offspring: int) -> list:
-        raise Exception("Must implement 'selection_function' method")
+        return [pair[0] + pair[1] for pair in self.select_parent_pairs(parent_pool, num_offspring)]
+
+    def select_parent_pairs(self, parent_pool: list, num_offspring: int) -> list:
+        """Selects the two parents of each offspring without breeding them (used to breed in other processes)"""
+        raise Exception("Must implement 'select_parent_pairs' method")
+
+    def start(self):
+        """Called by 'evolve' before the first generation, may be overwritten to reset state kept between generations"""
+        pass
+
+    def step(self):
+        """Called by 'evolve' once the offspring of a generation have been selected, may be overwritten to update schedules"""
+        pass
+
+    def select_parent_indices(self, parent_pool: list, num_offspring: int) -> list:
+        """Selects the two parents of each offspring for a whole generation at once
+
+        Returns:
+            A list of (index, index) tuples, the positions of each offsprings parents in the parent pool
+        """
+        pairs = self.select_parent_pairs(parent_pool, num_offspring)
+        # the pool is indexed after selecting, since some selections reorder it
+        index_of = {id(organism): i for i, organism in enumerate(parent_pool)}
+        return [(index_of[id(a)], index_of[id(b)]) for a, b in pairs]
+
+    def parents_match(self, a, b) -> bool:
+        """Checks if two parents count as the same parent when unique parents are required"""
+        if self.compares_genomes:
+            return a is b or a.genome_key() == b.genome_key()
+        return a == b
+
+    def select_parent_pair(self, select_parent) -> list:
+        """Selects two parents using the 'select_parent' function, respecting 'enforces_unique_parents'"""
+        new_parent_pair = [select_parent(), select_parent()]
+        attempts = 0
+        # if we require unique parents but they are the same, keep replacing one parent until it is different
+        while self.enforces_unique_parents and self.parents_match(new_parent_pair[0], new_parent_pair[1]):
+            if self.compares_genomes and attempts >= self.max_genome_attempts:
+                break
+            new_parent_pair[1] = select_parent()
+            attempts += 1
+        return new_parent_pair
 
     def validate_arguments(self, parent_pool: list, num_offspring: int):
         if type(parent_pool) is not list:
             raise Exception("Parent pool must be a list of organisms")
         if num_offspring < 1:
-            raise Exception("Population size must be greater than 0")
\ No newline at end of file
+            raise Exception("Population size must be greater than 0")
+
+
+def build_selection_object(cls, args: tuple, kargs: dict) -> SelectionFunctionFactory:
+    """Recreates the object behind a selection function when it is unpickled"""
+    obj = object.__new__(cls)
+    obj.__init__(*args, **kargs)
+    obj.init_arguments = (args, kargs)
+    return obj
\ No newline at end of file
@@ -0,0 +1,20 @@
+from .batchselection import BatchSelection
+
+class StochasticUniversalSampling(BatchSelection):
+    """Fitness proportional selection which chooses every parent with one spin of a wheel with evenly spaced pointers
+
+    Each organism is chosen either floor or ceil of its expected number of times, so parent counts vary much less
+    than with ProportionalSelection. If any fitness is negative, fitnesses are shifted so that the least fit
+    organism has a weight of 0
+    """
+
+    def __init__(self, unique_parents: bool=False, compare_genomes: bool=False):
+        self.enforces_unique_parents = unique_parents
+        self.compares_genomes = compare_genomes
+
+    def select_indices(self, parent_pool: list, num_parents: int) -> list:
+        fitnesses = [organism.selection_fitness for organism in parent_pool]
+        lowest = min(fitnesses)
+        if lowest < 0:
+            fitnesses = [fitness-lowest for fitness in fitnesses]
+        return self.stochastic_universal_sampling(fitnesses, num_parents)
\ No newline at end of file
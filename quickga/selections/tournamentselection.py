@@ -4,9 +4,10 @@ from .selectionfunctionfactory import SelectionFunctionFactory
 
 class TournamentSelection(SelectionFunctionFactory):
 
-    def __init__(self, sample_size: int, unique_parents: bool=False):
+    def __init__(self, sample_size: int, unique_parents: bool=False, compare_genomes: bool=False):
         self.sample_size = sample_size
         self.enforces_unique_parents = unique_parents
+        self.compares_genomes = compare_genomes
 
     def select_parent(self, parent_pool: list):
         tournament = []
@@ -20,20 +21,17 @@ class TournamentSelection(SelectionFunctionFactory):
             tournament.append(chosen_for_tournament)
         # return the most fit of those randomly chosen for the tournament
 
-        return max(tournament, key=lambda x: x.fitness)
+        return max(tournament, key=lambda x: x.selection_fitness)
 
-    def selection_function(self, parent_pool: list, num_offspring: int):
+    def select_parent_pairs(self, parent_pool: list, num_offspring: int) -> list:
         self.validate_arguments(parent_pool, num_offspring)
         if len(parent_pool) < self.sample_size:
             raise Exception("Population size cannot be less than sample size for Tournament Selection")
 
         parent_pairs = []
+        select_parent = lambda: self.select_parent(parent_pool)
         for i in range(num_offspring):
-            new_parent_pair = [self.select_parent(parent_pool), self.select_parent(parent_pool)]
-            # if we require unique parents but they are the same, keep replacing one parent until it is different
-            while self.enforces_unique_parents and new_parent_pair[0] == new_parent_pair[1]:
-                new_parent_pair = self.select_parent(parent_pool)
-            parent_pairs.append(new_parent_pair)
+            parent_pairs.append(self.select_parent_pair(select_parent))
 
-        return [pair[0] + pair[1] for pair in parent_pairs]
+        return parent_pairs
             
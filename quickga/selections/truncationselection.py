@@ -0,0 +1,33 @@
+import math
+import random
+from .batchselection import BatchSelection
+
+class TruncationSelection(BatchSelection):
+    """Selection which only lets the most fit 'truncation_rate' percent of the parent pool breed
+
+    Every organism above the cutoff is chosen (almost) the same number of times
+    """
+
+    def __init__(self, truncation_rate: float=0.5, unique_parents: bool=False, compare_genomes: bool=False):
+        """
+        Args:
+            truncation_rate: (0,1]
+                The percent of the parent pool which may breed
+            unique_parents: bool
+                Whether the two parents of an offspring must be different organisms
+            compare_genomes: bool
+                Whether unique parents must also have different genomes
+        """
+        if not 0 < truncation_rate <= 1:
+            raise Exception("Truncation rate must be in (0,1]")
+
+        self.truncation_rate = truncation_rate
+        self.enforces_unique_parents = unique_parents
+        self.compares_genomes = compare_genomes
+
+    def select_indices(self, parent_pool: list, num_parents: int) -> list:
+        num_truncated = max(math.ceil(self.truncation_rate*len(parent_pool)), 2 if self.enforces_unique_parents else 1)
+        truncated = sorted(range(len(parent_pool)), key=lambda i: parent_pool[i].selection_fitness, reverse=True)[:num_truncated]
+        # shuffled so that the organisms chosen one extra time (when the counts cannot be equal) are random
+        random.shuffle(truncated)
+        return [truncated[i % len(truncated)] for i in range(num_parents)]
\ No newline at end of file
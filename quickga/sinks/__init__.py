@@ -0,0 +1,4 @@
+from .basesink import BaseSink
+from .jsonlsink import JSONLSink
+from .csvsink import CSVSink
+from .npychunksink import NpyChunkSink
\ No newline at end of file
@@ -0,0 +1,130 @@
+import queue
+import threading
+
+class BaseSink:
+    """A class to represent a destination for the info of each generation of evolution
+
+    The evolving thread only copies references to the generation's stats (and the population's trait values
+    and fitnesses if snapshots are enabled) and every 'batch_size' generations hands them to a background thread,
+    which converts and writes them, so writing does not slow down evolution
+
+    Sinks can be passed to Organism.evolve in the 'sinks' list, or called directly with each generation's info
+    'close' must be called when finished (evolve does this) so that buffered generations are written
+
+    The method write_batch MUST be overwritten
+    """
+
+    # info keys which hold organisms and are not written as stats
+    organism_keys = ['population', 'most_fit', 'least_fit']
+
+    def __init__(self, include_population: bool=False, batch_size: int=10):
+        """
+        Args:
+            include_population: bool
+                Whether the trait values and fitness of every organism should be written as well as the stats
+            batch_size: int
+                How many generations are buffered before they are written
+        """
+        self.include_population = include_population
+        self.batch_size = batch_size
+        self.generation = 0
+        self.buffer = []
+        self.queue = queue.Queue()
+        self.thread = None
+        self.error = None
+
+    def __call__(self, info: dict):
+        self.write(info)
+
+    def write(self, info: dict):
+        """Buffers the info of a generation to be written"""
+        if self.error:
+            raise self.error
+        stats = {'generation': self.generation}
+        stats.update({key: value for key, value in info.items() if key not in self.organism_keys})
+        population = None
+        if self.include_population:
+            # only references are taken here, the values are converted on the background thread
+            organisms = info['population']
+            traits = organisms[0]._traits if organisms else {}
+            population = (traits, [(organism.fitness, [vars(organism)[trait_name] for trait_name in traits]) for organism in organisms])
+        self.buffer.append((self.generation, stats, population))
+        self.generation += 1
+        if len(self.buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Hands all buffered generations to the background thread"""
+        if not self.buffer:
+            return
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.run, daemon=True)
+            self.thread.start()
+        self.queue.put(self.buffer)
+        self.buffer = []
+
+    def close(self):
+        """Writes all buffered generations and waits for the background thread to finish"""
+        self.flush()
+        if self.thread:
+            self.queue.put(None)
+            self.thread.join()
+            self.thread = None
+        self.close_files()
+        if self.error:
+            raise self.error
+
+    def run(self):
+        while True:
+            batch = self.queue.get()
+            if batch is None:
+                return
+            if self.error:
+                continue
+            try:
+                self.write_batch(batch)
+            except Exception as error:
+                # the error is raised on the evolving thread by the next call to 'write' or 'close'
+                self.error = error
+
+    def close_files(self):
+        """May be overwritten to close any open files once everything is written"""
+        pass
+
+    @staticmethod
+    def serializable(value):
+        """Converts a trait value into plain numbers, strings and lists"""
+        if isinstance(value, (bytes, bytearray)):
+            return value.decode('latin-1')
+        if isinstance(value, (str, int, float, bool)) or value is None:
+            return value
+        if isinstance(value, dict):
+            return {str(k): BaseSink.serializable(v) for k, v in value.items()}
+        try:
+            return [BaseSink.serializable(v) for v in value]
+        except TypeError:
+            return str(value)
+
+    @staticmethod
+    def flatten(stats: dict, prefix: str='') -> dict:
+        """Flattens nested dicts into a single dict with keys joined by '.'"""
+        flat = {}
+        for key, value in stats.items():
+            if isinstance(value, dict):
+                flat.update(BaseSink.flatten(value, f"{prefix}{key}."))
+            else:
+                flat[f"{prefix}{key}"] = value
+        return flat
+
+    def write_batch(self, batch: list):
+        """This method is responsible for writing a batch of generations, it runs on the background thread
+
+        THIS METHOD MUST BE OVERWRITTEN
+
+        Args:
+            batch: list
+                A list of (generation, stats, population) tuples where stats is a dict of the generation's info
+                and population is None or a tuple of (traits, [(fitness, trait_values), ...])
+        """
+
+        raise Exception(f"The Class '{self.__class__.__name__}' has not implemented 'write_batch' method")
\ No newline at end of file
@@ -0,0 +1,68 @@
+import csv
+import json
+from .basesink import BaseSink
+
+class CSVSink(BaseSink):
+    """A sink which writes a CSV row for the stats of each generation
+
+    Nested stats are flattened into columns named with '.' (for example 'executor.failed')
+    The columns are those provided, or the stats of the first generation if none are provided
+    A stat which is not a column raises an exception rather than being lost, so stats which first appear in a later
+    generation (such as the rewards of operators chosen by an AdaptiveControl) must be provided up front
+
+    If a population path is provided, a row is also written per organism with its generation, index, fitness
+    and trait values (sequences are written as JSON lists)
+    """
+
+    def __init__(self, path: str, population_path: str=None, batch_size: int=10, columns: list=None):
+        """
+        Args:
+            path: str
+                The file the stats of each generation are written to
+            population_path: str
+                The file the organisms of each generation are written to, no organisms are written if not provided
+            batch_size: int
+                How many generations are buffered before they are written
+            columns: list
+                Every (flattened) stat which may be written, the stats of the first generation if not provided
+                Generations missing a column leave it empty
+        """
+        super().__init__(population_path is not None, batch_size)
+        self.columns = list(columns) if columns is not None else None
+        self.file = open(path, 'w', newline='')
+        self.population_file = open(population_path, 'w', newline='') if population_path else None
+        self.writer = None
+        self.population_writer = None
+
+    def cell(self, value):
+        value = self.serializable(value)
+        return json.dumps(value) if isinstance(value, (list, dict)) else value
+
+    def write_batch(self, batch: list):
+        for generation, stats, population in batch:
+            row = {key: self.cell(value) for key, value in self.flatten(stats).items()}
+            if self.writer is None:
+                if self.columns is None:
+                    self.columns = list(row)
+                self.writer = csv.DictWriter(self.file, fieldnames=self.columns)
+                self.writer.writeheader()
+            unknown = [key for key in row if key not in self.writer.fieldnames]
+            if unknown:
+                raise Exception(f"Stats {unknown} are not columns of the CSV file, provide every column with 'columns'")
+            self.writer.writerow(row)
+
+            if population:
+                traits, organisms = population
+                if self.population_writer is None:
+                    self.population_writer = csv.writer(self.population_file)
+                    self.population_writer.writerow(['generation', 'index', 'fitness']+list(traits))
+                self.population_writer.writerows([generation, index, fitness]+[self.cell(value) for value in values]
+                    for index, (fitness, values) in enumerate(organisms))
+        self.file.flush()
+        if self.population_file:
+            self.population_file.flush()
+
+    def close_files(self):
+        self.file.close()
+        if self.population_file:
+            self.population_file.close()
\ No newline at end of file
@@ -0,0 +1,45 @@
+import json
+from .basesink import BaseSink
+
+class JSONLSink(BaseSink):
+    """A sink which writes one JSON object per line for the stats of each generation
+
+    If a population path is provided, one JSON object is also written per organism
+    with its generation, index, fitness and trait values
+    """
+
+    def __init__(self, path: str, population_path: str=None, batch_size: int=10):
+        """
+        Args:
+            path: str
+                The file the stats of each generation are written to
+            population_path: str
+                The file the organisms of each generation are written to, no organisms are written if not provided
+            batch_size: int
+                How many generations are buffered before they are written
+        """
+        super().__init__(population_path is not None, batch_size)
+        self.file = open(path, 'w')
+        self.population_file = open(population_path, 'w') if population_path else None
+
+    def write_batch(self, batch: list):
+        lines = []
+        population_lines = []
+        for generation, stats, population in batch:
+            lines.append(json.dumps(self.serializable(stats)))
+            if population:
+                traits, organisms = population
+                for index, (fitness, values) in enumerate(organisms):
+                    row = {'generation': generation, 'index': index, 'fitness': fitness}
+                    row.update({trait_name: self.serializable(value) for trait_name, value in zip(traits, values)})
+                    population_lines.append(json.dumps(row))
+        self.file.write('\n'.join(lines)+'\n')
+        self.file.flush()
+        if population_lines:
+            self.population_file.write('\n'.join(population_lines)+'\n')
+            self.population_file.flush()
+
+    def close_files(self):
+        self.file.close()
+        if self.population_file:
+            self.population_file.close()
\ No newline at end of file
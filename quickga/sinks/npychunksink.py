@@ -0,0 +1,77 @@
+import array
+import os
+import sys
+from .basesink import BaseSink
+
+def write_npy(path: str, values: array.array, shape: tuple):
+    """Writes a float64 array in the .npy format (version 1.0) so it can be loaded with numpy.load"""
+    descr = '<f8' if sys.byteorder == 'little' else '>f8'
+    header = f"{{'descr': '{descr}', 'fortran_order': False, 'shape': {shape}, }}"
+    # the magic string, version, header length and header must be padded to a multiple of 64 bytes
+    padding = 64-(10+len(header)+1) % 64
+    header = header+' '*padding+'\n'
+    with open(path, 'wb') as file:
+        file.write(b'\x93NUMPY\x01\x00')
+        file.write(len(header).to_bytes(2, 'little'))
+        file.write(header.encode('latin-1'))
+        file.write(values.tobytes())
+
+
+class NpyChunkSink(BaseSink):
+    """A sink which writes each batch of generations as columnar .npy chunks that can be loaded with numpy
+
+    Layout of the directory:
+        stats/<column>/chunk_00000.npy
+            One float64 array per numeric stat (nested stats are flattened with '.'), one value per generation
+        population/generation/chunk_00000.npy, population/fitness/chunk_00000.npy
+            The generation and fitness of every organism
+        population/genome/chunk_00000.npy
+            A 2D array of every organism's genome as created by its traits 'encode' method
+    """
+
+    def __init__(self, directory: str, include_population: bool=False, batch_size: int=10):
+        """
+        Args:
+            directory: str
+                The directory the chunks are written to (it is created if needed)
+            include_population: bool
+                Whether the generation, fitness and encoded genome of every organism should be written
+            batch_size: int
+                How many generations are written in each chunk
+        """
+        super().__init__(include_population, batch_size)
+        self.directory = directory
+        self.chunk = 0
+
+    def chunk_path(self, *names) -> str:
+        directory = os.path.join(self.directory, *names)
+        os.makedirs(directory, exist_ok=True)
+        return os.path.join(directory, f"chunk_{self.chunk:05d}.npy")
+
+    def write_batch(self, batch: list):
+        columns = {}
+        for row, (generation, stats, population) in enumerate(batch):
+            for key, value in self.flatten(stats).items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    # a stat missing from a generation is written as nan
+                    columns.setdefault(key, array.array('d', [float('nan')]*len(batch)))[row] = value
+        for key, values in columns.items():
+            write_npy(self.chunk_path('stats', key.replace(os.sep, '_')), values, (len(batch),))
+
+        if self.include_population:
+            generations = array.array('d')
+            fitnesses = array.array('d')
+            genomes = array.array('d')
+            width = 0
+            for generation, stats, (traits, organisms) in batch:
+                for fitness, values in organisms:
+                    genome = [x for trait, value in zip(traits.values(), values) for x in trait.encode(value)]
+                    width = len(genome)
+                    generations.append(generation)
+                    fitnesses.append(fitness)
+                    genomes.extend(genome)
+            write_npy(self.chunk_path('population', 'generation'), generations, (len(generations),))
+            write_npy(self.chunk_path('population', 'fitness'), fitnesses, (len(fitnesses),))
+            write_npy(self.chunk_path('population', 'genome'), genomes, (len(fitnesses), width))
+
+        self.chunk += 1
\ No newline at end of file
@@ -0,0 +1,2 @@
+from .basesurrogate import BaseSurrogate
+from .knnsurrogate import KNNSurrogate
\ No newline at end of file
@@ -0,0 +1,111 @@
+import math
+
+class BaseSurrogate:
+    """A class to represent a cheap approximation of an Organism's fitness function
+
+    The surrogate learns from (genome, fitness) pairs of Organisms which have been truly evaluated
+    and is used during evolution to pre-screen offspring so only the most promising get a true evaluation
+
+    Offspring which are not truly evaluated have their fitness set to the predicted value
+    and their 'fitness_estimated' attribute set to True
+
+    The methods fit and predict MUST be overwritten
+    """
+
+    def __init__(self, evaluation_ratio: float=0.25, refresh_interval: int=1, min_samples: int=20, max_samples: int=2000):
+        """
+        Args:
+            evaluation_ratio: [0,1]
+                The fraction of offspring (those with the highest predicted fitness) which get a true evaluation
+            refresh_interval: int
+                How many generations pass between refits of the model
+            min_samples: int
+                How many truly evaluated Organisms must be recorded before the surrogate is used
+            max_samples: int
+                The maximum number of samples kept, the oldest samples are discarded first
+        """
+        if not 0 <= evaluation_ratio <= 1:
+            raise Exception("Evaluation ratio must be between 0 and 1")
+        if refresh_interval < 1:
+            raise Exception("Refresh interval must be at least 1")
+
+        self.evaluation_ratio = evaluation_ratio
+        self.refresh_interval = refresh_interval
+        self.min_samples = min_samples
+        self.max_samples = max_samples
+
+        self.genomes = []
+        self.fitnesses = []
+        self.is_fitted = False
+        self.generations_since_refresh = 0
+
+    def record(self, organisms: list):
+        """Stores the genomes and fitnesses of truly evaluated Organisms as training samples"""
+        for organism in organisms:
+            self.genomes.append(organism.encode())
+            self.fitnesses.append(organism.fitness)
+        overflow = len(self.genomes) - self.max_samples
+        if overflow > 0:
+            del self.genomes[:overflow]
+            del self.fitnesses[:overflow]
+
+    def update(self):
+        """Refits the model if 'refresh_interval' generations have passed since the last fit (or it was never fit)"""
+        self.generations_since_refresh += 1
+        if len(self.genomes) < self.min_samples:
+            return
+        if not self.is_fitted or self.generations_since_refresh >= self.refresh_interval:
+            self.fit(self.genomes, self.fitnesses)
+            self.is_fitted = True
+            self.generations_since_refresh = 0
+
+    def screen(self, organisms: list) -> list:
+        """Scores the organisms with the model and returns the ones which should be truly evaluated
+
+        Every organism not returned has its fitness set to the predicted value
+
+        Args:
+            organisms: list
+                The candidate offspring
+
+        Returns:
+            The organisms with the highest predicted fitness
+        """
+        predictions = [self.predict(organism.encode()) for organism in organisms]
+        order = sorted(range(len(organisms)), key=lambda i: predictions[i], reverse=True)
+        num_evaluated = math.ceil(self.evaluation_ratio*len(organisms))
+
+        for i in order[num_evaluated:]:
+            organisms[i].fitness = predictions[i]
+            organisms[i].fitness_estimated = True
+
+        return [organisms[i] for i in order[:num_evaluated]]
+
+    def fit(self, genomes: list, fitnesses: list):
+        """This method is responsible for training the model on the recorded samples
+
+        THIS METHOD MUST BE OVERWRITTEN
+
+        Args:
+            genomes: list
+                A list of encoded genomes (each a list of floats)
+            fitnesses: list
+                The true fitness of each genome
+        """
+
+        raise Exception(f"The Class '{self.__class__.__name__}' has not implemented 'fit' method")
+
+    def predict(self, genome: list) -> float:
+        """This method is responsible for estimating the fitness of an encoded genome
+
+        THIS METHOD MUST BE OVERWRITTEN
+
+        Args:
+            genome: list
+                An encoded genome (a list of floats)
+
+        Returns:
+            The estimated fitness
+        """
+
+        raise Exception(f"The Class '{self.__class__.__name__}' has not implemented 'predict' method")
\ No newline at end of file
@@ -0,0 +1,53 @@
+import heapq
+from .basesurrogate import BaseSurrogate
+
+class KNNSurrogate(BaseSurrogate):
+    """A surrogate which predicts fitness as the distance weighted average of the k nearest evaluated genomes
+
+    Each dimension of the encoded genome is scaled to [0,1] using the range of the training samples
+    so that traits with large ranges do not dominate the distance
+    """
+
+    def __init__(self, k: int=5, evaluation_ratio: float=0.25, refresh_interval: int=1, min_samples: int=20,
+            max_samples: int=2000):
+        """
+        Args:
+            k: int
+                How many neighbors are used for each prediction
+            evaluation_ratio: [0,1]
+                The fraction of offspring (those with the highest predicted fitness) which get a true evaluation
+            refresh_interval: int
+                How many generations pass between refits of the model
+            min_samples: int
+                How many truly evaluated Organisms must be recorded before the surrogate is used
+            max_samples: int
+                The maximum number of samples kept, the oldest samples are discarded first
+        """
+        super().__init__(evaluation_ratio, refresh_interval, min_samples, max_samples)
+        self.k = k
+
+    def scale(self, genome: list) -> list:
+        return [(genome[i]-self.offsets[i])*self.scales[i] for i in range(len(genome))]
+
+    def fit(self, genomes: list, fitnesses: list):
+        columns = list(zip(*genomes))
+        self.offsets = [min(column) for column in columns]
+        # constant dimensions carry no information, so they are given a scale of 0
+        self.scales = [1/(max(column)-min(column)) if max(column) > min(column) else 0 for column in columns]
+        # keep a snapshot so that samples recorded after fitting are not used until the next refresh
+        self.points = [self.scale(genome) for genome in genomes]
+        self.values = list(fitnesses)
+
+    def predict(self, genome: list) -> float:
+        query = self.scale(genome)
+        squared_distance = lambda point: sum((point[i]-query[i])**2 for i in range(len(query)))
+        neighbors = heapq.nsmallest(self.k, ((squared_distance(point), value) for point, value in zip(self.points, self.values)),
+            key=lambda x: x[0])
+
+        # an exact match is the best possible prediction
+        for distance, value in neighbors:
+            if distance == 0:
+                return value
+
+        weights = [1/distance for distance, value in neighbors]
+        return sum(weight*value for weight, (distance, value) in zip(weights, neighbors))/sum(weights)
\ No newline at end of file
@@ -1,4 +1,5 @@
 from .basetrait import BaseTrait
+from .genome import Genome
 from .sequencetrait import SequenceTrait
 from .permutationsequencetrait import PermutationSequenceTrait
 from .binarytrait import BinaryTrait
@@ -8,4 +9,5 @@ from .intsequencetrait import IntSequenceTrait
 from .floattrait import FloatTrait
 from .floatsequencetrait import FloatSequenceTrait
 from .chartrait import CharTrait
-from .charsequencetrait import CharSequenceTrait
\ No newline at end of file
+from .charsequencetrait import CharSequenceTrait
+from .compactcharsequencetrait import CompactCharSequenceTrait
\ No newline at end of file
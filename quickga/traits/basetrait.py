@@ -1,3 +1,5 @@
+import math
+import random
 from typing import TypeVar
 
 T = TypeVar("T")
@@ -9,8 +11,17 @@ class BaseTrait:
 
     The methods random_value, crossover, and mutate MUST be overwritten
     The method initial_value may be overwritten when necessary
+
+    Attributes:
+        mutated:
+            True if the last call to 'from_parent_values' mutated the value (only tracked by traits which use 'should_mutate')
+        constraints:
+            The constraints (BaseConstraints) the traits values must satisfy, added with 'add_constraint'
     """
 
+    mutated = False
+    constraints = ()
+
     def from_parent_values(self, a: T, b: T) -> T:
         """Takes two values and creates a new derived value
         
@@ -21,9 +32,48 @@ class BaseTrait:
                 The value from the second parent
         """
         new_value = self.crossover(a, b)
+        self.mutated = False
         new_value = self.mutate(new_value)
         return new_value
 
+    def should_mutate(self) -> bool:
+        """Randomly decides whether a value should be mutated using the traits 'mutation_rate' and records the decision"""
+        self.mutated = random.random() < self.mutation_rate
+        return self.mutated
+
+    def add_constraint(self, constraint) -> 'BaseTrait':
+        """Adds a constraint (such as a SumConstraint) which values of the trait must satisfy
+
+        Example:
+            self.add_trait('items', BinarySequenceTrait(50).add_constraint(CardinalityConstraint(max_count=10)))
+
+        Returns:
+            The trait, so that calls can be chained
+        """
+        self.constraints = list(self.constraints)+[constraint]
+        return self
+
+    def is_feasible(self, value: T) -> bool:
+        """Checks whether a value satisfies every constraint of the trait, may be overwritten"""
+        return all(constraint.is_feasible(value) for constraint in self.constraints)
+
+    def repair(self, value: T) -> T:
+        """Repairs a value with each constraint it does not satisfy, may be overwritten
+
+        Constraints are repaired in the order they were added, so a later repair may break an earlier constraint
+
+        Args:
+            value:
+                A value of the trait (which is not changed in place)
+
+        Returns:
+            The repaired value
+        """
+        for constraint in self.constraints:
+            if not constraint.is_feasible(value):
+                value = constraint.repair(value)
+        return value
+
     def inital_value(self) -> T:
         """Creates the initial value for the trait
         
@@ -33,6 +83,65 @@ class BaseTrait:
 
         return self.random_value()
 
+    def encode(self, value: T) -> list:
+        """Converts a value of the trait into a list of numbers
+
+        Used by components which need a numeric view of a genome (such as surrogate models)
+        The default implementation assumes the value is a single number and may be overwritten
+        
+        Args:
+            value:
+                The value to be encoded
+
+        Returns:
+            A list of floats representing the value
+        """
+
+        return [float(value)]
+
+    def distance(self, a: T, b: T) -> float:
+        """Measures how different two values of the trait are, used by niching and novelty search
+
+        The default implementation is the euclidean distance between the encoded values and may be overwritten
+
+        Args:
+            a:
+                The first value
+            b:
+                The second value
+
+        Returns:
+            A non-negative number which is 0 for equal values
+        """
+
+        return math.dist(self.encode(a), self.encode(b))
+
+    def bounds(self) -> list:
+        """Returns the range of each number in the encoding, used by the continuous optimization engines
+
+        Traits which cannot be optimized as real vectors do not overwrite this method
+        
+        Returns:
+            A list of (min, max) tuples, one for each number returned by 'encode'
+        """
+
+        raise Exception(f"The Class '{self.__class__.__name__}' does not support continuous optimization")
+
+    def decode(self, vector: list) -> T:
+        """Converts a list of numbers back into a value of the trait, the inverse of 'encode'
+
+        Numbers outside of the traits bounds must be moved back inside them
+        
+        Args:
+            vector:
+                A list of floats the same length as 'bounds'
+
+        Returns:
+            The value of the trait closest to the vector
+        """
+
+        raise Exception(f"The Class '{self.__class__.__name__}' does not support continuous optimization")
+
     def random_value(self) -> T:
         """This method is responsible for creating a random value the trait could posess
 
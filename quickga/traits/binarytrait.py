@@ -25,9 +25,15 @@ class BinaryTrait(BaseTrait):
     def random_value(self) -> int:
         return random.choice([0, 1])
 
+    def bounds(self) -> list:
+        return [(0, 1)]
+
+    def decode(self, vector: list) -> int:
+        return 1 if vector[0] >= 0.5 else 0
+
     def crossover(self, a: int, b: int) -> int:
         return random.choice([a,b])
 
     def mutate(self, value: int) -> int:
-        return self.random_value() if random.random()<self.mutation_rate else value
+        return self.random_value() if self.should_mutate() else value
         
\ No newline at end of file
@@ -23,6 +23,7 @@ class CharTrait(BaseTrait):
             mutation_rate: float
                 The chance of a value being mutated each generation
         """
+        self.mutation_rate = mutation_rate
         self.char_pool = []
         if 'lowercase' in include:
             self.char_pool += string.ascii_lowercase
@@ -34,8 +35,14 @@ class CharTrait(BaseTrait):
     def random_value(self) -> str:
         return random.choice(self.char_pool)
 
+    def encode(self, value: str) -> list:
+        return [float(ord(value))]
+
+    def distance(self, a: str, b: str) -> float:
+        return float(a != b)
+
     def crossover(self, a: str, b: str) -> str:
         return random.choice([a,b])
 
     def mutate(self, value: str):
-        return self.random_value() if random.random()<self.mutation_rate else value
+        return self.random_value() if self.should_mutate() else value
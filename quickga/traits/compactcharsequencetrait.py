@@ -0,0 +1,135 @@
+import random
+from .sequencetrait import SequenceTrait
+from .chartrait import CharTrait
+
+class CompactCharSequenceTrait(SequenceTrait):
+    """A Trait whose value is a bytearray of ASCII characters
+
+    Stores one byte per character instead of a list of one character strings, and initialization,
+    crossover and random-reset mutation work on whole byte strings at once
+    The value can be compared directly against a target with 'match_count' or converted with 'to_string'
+
+    initialize:
+        Value initializes to a bytearray of ASCII characters
+
+    crossover:
+        Currently implemented crossover methods include
+            - 1-point crossover
+            - 2-point crossover
+            - n-point crossover
+            - uniform crossover
+
+    mutate:
+        Currently implemented mutation methods include
+            - random-reset mutation
+            - insertion mutation
+            - swap mutation
+            - scramble mutation
+            - inversion mutation
+
+        If mutated, value gets set mutated according to the method specified in the constructor
+    """
+
+    # maps a random byte to a mask byte of all 0's or all 1's with equal chance
+    uniform_mask_table = bytes(0xFF if i & 1 else 0x00 for i in range(256))
+
+    def __init__(self, length: int, include = ['lowercase', 'uppercase'], crossover_type: str='2-point',
+            mutation_type: str='random-reset', mutation_rate: float=0.05, n: int=None):
+        """
+        Args:
+            length: int
+                How long the sequence should be
+            include: list
+                a list which may contain the values ['lowercase', 'uppercase', 'punctuation'] and decides the characters the value can have
+            crossover_type: str
+                One of ['uniform', '1-point', '2-point', 'n-point']
+            mutation_type: str
+                One of ['random-reset', 'swap', 'inseriton', 'scramble', 'inversion']
+            mutaion_type: float
+                The chance of a value being mutated each generation
+            n: int
+                If the user selects the crossover type 'n-point' the n should be specified with this argument
+        """
+
+        super().__init__(CharTrait(include, mutation_rate=0), length, crossover_type, mutation_type, mutation_rate, n)
+        self.byte_pool = ''.join(self.trait.char_pool).encode('ascii')
+
+    def new_value(self, items) -> bytearray:
+        return items if isinstance(items, bytearray) else bytearray(items)
+
+    def to_string(self, value: bytearray) -> str:
+        """Converts a value of the trait into a string"""
+        return value.decode('ascii')
+
+    def match_count(self, value: bytearray, target) -> int:
+        """Counts the positions where the value has the same character as the target
+
+        Args:
+            value: bytearray
+                A value of the trait
+            target: str or bytes
+                The string to compare against (must be the same length as the value)
+
+        Returns:
+            The number of matching characters
+        """
+        return self.match_counts([value], target)[0]
+
+    def match_counts(self, values: list, target) -> list:
+        """Counts the matching characters of many values against the same target in one call
+
+        Each value is xor'ed with the target as a single integer, so matching characters become zero bytes
+        which are counted without a python loop over the characters
+
+        Args:
+            values: list
+                Values of the trait (for example the values of a whole population)
+            target: str or bytes
+                The string to compare against (must be the same length as the values)
+
+        Returns:
+            A list with the number of matching characters of each value
+        """
+        if isinstance(target, str):
+            target = target.encode('ascii')
+        length = len(target)
+        target_int = int.from_bytes(target, 'big')
+        return [(int.from_bytes(value, 'big')^target_int).to_bytes(length, 'big').count(0) for value in values]
+
+    def hamming_distances(self, values: list, target) -> list:
+        """Returns the number of characters of each value which differ from the target"""
+        return [len(value)-matches for value, matches in zip(values, self.match_counts(values, target))]
+
+    def distance(self, a: bytearray, b: bytearray) -> float:
+        return float(self.hamming_distances([a], b)[0])
+
+    def uniform_crossover(self, a: bytearray, b: bytearray) -> bytearray:
+        mask = int.from_bytes(random.randbytes(len(a)).translate(self.uniform_mask_table), 'big')
+        child = (int.from_bytes(a, 'big') & mask) | (int.from_bytes(b, 'big') & ~mask)
+        return bytearray(child.to_bytes(len(a), 'big'))
+
+    def n_point_crossover(self, a: bytearray, b: bytearray) -> bytearray:
+        if not self.n:
+            raise Exception("No n defined for n-point crossover")
+
+        indices = [i for i in range(1, len(a)-1)]
+        cross_indices = [indices.pop(random.randint(0,len(indices)-1)) for i in range(self.n)]
+        pick_from_a = random.random()<.5
+
+        # the child is built by joining slices of the parents
+        boundaries = [0] + sorted(i+1 for i in cross_indices) + [len(a)]
+        parents = [a, b] if pick_from_a else [b, a]
+        return bytearray().join(parents[k%2][boundaries[k]:boundaries[k+1]] for k in range(len(boundaries)-1))
+
+    def random_reset_mutation(self, value: bytearray) -> bytearray:
+        value[random.randint(0,len(value)-1)] = random.choice(self.byte_pool)
+        return value
+
+    def encode(self, value: bytearray) -> list:
+        return [float(v) for v in value]
+
+    def initial_value(self) -> bytearray:
+        return self.random_value()
+
+    def random_value(self) -> bytearray:
+        return bytearray(random.choices(self.byte_pool, k=self.length))
\ No newline at end of file
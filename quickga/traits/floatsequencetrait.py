@@ -1,3 +1,5 @@
+import math
+import random
 from .sequencetrait import SequenceTrait
 from .floattrait import FloatTrait
 
@@ -13,6 +15,9 @@ class FloatSequenceTrait(SequenceTrait):
             - 2-point crossover
             - n-point crossover
             - uniform crossover
+            - arithmetic crossover
+            - blend crossover (BLX-alpha)
+            - simulated binary crossover (SBX)
 
     mutate:
         Currently implemented mutation methods include
@@ -21,12 +26,17 @@ class FloatSequenceTrait(SequenceTrait):
             - swap mutation
             - scramble mutation
             - inversion mutation
+            - gaussian mutation
+            - polynomial mutation
 
         If mutated, value gets set mutated according to the method specified in the constructor
+        The real-valued crossover and mutation methods are applied to every value in the sequence
+        and keep the values within [min_value, max_value]
     """
 
     def __init__(self, length: int, min_value: int, max_value: int, crossover_type: str='2-point', 
-            mutation_type: str='random-reset', mutation_rate: float=0.05, n: int=None):
+            mutation_type: str='random-reset', mutation_rate: float=0.05, n: int=None,
+            copy_on_write: bool=False, alpha: float=0.5, eta: float=15, sigma: float=0.1):
         """
         Args:
             length: int
@@ -36,13 +46,68 @@ class FloatSequenceTrait(SequenceTrait):
             max_value: float
                 The maximum a value in the sequence could be
             crossover_type: str
-                One of ['uniform', '1-point', '2-point', 'n-point']
+                One of ['uniform', '1-point', '2-point', 'n-point', 'arithmetic', 'blx-alpha', 'sbx']
             mutation_type: str
-                One of ['random-reset', 'swap', 'inseriton', 'scramble', 'inversion']
+                One of ['random-reset', 'swap', 'inseriton', 'scramble', 'inversion', 'gaussian', 'polynomial']
             mutaion_type: float
                 The chance of a value being mutated each generation
             n: int
                 If the user selects the crossover type 'n-point' the n should be specified with this argument
+            copy_on_write: bool
+                If true, values are immutable Genomes (instead of lists) which share unchanged chunks with their parents
+            alpha: float
+                How far outside the parents values blend crossover can create a value (as a fraction of their distance)
+            eta: float
+                The distribution index of simulated binary crossover and polynomial mutation
+                (higher values create children closer to the parents)
+            sigma: float
+                The standard deviation of gaussian mutation as a fraction of the range [min_value, max_value]
         """
 
-        super().__init__(FloatTrait(min_value, max_value, mutation_rate=0), length, crossover_type, mutation_type, mutation_rate, n) 
\ No newline at end of file
+        float_trait = FloatTrait(min_value, max_value, mutation_rate=0, alpha=alpha, eta=eta, sigma=sigma)
+        super().__init__(float_trait, length, crossover_type, mutation_type, mutation_rate, n, copy_on_write)
+
+    def additional_crossover_functions(self) -> dict:
+        return {
+            'arithmetic': self.arithmetic_crossover,
+            'blx-alpha': self.blend_crossover,
+            'sbx': self.simulated_binary_crossover
+        }
+
+    def additional_mutation_functions(self) -> dict:
+        return {
+            'gaussian': self.gaussian_mutation,
+            'polynomial': self.polynomial_mutation
+        }
+
+    def distance(self, a: list, b: list) -> float:
+        return math.dist(a, b)
+
+    def arithmetic_crossover(self, a: list, b: list) -> list:
+        """Each value in the child sequence is the same random weighted average of the parents values
+        
+        example: weight = 0.25
+            a = [0,0,0,0,0,0,0,0,0,0]
+            b = [4,4,4,4,4,4,4,4,4,4]
+            c = [3,3,3,3,3,3,3,3,3,3]
+        """
+        weight = random.random()
+        return [self.trait.arithmetic_crossover(a[i], b[i], weight) for i in range(len(a))]
+
+    def blend_crossover(self, a: list, b: list) -> list:
+        """Each value in the child sequence is created from the parents values with blend crossover (BLX-alpha)"""
+        blend = self.trait.blend_crossover
+        return [blend(a[i], b[i]) for i in range(len(a))]
+
+    def simulated_binary_crossover(self, a: list, b: list) -> list:
+        """Each value in the child sequence is created from the parents values with simulated binary crossover (SBX)"""
+        simulated_binary = self.trait.simulated_binary_crossover
+        return [simulated_binary(a[i], b[i]) for i in range(len(a))]
+
+    def gaussian_mutation(self, value: list) -> list:
+        """Adds normally distributed noise to every value in the sequence"""
+        return self.new_value([self.trait.gaussian_mutation(v) for v in value])
+
+    def polynomial_mutation(self, value: list) -> list:
+        """Applies polynomial mutation to every value in the sequence"""
+        return self.new_value([self.trait.polynomial_mutation(v) for v in value])
\ No newline at end of file
@@ -8,13 +8,23 @@ class FloatTrait(BaseTrait):
         Value initializes to a random floating point number from the provided range
 
     crossover:
-        Returns the value from a single parent with equal chance
+        Currently implemented crossover methods include
+            - choice (returns the value from a single parent with equal chance)
+            - arithmetic crossover
+            - blend crossover (BLX-alpha)
+            - simulated binary crossover (SBX)
 
-    mutate:
-        If mutated, value gets set randomly to a random floating point number from the provided range
+    mutation:
+        Currently implemented mutation methods include
+            - random-reset mutation (a random floating point number from the provided range)
+            - gaussian mutation
+            - polynomial mutation
+
+        Values created outside the provided range are clipped to it
     """
 
-    def __init__(self, min_value: float, max_value: float, mutation_rate: float=0.01):
+    def __init__(self, min_value: float, max_value: float, mutation_rate: float=0.01, crossover_type: str='choice',
+            mutation_type: str='random-reset', alpha: float=0.5, eta: float=15, sigma: float=0.1):
         """
         Args:
             min_value: float
@@ -23,16 +33,122 @@ class FloatTrait(BaseTrait):
                 The maximum the value could be
             mutation_rate: float
                 The chance of a value being mutated each generation        
+            crossover_type: str
+                One of ['choice', 'arithmetic', 'blx-alpha', 'sbx']
+            mutation_type: str
+                One of ['random-reset', 'gaussian', 'polynomial']
+            alpha: float
+                How far outside the parents values blend crossover can create a value (as a fraction of their distance)
+            eta: float
+                The distribution index of simulated binary crossover and polynomial mutation
+                (higher values create children closer to the parents)
+            sigma: float
+                The standard deviation of gaussian mutation as a fraction of the range [min_value, max_value]
         """
         self.min_value = min_value
         self.max_value = max_value
         self.mutation_rate = mutation_rate
+        self.crossover_type = crossover_type
+        self.mutation_type = mutation_type
+        self.alpha = alpha
+        self.eta = eta
+        self.sigma = sigma
+
+        self.crossover_functions = {
+            'choice': self.choice_crossover,
+            'arithmetic': self.arithmetic_crossover,
+            'blx-alpha': self.blend_crossover,
+            'sbx': self.simulated_binary_crossover
+        }
+
+        self.mutation_functions = {
+            'random-reset': self.random_reset_mutation,
+            'gaussian': self.gaussian_mutation,
+            'polynomial': self.polynomial_mutation
+        }
+
+        if crossover_type not in self.crossover_functions:
+            raise Exception("Invalid crossover type provided")
+        if mutation_type not in self.mutation_functions:
+            raise Exception("Invalid mutation type provided")
+
+    def clip(self, value: float) -> float:
+        """Moves a value outside the range [min_value, max_value] to the nearest bound"""
+        return min(max(value, self.min_value), self.max_value)
+
+    def choice_crossover(self, a: float, b: float) -> float:
+        """Returns the value from a single parent with equal chance"""
+        return random.choice([a,b])
+
+    def arithmetic_crossover(self, a: float, b: float, weight: float=None) -> float:
+        """Returns a random weighted average of the parents values
+
+        Args:
+            a: float
+                Value from one parent
+            b: float
+                Value from the other parent
+            weight: [0,1]
+                The weight of the first parent, chosen randomly if not provided
+        """
+        if weight is None:
+            weight = random.random()
+        return weight*a + (1-weight)*b
+
+    def blend_crossover(self, a: float, b: float) -> float:
+        """Returns a random value in the range spanned by the parents, extended on both sides by 'alpha' times their distance"""
+        low, high = min(a, b), max(a, b)
+        extension = self.alpha*(high-low)
+        return self.clip(random.uniform(low-extension, high+extension))
+
+    def simulated_binary_crossover(self, a: float, b: float) -> float:
+        """Returns one of the two children created by simulated binary crossover
+
+        The children are spread around the parents like the children of single point crossover on binary strings,
+        with a spread controlled by the distribution index 'eta'
+        """
+        u = random.random()
+        if u <= 0.5:
+            beta = (2*u)**(1/(self.eta+1))
+        else:
+            beta = (1/(2*(1-u)))**(1/(self.eta+1))
+        sign = 1 if random.random() < .5 else -1
+        return self.clip(0.5*((a+b) + sign*beta*(a-b)))
+
+    def random_reset_mutation(self, value: float) -> float:
+        """Returns a random floating point number from the provided range"""
+        return self.random_value()
+
+    def gaussian_mutation(self, value: float) -> float:
+        """Adds normally distributed noise with a standard deviation of 'sigma' times the range"""
+        return self.clip(value + random.gauss(0, self.sigma*(self.max_value-self.min_value)))
+
+    def polynomial_mutation(self, value: float) -> float:
+        """Moves the value by a polynomially distributed amount which never leaves the range"""
+        value_range = self.max_value-self.min_value
+        if value_range <= 0:
+            return value
+        delta_low = (value-self.min_value)/value_range
+        delta_high = (self.max_value-value)/value_range
+        u = random.random()
+        power = 1/(self.eta+1)
+        if u < 0.5:
+            delta = (2*u + (1-2*u)*(1-delta_low)**(self.eta+1))**power - 1
+        else:
+            delta = 1 - (2*(1-u) + 2*(u-0.5)*(1-delta_high)**(self.eta+1))**power
+        return self.clip(value + delta*value_range)
+
+    def bounds(self) -> list:
+        return [(self.min_value, self.max_value)]
+
+    def decode(self, vector: list) -> float:
+        return self.clip(vector[0])
 
     def random_value(self) -> float:
         return random.uniform(self.min_value, self.max_value)
 
     def crossover(self, a: float, b: float) -> float:
-        return random.choice([a,b])
+        return self.crossover_functions[self.crossover_type](a, b)
 
     def mutate(self, value: float) -> float:
-        return self.random_value() if random.random()<self.mutation_rate else value
\ No newline at end of file
+        return self.mutation_functions[self.mutation_type](value) if self.should_mutate() else value
\ No newline at end of file
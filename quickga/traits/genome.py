@@ -0,0 +1,160 @@
+class Genome:
+    """An immutable sequence of trait values stored in fixed size chunks which are shared between Genomes
+
+    Operations which change a Genome return a new Genome and only copy the chunks they touch,
+    so carrying down or cloning an Organism costs nothing and mutating a value costs O(chunk_size)
+    instead of O(length). Because a Genome can never be changed in place, it is always safe to share
+
+    Reading a Genome works like reading a tuple, except slices are returned as lists
+
+    Example:
+        a = Genome([0,1,2,3,4,5,6,7,8,9])
+        b = a.set(3, 9)
+        print(a[3], b[3])
+        # outputs 3 9
+    """
+
+    __slots__ = ('chunks', 'length', '_hash')
+
+    chunk_size = 64
+
+    def __init__(self, items=()):
+        """
+        Args:
+            items:
+                An iterable of the values in the sequence
+        """
+        items = list(items)
+        size = self.chunk_size
+        self.chunks = [tuple(items[i:i+size]) for i in range(0, len(items), size)]
+        self.length = len(items)
+        self._hash = None
+
+    @classmethod
+    def from_chunks(cls, chunks: list, length: int) -> 'Genome':
+        """Creates a Genome directly from a list of chunks (every chunk except the last must be full)"""
+        genome = cls.__new__(cls)
+        genome.chunks = chunks
+        genome.length = length
+        genome._hash = None
+        return genome
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __iter__(self):
+        for chunk in self.chunks:
+            yield from chunk
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.length)
+            if step != 1:
+                return list(self)[index]
+            return self.section(start, stop)
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("Genome index out of range")
+        return self.chunks[index//self.chunk_size][index % self.chunk_size]
+
+    def __contains__(self, value) -> bool:
+        return any(value in chunk for chunk in self.chunks)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Genome):
+            if self.length != other.length:
+                return False
+            # shared chunks are identical without comparing their values
+            return all(a is b or a == b for a, b in zip(self.chunks, other.chunks))
+        if isinstance(other, (list, tuple)):
+            return len(other) == self.length and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(tuple(self))
+        return self._hash
+
+    def __repr__(self) -> str:
+        return f"Genome({list(self)})"
+
+    def index(self, value) -> int:
+        for i, chunk in enumerate(self.chunks):
+            if value in chunk:
+                return i*self.chunk_size+chunk.index(value)
+        raise ValueError(f"{value} is not in Genome")
+
+    def count(self, value) -> int:
+        return sum(chunk.count(value) for chunk in self.chunks)
+
+    def section(self, start: int, stop: int) -> list:
+        """Returns the values from index start up to (not including) stop as a list, reading only the chunks needed"""
+        if stop <= start:
+            return []
+        size = self.chunk_size
+        values = []
+        for chunk_index in range(start//size, (stop-1)//size+1):
+            chunk_start = chunk_index*size
+            values += self.chunks[chunk_index][max(start-chunk_start, 0):stop-chunk_start]
+        return values
+
+    def set(self, index: int, value) -> 'Genome':
+        """Returns a new Genome with the value at index replaced, copying only one chunk"""
+        return self.set_section(index, [value])
+
+    def set_section(self, start: int, values: list) -> 'Genome':
+        """Returns a new Genome with the values from index start replaced by 'values', copying only the chunks touched"""
+        if start < 0:
+            start += self.length
+        stop = start+len(values)
+        if start < 0 or stop > self.length:
+            raise IndexError("Genome section out of range")
+        if not values:
+            return self
+
+        size = self.chunk_size
+        chunks = list(self.chunks)
+        for chunk_index in range(start//size, (stop-1)//size+1):
+            chunk_start = chunk_index*size
+            chunk = list(chunks[chunk_index])
+            section_start = max(start, chunk_start)
+            section_stop = min(stop, chunk_start+len(chunk))
+            chunk[section_start-chunk_start:section_stop-chunk_start] = values[section_start-start:section_stop-start]
+            chunks[chunk_index] = tuple(chunk)
+        return Genome.from_chunks(chunks, self.length)
+
+    @staticmethod
+    def combine(regions: list) -> 'Genome':
+        """Creates a Genome from consecutive regions of other Genomes of the same length
+
+        Chunks which lie entirely inside one region are shared with that region's Genome
+
+        Args:
+            regions: list
+                A list of (genome, start, stop) tuples covering every index in order
+
+        Returns:
+            The combined Genome
+        """
+        length = regions[-1][2]
+        size = Genome.chunk_size
+        chunks = []
+        region_index = 0
+        for chunk_start in range(0, length, size):
+            chunk_stop = min(chunk_start+size, length)
+            while regions[region_index][2] <= chunk_start:
+                region_index += 1
+            genome, start, stop = regions[region_index]
+            if start <= chunk_start and chunk_stop <= stop:
+                chunks.append(genome.chunks[chunk_start//size])
+                continue
+            # the chunk is split between regions so it must be built
+            chunk = []
+            i = region_index
+            while len(chunk) < chunk_stop-chunk_start:
+                genome, start, stop = regions[i]
+                chunk += genome.section(max(start, chunk_start+len(chunk)), min(stop, chunk_stop))
+                i += 1
+            chunks.append(tuple(chunk))
+        return Genome.from_chunks(chunks, length)
\ No newline at end of file
@@ -26,7 +26,8 @@ class IntSequenceTrait(SequenceTrait):
     """
 
     def __init__(self, length: int, min_value: int, max_value: int, crossover_type: str='2-point', 
-            mutation_type: str='random-reset', mutation_rate: float=0.05, n: int=None):
+            mutation_type: str='random-reset', mutation_rate: float=0.05, n: int=None,
+            copy_on_write: bool=False):
         """
         Args:
             length: int
@@ -43,5 +44,7 @@ class IntSequenceTrait(SequenceTrait):
                 The chance of a value being mutated each generation
             n: int
                 If the user selects the crossover type 'n-point' the n should be specified with this argument
+            copy_on_write: bool
+                If true, values are immutable Genomes (instead of lists) which share unchanged chunks with their parents
         """
-        super().__init__(IntTrait(min_value, max_value, mutation_rate=0), length, crossover_type, mutation_type, mutation_rate, n) 
\ No newline at end of file
+        super().__init__(IntTrait(min_value, max_value, mutation_rate=0), length, crossover_type, mutation_type, mutation_rate, n, copy_on_write) 
\ No newline at end of file
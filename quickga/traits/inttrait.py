@@ -28,6 +28,12 @@ class IntTrait(BaseTrait):
         self.max_value = max_value
         self.mutation_rate = mutation_rate
 
+    def bounds(self) -> list:
+        return [(self.min_value, self.max_value)]
+
+    def decode(self, vector: list) -> int:
+        return min(max(int(round(vector[0])), self.min_value), self.max_value)
+
     def random_value(self) -> int:
         return random.randint(self.min_value, self.max_value)
 
@@ -35,4 +41,4 @@ class IntTrait(BaseTrait):
         return random.choice([a,b])
 
     def mutate(self, value: int) -> int:
-        return self.random_value() if random.random()<self.mutation_rate else value
\ No newline at end of file
+        return self.random_value() if self.should_mutate() else value
\ No newline at end of file
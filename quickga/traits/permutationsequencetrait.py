@@ -2,11 +2,18 @@ import random
 from .sequencetrait import SequenceTrait
 
 class PermutationSequenceTrait(SequenceTrait):
-    def __init__(self, elements, crossover_type: str='partially-mapped', mutation_type: str='scramble', mutation_rate: float=0.05):
+    def __init__(self, elements, crossover_type: str='partially-mapped', mutation_type: str='scramble', mutation_rate: float=0.05,
+            copy_on_write: bool=False, distance_type: str='edge'):
         self.elements = [e for e in elements]
+        # the original position of each element, used to encode permutations numerically
+        self.element_indices = {e: i for i, e in enumerate(self.elements)}
+        # permutations of the integers 0 to n-1 index a distance matrix directly
+        self.elements_are_indices = all(type(e) is int and e == i for i, e in enumerate(self.elements))
         self.crossover_type = crossover_type
         self.mutation_type = mutation_type
         self.mutation_rate = mutation_rate
+        self.copy_on_write = copy_on_write
+        self.distance_type = distance_type
 
         self.crossover_functions = {
             'partially-mapped': self.partially_mapped_crossover,
@@ -24,6 +31,14 @@ class PermutationSequenceTrait(SequenceTrait):
         if mutation_type not in self.mutation_functions:
             raise Exception("Invalid mutation type provided")
 
+        self.distance_functions = {
+            'edge': self.edge_distance,
+            'kendall-tau': self.kendall_tau_distance
+        }
+
+        if distance_type not in self.distance_functions:
+            raise Exception("Invalid distance type provided")
+
     def map_index(self, index: int, a: list, b: list, region_start: int, region_end: int) -> int:
         map_index = lambda index : a.index(b[index])
         i = index
@@ -53,6 +68,78 @@ class PermutationSequenceTrait(SequenceTrait):
         return c
 
 
+    def encode(self, value: list) -> list:
+        return [float(self.element_indices[e]) for e in value]
+
+    def edge_distance(self, a: list, b: list) -> float:
+        """The number of (undirected) edges of the closed tour a which are not in the closed tour b"""
+        n = len(b)
+        adjacent = {e: (b[i-1], b[(i+1)%n]) for i, e in enumerate(b)}
+        return float(sum([a[(i+1)%n] not in adjacent[e] for i, e in enumerate(a)]))
+
+    def kendall_tau_distance(self, a: list, b: list) -> float:
+        """The number of pairs of elements which are in a different order in a and b"""
+        position = {e: i for i, e in enumerate(b)}
+        order = [position[e] for e in a]
+
+        # counts the inversions of 'order' with a bottom up merge sort
+        inversions = 0
+        width = 1
+        while width < len(order):
+            merged = []
+            for start in range(0, len(order), 2*width):
+                left = order[start:start+width]
+                right = order[start+width:start+2*width]
+                i = j = 0
+                while i < len(left) and j < len(right):
+                    if left[i] <= right[j]:
+                        merged.append(left[i])
+                        i += 1
+                    else:
+                        # every remaining element of the left half is greater than right[j]
+                        inversions += len(left)-i
+                        merged.append(right[j])
+                        j += 1
+                merged += left[i:]
+                merged += right[j:]
+            order = merged
+            width *= 2
+        return float(inversions)
+
+    def distance(self, a: list, b: list) -> float:
+        return self.distance_functions[self.distance_type](a, b)
+
+    def tour_length(self, value: list, distances, closed: bool=True) -> float:
+        """Sums the distances between consecutive elements of a permutation
+
+        Args:
+            value: list
+                A permutation of the elements
+            distances:
+                An n by n SharedArray (such as one from a ProblemContext) where row i column j is the distance
+                from the i-th to the j-th element of 'elements'
+            closed: bool
+                If True the distance from the last element back to the first is included
+
+        Returns:
+            The length of the tour
+        """
+        indices = value if self.elements_are_indices else [self.element_indices[e] for e in value]
+        if not indices:
+            return 0.0
+        n = distances.shape[1]
+        d = distances.values
+        length = sum([d[a*n+b] for a, b in zip(indices, indices[1:])])
+        if closed:
+            length += d[indices[-1]*n+indices[0]]
+        return length
+
+    def tour_lengths(self, values: list, distances, closed: bool=True) -> list:
+        """Returns the tour length of each permutation in values"""
+        return [self.tour_length(value, distances, closed) for value in values]
+
     def random_value(self) -> list:
-        random.shuffle(self.elements)
-        return self.elements
\ No newline at end of file
+        # shuffle a copy so that values never share a list with the trait (or each other)
+        elements = list(self.elements)
+        random.shuffle(elements)
+        return self.new_value(elements)
\ No newline at end of file
@@ -1,10 +1,12 @@
 import random
 from typing import Tuple
 from .basetrait import BaseTrait
+from .genome import Genome
 
 class SequenceTrait(BaseTrait):
 
-    def __init__(self, trait, length: int, crossover_type: str, mutation_type: str, mutation_rate: float=0.05, n: int=None):
+    def __init__(self, trait, length: int, crossover_type: str, mutation_type: str, mutation_rate: float=0.05, n: int=None,
+            copy_on_write: bool=False):
         """
         Args:
             trait: Trait
@@ -19,6 +21,8 @@ class SequenceTrait(BaseTrait):
                 The chance of a value being mutated each generation
             n: int
                 If the user selects the crossover type 'n-point' the n should be specified with this argument
+            copy_on_write: bool
+                If true, values are immutable Genomes (instead of lists) which share unchanged chunks with their parents
         """
 
         self.trait = trait
@@ -27,6 +31,7 @@ class SequenceTrait(BaseTrait):
         self.mutation_type = mutation_type
         self.mutation_rate = mutation_rate
         self.n = n
+        self.copy_on_write = copy_on_write
 
         self.crossover_functions = {
             'uniform': self.uniform_crossover,
@@ -43,6 +48,10 @@ class SequenceTrait(BaseTrait):
             'inversion': self.inversion_mutation
         }
 
+        # derived traits can add their own operators before the types are validated
+        self.crossover_functions.update(self.additional_crossover_functions())
+        self.mutation_functions.update(self.additional_mutation_functions())
+
         if crossover_type not in self.crossover_functions:
             raise Exception("Invalid crossover type provided")
         if mutation_type not in self.mutation_functions:
@@ -71,6 +80,14 @@ class SequenceTrait(BaseTrait):
         If mutated, value gets set mutated according to the method specified in the constructor
     """
 
+    def additional_crossover_functions(self) -> dict:
+        """May be overwritten to add crossover methods, returns a Dict of form {crossover_type: function}"""
+        return {}
+
+    def additional_mutation_functions(self) -> dict:
+        """May be overwritten to add mutation methods, returns a Dict of form {mutation_type: function}"""
+        return {}
+
     def random_unique_index_pair(self, items: list) -> Tuple[int, int]:
         """Returns two unique indices for a list"""
         index_a = random.randint(0,len(items)-1)
@@ -78,6 +95,22 @@ class SequenceTrait(BaseTrait):
         index_b += 1 if index_b >= index_a else 0
         return index_a, index_b
 
+    def new_value(self, items):
+        """Converts a newly created list into the representation used by the trait (a Genome if copy_on_write)"""
+        if self.copy_on_write and not isinstance(items, Genome):
+            return Genome(items)
+        return items
+
+    def replace_section(self, value, start: int, section: list):
+        """Replaces the values from index start with 'section'
+
+        Lists are changed in place, while a new Genome is created for Genomes (copying only the chunks touched)
+        """
+        if isinstance(value, Genome):
+            return value.set_section(start, section)
+        value[start:start+len(section)] = section
+        return value
+
     def uniform_crossover(self, a: list, b: list) -> list:
         """For each value in the child sequence, it is chosen from one of the parents at random
         
@@ -159,9 +192,15 @@ class SequenceTrait(BaseTrait):
         
         indices = [i for i in range(1, len(a)-1)]
         cross_indices = [indices.pop(random.randint(0,len(indices)-1)) for i in range(self.n)]
-        
-        new_sequence = []
         pick_from_a = random.random()<.5
+
+        if isinstance(a, Genome):
+            # build the child from regions of the parents so that chunks not crossed are shared
+            boundaries = [0] + sorted(i+1 for i in cross_indices) + [len(a)]
+            parents = [a, b] if pick_from_a else [b, a]
+            return Genome.combine([(parents[k%2], boundaries[k], boundaries[k+1]) for k in range(len(boundaries)-1)])
+
+        new_sequence = []
         for i in range(len(a)):
             new_sequence.append(a[i] if pick_from_a else b[i])
             if i in cross_indices:
@@ -186,9 +225,8 @@ class SequenceTrait(BaseTrait):
         """
 
         random_index = random.randint(0,len(value)-1)
-        value[random_index] = self.trait.random_value()
 
-        return value
+        return self.replace_section(value, random_index, [self.trait.random_value()])
 
     def insertion_mutation(self, value: list) -> list:
         """Randomly moves one value to another index in the array, shifts all other values
@@ -206,10 +244,13 @@ class SequenceTrait(BaseTrait):
         """
 
         remove_index, insert_index = self.random_unique_index_pair(value)
-        temp = value.pop(remove_index)
-        value.insert(insert_index, temp)
+        # only the values between the two indices are shifted
+        start_index = min(remove_index, insert_index)
+        section = value[start_index:max(remove_index, insert_index)+1]
+        temp = section.pop(remove_index-start_index)
+        section.insert(insert_index-start_index, temp)
 
-        return value
+        return self.replace_section(value, start_index, section)
 
     def swap_mutation(self, value: list) -> list:
         """Randomly swaps two values in the sequence
@@ -229,8 +270,8 @@ class SequenceTrait(BaseTrait):
         index_a, index_b = self.random_unique_index_pair(value)
 
         temp = value[index_a]
-        value[index_a] = value[index_b]
-        value[index_b] = temp
+        value = self.replace_section(value, index_a, [value[index_b]])
+        value = self.replace_section(value, index_b, [temp])
 
         return value
 
@@ -252,9 +293,8 @@ class SequenceTrait(BaseTrait):
         index_a, index_b = self.random_unique_index_pair(value)
         scramble_section = value[index_a:index_b]
         random.shuffle(scramble_section)
-        value[index_a:index_b] = scramble_section
 
-        return value
+        return self.replace_section(value, index_a, scramble_section)
 
     def inversion_mutation(self, value: list) -> list:
         """Randomly reverses a section in the sequence
@@ -275,20 +315,36 @@ class SequenceTrait(BaseTrait):
         index_a, index_b = self.random_unique_index_pair(value)
         invert_section = value[index_a:index_b]
         invert_section.reverse()
-        value[index_a:index_b] = invert_section
 
-        return value
+        return self.replace_section(value, index_a, invert_section)
 
     def initial_value(self) -> list:
-        return [self.trait.initial_value() for i in range(self.length)]
+        return self.new_value([self.trait.initial_value() for i in range(self.length)])
 
     def random_value(self) -> list:
-        return [self.trait.random_value() for i in range(self.length)]
+        return self.new_value([self.trait.random_value() for i in range(self.length)])
+
+    def encode(self, value: list) -> list:
+        return [x for v in value for x in self.trait.encode(v)]
+
+    def bounds(self) -> list:
+        return self.trait.bounds()*self.length
+
+    def decode(self, vector: list) -> list:
+        size = len(self.trait.bounds())
+        return self.new_value([self.trait.decode(vector[i:i+size]) for i in range(0, len(vector), size)])
+
+    def repair(self, value: list) -> list:
+        return self.new_value(super().repair(value))
+
+    def distance(self, a: list, b: list) -> float:
+        # hamming distance, the number of positions with different values
+        return float(sum([x != y for x, y in zip(a, b)]))
 
     def crossover(self, a: list, b: list) -> list:
-        return self.crossover_functions[self.crossover_type](a, b)
+        return self.new_value(self.crossover_functions[self.crossover_type](a, b))
 
     def mutate(self, value: list) -> list:
-        if random.random() < self.mutation_rate:
+        if self.should_mutate():
             return self.mutation_functions[self.mutation_type](value)
         return value
@@ -0,0 +1 @@
+from .racingtuner import RacingTuner
\ No newline at end of file
@@ -0,0 +1,154 @@
+import concurrent.futures
+import itertools
+import math
+import random
+import time
+from quickga.problemcontext import install_problem_contexts
+
+def run_configuration(organism_class, configuration: dict, population_size: int, generations: int, seed: int) -> dict:
+    """Runs evolve with one configuration inside a worker process and returns only the numbers needed for racing"""
+    random.seed(seed)
+    evolution_info = organism_class.evolve(population_size, generations, **configuration)
+    return {
+        'max_fitness': [info['max_fitness'] for info in evolution_info],
+        'evaluations': sum(info.get('evaluations', population_size) for info in evolution_info)
+    }
+
+
+class RacingTuner:
+    """A class to choose the settings of Organism.evolve by racing many configurations against each other
+
+    The configurations are tuned with successive halving: every surviving configuration is run in parallel
+    (across local processes) for a small number of generations, only the best 1/reduction_factor of them
+    (ranked by their mean final 'max_fitness') survive, and the survivors are run again with reduction_factor
+    times as many generations until the full number of generations is reached
+
+    The Organism class must be importable by the worker processes (defined at module level),
+    and every value in the configurations must be picklable (selection functions are)
+
+    Example:
+        configurations = RacingTuner.grid({
+            'crossover_rate': [0.6, 0.85, 0.95],
+            'elite_rate': [0, 0.05],
+            'selection_function': [ProportionalSelection(), TournamentSelection(3)]
+        })
+        result = RacingTuner(Regression, configurations, population_size=100, generations=200).run()
+        print(result['best_configuration'])
+    """
+
+    def __init__(self, organism_class, configurations: list, population_size: int, generations: int, min_generations: int=None,
+            reduction_factor: int=3, repeats: int=1, workers: int=None, seed: int=None):
+        """
+        Args:
+            organism_class:
+                The Organism class to evolve
+            configurations: list
+                A list of dicts of keyword arguments for Organism.evolve
+            population_size: int
+                The population size used by every run
+            generations: int
+                The number of generations the final configurations are run for
+            min_generations: int
+                The number of generations in the first round, chosen so there is a round for each halving if not provided
+            reduction_factor: int
+                The factor by which the number of configurations shrinks (and the number of generations grows) each round
+            repeats: int
+                How many runs (with different random seeds) each configuration is scored by in each round
+            workers: int
+                The number of worker processes, the number of CPUs if not provided
+            seed: int
+                Seeds the random seeds given to each run
+        """
+        if not configurations:
+            raise Exception("At least one configuration must be provided")
+        if reduction_factor < 2:
+            raise Exception("Reduction factor must be at least 2")
+
+        self.organism_class = organism_class
+        self.configurations = [dict(configuration) for configuration in configurations]
+        self.population_size = population_size
+        self.generations = generations
+        self.reduction_factor = reduction_factor
+        self.repeats = repeats
+        self.workers = workers
+        self.random = random.Random(seed)
+
+        if min_generations is None:
+            num_rounds = math.ceil(math.log(len(configurations), reduction_factor))+1 if len(configurations) > 1 else 1
+            min_generations = max(1, generations//reduction_factor**(num_rounds-1))
+        self.min_generations = min_generations
+
+    @staticmethod
+    def grid(options: dict) -> list:
+        """Creates a configuration for every combination of the options
+
+        Args:
+            options: dict
+                A Dict of form {argument name: list of values}
+
+        Returns:
+            A list of dicts of keyword arguments for Organism.evolve
+        """
+        names = list(options)
+        return [dict(zip(names, values)) for values in itertools.product(*[options[name] for name in names])]
+
+    def budgets(self) -> list:
+        """Returns the number of generations run in each round"""
+        budgets = []
+        budget = self.min_generations
+        while budget < self.generations:
+            budgets.append(budget)
+            budget *= self.reduction_factor
+        return budgets+[self.generations]
+
+    def run(self) -> dict:
+        """Races the configurations
+
+        Returns:
+            A dict with the best configuration and its score, the results of every round,
+            and the compute spent (generations and evaluations summed over every run, and the wall clock time)
+        """
+        start_time = time.monotonic()
+        surviving = list(range(len(self.configurations)))
+        rounds = []
+        total_generations = 0
+        total_evaluations = 0
+
+        # the problem context is built once here and attached to by every worker
+        contexts = []
+        if self.organism_class.uses_problem_context():
+            contexts.append((self.organism_class, self.organism_class.problem_context()))
+
+        with concurrent.futures.ProcessPoolExecutor(self.workers, initializer=install_problem_contexts, initargs=(contexts,)) as pool:
+            for budget in self.budgets():
+                futures = {}
+                for index in surviving:
+                    for repeat in range(self.repeats):
+                        future = pool.submit(run_configuration, self.organism_class, self.configurations[index],
+                            self.population_size, budget, self.random.randrange(2**32))
+                        futures[future] = index
+
+                scores = {index: [] for index in surviving}
+                for future in concurrent.futures.as_completed(futures):
+                    result = future.result()
+                    scores[futures[future]].append(result['max_fitness'][-1])
+                    total_generations += budget
+                    total_evaluations += result['evaluations']
+
+                mean_scores = {index: sum(values)/len(values) for index, values in scores.items()}
+                ranked = sorted(surviving, key=lambda index: mean_scores[index], reverse=True)
+                rounds.append({
+                    'generations': budget,
+                    'scores': [(self.configurations[index], mean_scores[index]) for index in ranked]
+                })
+                surviving = ranked[:max(1, math.ceil(len(ranked)/self.reduction_factor))]
+
+        best = ranked[0]
+        return {
+            'best_configuration': self.configurations[best],
+            'best_score': mean_scores[best],
+            'rounds': rounds,
+            'generations': total_generations,
+            'evaluations': total_evaluations,
+            'wall_time': time.monotonic()-start_time
+        }
\ No newline at end of file
@@ -0,0 +1,47 @@
+import random
+from quickga import AdaptiveControl, FloatSequenceTrait, Niching, NoveltySearch, Organism, ProportionalSelection
+
+class Walker(Organism):
+    def __init__(self):
+        super().__init__()
+        self.add_trait('x', FloatSequenceTrait(4, 0, 10))
+
+    def evaluate(self) -> float:
+        return 100+sum(self.x)
+
+    def behavior(self) -> list:
+        return self.x[:2]
+
+
+def test_parent_fitness_is_credited_from_true_fitness_with_novelty_search_and_niching():
+    random.seed(0)
+    adaptive_control = AdaptiveControl()
+    pool = [Walker() for i in range(20)]
+    for organism in pool:
+        organism.adaptive_control = adaptive_control
+        organism.fitness = organism.evaluate()
+
+    novelty_search = NoveltySearch(k=3)
+    novelty_search.update(pool)
+    for wrapper in [novelty_search, Niching('sharing', radius=3)]:
+        offspring = wrapper.select(ProportionalSelection(), pool, 10)
+
+        for child in offspring:
+            assert child.parent_fitness == max(parent.fitness for parent in child.parents)
+            assert child.parent_fitness > 100
+
+
+def test_evolve_with_novelty_search_credits_operators_by_fitness_improvement(monkeypatch):
+    random.seed(0)
+    improvements = []
+    original = AdaptiveControl.credit
+
+    def credit(self, offspring):
+        improvements.extend(organism.fitness > organism.parent_fitness for organism in offspring if organism.operators)
+        original(self, offspring)
+
+    monkeypatch.setattr(AdaptiveControl, 'credit', credit)
+    Walker.evolve(population_size=30, generations=5, adaptive_control=AdaptiveControl(), novelty_search=NoveltySearch(k=3))
+
+    # with parents credited by their novelty every child would count as an improvement
+    assert improvements and not all(improvements)
@@ -0,0 +1,29 @@
+from quickga import SumConstraint
+
+def test_sum_constraint_repairs_integers_onto_the_bound():
+    constraint = SumConstraint(max_sum=10)
+    repaired = constraint.repair([4, 4, 6])
+
+    assert sum(repaired) == 10
+    assert all(isinstance(v, int) for v in repaired)
+
+
+def test_sum_constraint_repairs_integers_below_a_non_integer_max_sum():
+    constraint = SumConstraint(max_sum=10.5)
+    for value in [[3, 4, 4], [5, 6], [11, 0, 0], [2, 2, 2, 2, 3]]:
+        repaired = constraint.repair(value)
+        assert constraint.is_feasible(repaired)
+        assert sum(repaired) == 10
+
+
+def test_sum_constraint_repairs_integers_above_a_non_integer_min_sum():
+    constraint = SumConstraint(min_sum=2.5, upper=5)
+    for value in [[0, 1, 1], [2, 0], [0, 0, 0]]:
+        repaired = constraint.repair(value)
+        assert constraint.is_feasible(repaired)
+        assert sum(repaired) == 3
+
+
+def test_sum_constraint_repairs_floats_onto_the_bound():
+    constraint = SumConstraint(max_sum=1.5)
+    assert constraint.is_feasible(constraint.repair([1.0, 2.0, 0.5]))
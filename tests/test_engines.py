@@ -0,0 +1,55 @@
+import random
+import pytest
+from quickga import CMAES, DifferentialEvolution, FloatSequenceTrait, IntTrait, Organism
+
+class Sphere(Organism):
+    def __init__(self):
+        super().__init__()
+        self.add_trait('x', FloatSequenceTrait(5, -5, 5))
+
+    def evaluate(self) -> float:
+        return -sum(x*x for x in self.x)
+
+
+class Corner(Organism):
+    """The optimum (0, 0) is outside the bounds, so the best organisms lie on the lower bounds"""
+
+    def __init__(self):
+        super().__init__()
+        self.add_trait('x', FloatSequenceTrait(3, 2, 10))
+        self.add_trait('k', IntTrait(3, 9))
+
+    def evaluate(self) -> float:
+        return -sum(x*x for x in self.x)-self.k*self.k
+
+
+engines = [
+    lambda: DifferentialEvolution(),
+    lambda: DifferentialEvolution('best/1/bin'),
+    lambda: DifferentialEvolution('current-to-best/1/bin'),
+    lambda: CMAES()
+]
+
+
+@pytest.mark.parametrize('create_engine', engines)
+def test_engine_converges_on_sphere(create_engine):
+    random.seed(0)
+    info = Sphere.evolve(population_size=30, generations=60, engine=create_engine())
+
+    assert info[-1]['max_fitness'] > -0.05
+    assert info[-1]['max_fitness'] >= info[0]['max_fitness']
+
+
+@pytest.mark.parametrize('create_engine', engines)
+def test_engine_respects_trait_bounds(create_engine):
+    random.seed(0)
+    populations = []
+    Corner.evolve(population_size=20, generations=30, engine=create_engine(),
+        generational_callback=lambda info: populations.append(info['population']))
+
+    for population in populations:
+        for organism in population:
+            assert all(2 <= x <= 10 for x in organism.x)
+            assert 3 <= organism.k <= 9 and isinstance(organism.k, int)
+    best = max(populations[-1], key=lambda organism: organism.fitness)
+    assert best.k == 3 and all(x < 2.5 for x in best.x)
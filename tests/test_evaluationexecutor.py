@@ -0,0 +1,89 @@
+import multiprocessing.pool
+import threading
+import time
+import pytest
+from quickga import EvaluationExecutor, Organism
+
+class Sleeper(Organism):
+    def __init__(self, delays: list=None, value: float=0):
+        super().__init__()
+        # shared by the copies sent to the workers, so a later evaluation can be faster than the first
+        self.delays = delays or [0.01]
+        self.value = value
+
+    def evaluate(self) -> float:
+        time.sleep(self.delays.pop(0) if len(self.delays) > 1 else self.delays[0])
+        return self.value
+
+
+class CountingPool(multiprocessing.pool.ThreadPool):
+    """A ThreadPool which records the most evaluations ever submitted and not yet finished"""
+
+    def __init__(self, *args, **kargs):
+        super().__init__(*args, **kargs)
+        self.lock = threading.Lock()
+        self.outstanding = 0
+        self.most_outstanding = 0
+
+    def apply_async(self, func, args=(), kwds={}, callback=None, error_callback=None):
+        with self.lock:
+            self.outstanding += 1
+            self.most_outstanding = max(self.most_outstanding, self.outstanding)
+
+        def finished(value):
+            with self.lock:
+                self.outstanding -= 1
+        return super().apply_async(func, args, kwds, finished, finished)
+
+
+def test_queued_time_does_not_count_towards_timeout():
+    with EvaluationExecutor(workers=1, backend='thread', timeout=0.2, speculative_quantile=None) as executor:
+        fitnesses = executor.evaluate([Sleeper([0.08], i) for i in range(5)])
+
+        assert fitnesses == [0, 1, 2, 3, 4]
+        assert executor.statistics()['timed_out'] == 0
+
+
+def test_timed_out_evaluations_are_retried_then_penalized():
+    with EvaluationExecutor(workers=2, backend='thread', timeout=0.05, retries=1, penalty_fitness=-1,
+            speculative_quantile=None) as executor:
+        fitnesses = executor.evaluate([Sleeper([0.3], 1), Sleeper([0.01], 2)])
+
+        assert fitnesses == [-1, 2]
+        assert executor.statistics() == {'failed': 0, 'timed_out': 2, 'retried': 1, 'speculative': 0, 'penalized': 1}
+
+
+def test_abandoned_stragglers_keep_their_worker_busy():
+    executor = EvaluationExecutor(workers=2, backend='thread', speculative_quantile=0.5, speculative_factor=2)
+    executor.backends['thread'] = CountingPool
+    organisms = [Sleeper([0.5, 0.01], 100)]+[Sleeper([0.02], i) for i in range(30)]
+    with executor:
+        fitnesses = executor.evaluate(organisms)
+        pool = executor.pool
+
+        assert fitnesses == [100]+list(range(30))
+        assert executor.statistics()['speculative'] == 1
+        assert pool.most_outstanding <= 2
+
+
+def test_process_workers_report_when_evaluations_start():
+    with EvaluationExecutor(workers=2, timeout=5) as executor:
+        fitnesses = executor.evaluate([Sleeper([0.01], i) for i in range(6)])
+
+        assert fitnesses == list(range(6))
+        assert executor.statistics()['timed_out'] == 0
+        assert executor.pool is not None
+
+
+
+def test_evolve_closes_executor_even_if_the_run_fails():
+    executor = EvaluationExecutor(workers=2, backend='thread')
+    Sleeper.evolve(population_size=6, generations=2, executor=executor)
+    assert executor.pool is None
+
+    def callback(info):
+        raise ValueError("the run failed")
+
+    with pytest.raises(ValueError):
+        Sleeper.evolve(population_size=6, generations=2, executor=executor, generational_callback=callback)
+    assert executor.pool is None
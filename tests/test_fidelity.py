@@ -0,0 +1,34 @@
+import random
+from quickga import FloatSequenceTrait, MultiFidelityScheduler, Organism
+
+class Sampled(Organism):
+    def __init__(self):
+        super().__init__()
+        self.add_trait('x', FloatSequenceTrait(4, 0, 10))
+
+    def evaluate(self, fidelity: float=1) -> float:
+        return sum(self.x)*fidelity
+
+
+def test_successive_halving_promotes_the_most_fit():
+    random.seed(0)
+    organisms = [Sampled() for i in range(27)]
+    scheduler = MultiFidelityScheduler([0.1, 0.3, 1], promotion_rate=1/3)
+    evaluated = scheduler.evaluate(organisms)
+
+    assert len(evaluated) == 27
+    assert scheduler.statistics()['evaluations'] == [27, 9, 3]
+    full = sorted(organisms, key=lambda organism: sum(organism.x), reverse=True)[:3]
+    assert all(organism.fidelity == 1 and organism.fitness == sum(organism.x) for organism in full)
+    assert sum(organism.fidelity == 0.1 for organism in organisms) == 18
+
+
+def test_elites_below_full_fidelity_are_evaluated_again():
+    random.seed(0)
+    elite = Sampled()
+    scheduler = MultiFidelityScheduler([0.5, 1])
+    scheduler.evaluate_at([elite], 0)
+
+    scheduler.evaluate([], [elite])
+    assert elite.fidelity == 1 and elite.fitness == sum(elite.x)
+    assert MultiFidelityScheduler.evaluate.__defaults__ == (None, None)
@@ -0,0 +1,46 @@
+from quickga import GenomeIndex, GenomeKey, IntTrait, Organism
+
+class Pair(Organism):
+    def __init__(self):
+        super().__init__()
+        self.add_trait('a', IntTrait(0, 3))
+        self.add_trait('b', IntTrait(0, 3))
+
+    def evaluate(self) -> float:
+        return self.a+self.b
+
+
+def pair(a: int, b: int) -> Pair:
+    organism = Pair()
+    organism.a, organism.b = a, b
+    organism.clear_genome_key()
+    return organism
+
+
+def test_index_counts_identical_genomes():
+    index = GenomeIndex([pair(1, 2), pair(1, 2), pair(2, 1)])
+
+    assert pair(1, 2) in index and pair(0, 0) not in index
+    assert index.count(pair(1, 2)) == 2
+    assert len(index) == 3 and index.unique_count() == 2
+    assert index.add(pair(0, 0)) and not index.add(pair(2, 1))
+
+    index.remove(pair(1, 2))
+    assert index.count(pair(1, 2)) == 1
+    index.remove(pair(1, 2))
+    assert pair(1, 2) not in index
+
+
+def test_default_indices_do_not_share_genomes():
+    first = GenomeIndex()
+    first.add(pair(1, 1))
+
+    assert len(GenomeIndex()) == 0
+    assert GenomeIndex.__init__.__defaults__ == (None,)
+
+
+def test_genome_key_freezes_sequences():
+    assert GenomeKey.freeze([1, [2, 3]]) == (1, (2, 3))
+    assert GenomeKey.freeze(bytearray(b'ab')) == b'ab'
+    assert hash(GenomeKey([1, 2])) == hash(GenomeKey([1, 2]))
+
@@ -0,0 +1,59 @@
+import random
+from quickga import FloatSequenceTrait, LineageRecorder, Organism
+
+class Point(Organism):
+    def __init__(self):
+        super().__init__()
+        self.add_trait('x', FloatSequenceTrait(4, 0, 10))
+
+    def evaluate(self) -> float:
+        return sum(self.x)
+
+
+def generation(size: int) -> list:
+    population = [Point() for i in range(size)]
+    for organism in population:
+        organism.fitness = organism.evaluate()
+    return population
+
+
+def test_record_links_offspring_and_carried_down_organisms_to_the_previous_generation():
+    random.seed(0)
+    lineage = LineageRecorder()
+    first = generation(4)
+    lineage.record(first)
+
+    child = first[0].breed(first[2])
+    child.fitness = child.evaluate()
+    migrated = generation(1)[0]
+    lineage.record([first[3], first[1], child, migrated], elites=[first[3]], carried_over=[first[1]])
+
+    assert lineage.status_counts(0) == {'random': 4, 'offspring': 0, 'elite': 0, 'carried_over': 0}
+    assert lineage.status_counts(1) == {'random': 1, 'offspring': 1, 'elite': 1, 'carried_over': 1}
+    assert lineage.parents(1, 0) == [3] and lineage.parents(1, 1) == [1]
+    assert lineage.parents(1, 2) == [0, 2] and lineage.parents(1, 3) == []
+    assert lineage.offspring_counts(1) == {3: 1, 1: 1, 0: 1, 2: 1}
+    # parents are only kept as indices
+    assert child.parents == []
+
+
+def test_record_defaults_do_not_leak_between_calls():
+    random.seed(0)
+    lineage = LineageRecorder()
+    lineage.record(generation(3))
+    lineage.record(generation(3))
+
+    assert lineage.status_counts(1) == {'random': 3, 'offspring': 0, 'elite': 0, 'carried_over': 0}
+    assert LineageRecorder.record.__defaults__ == (None, None)
+
+
+def test_ancestry_of_best_follows_the_parents_back():
+    random.seed(0)
+    lineage = LineageRecorder()
+    Point.evolve(population_size=20, generations=6, lineage=lineage)
+
+    ancestry = lineage.ancestry_of_best()
+    assert lineage.num_generations() == 6
+    assert ancestry[5] == {lineage.best_index()}
+    assert all(generation in ancestry for generation in range(6))
+    assert 0 < lineage.effective_number_of_parents(5) <= 20
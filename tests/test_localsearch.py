@@ -0,0 +1,115 @@
+import random
+import threading
+import pytest
+from quickga import EvaluationExecutor, FloatHillClimb, FloatSequenceTrait, Organism, SumConstraint
+
+class Flat(Organism):
+    def __init__(self):
+        super().__init__()
+        self.add_trait('x', FloatSequenceTrait(4, 0, 1))
+
+    def evaluate(self) -> float:
+        return 0
+
+
+class Constant(Organism):
+    def __init__(self):
+        super().__init__()
+        self.add_trait('x', FloatSequenceTrait(4, 5, 5))
+
+    def evaluate(self) -> float:
+        return sum(self.x)
+
+
+class Bag(Organism):
+    def __init__(self):
+        super().__init__()
+        self.add_trait('x', FloatSequenceTrait(4, 0, 10).add_constraint(SumConstraint(max_sum=5)))
+
+    def evaluate(self) -> float:
+        return sum(self.x)
+
+
+def test_float_hill_climb_rejects_non_positive_step_size():
+    for step_size in [0, -0.1]:
+        with pytest.raises(Exception):
+            FloatHillClimb('x', step_size=step_size)
+
+
+def test_float_hill_climb_skips_trait_with_zero_range():
+    organism = Constant()
+    organism.fitness = organism.evaluate()
+    assert FloatHillClimb('x', budget=10).improve(organism, organism.x) == (None, None, 0)
+
+
+def test_float_hill_climb_stops_once_steps_underflow():
+    random.seed(0)
+    organism = Flat()
+    # a flat fitness never improves, so every step is halved until no coordinate can move
+    result = FloatHillClimb('x', budget=10**9).improve(organism, organism.x)
+    assert result[:2] == (None, None)
+    assert result[2] < 10**9
+
+
+def test_local_search_keeps_organisms_feasible():
+    for feasibility in ['repair', 'penalize']:
+        for seed in range(10):
+            random.seed(seed)
+            most_fit = []
+            Bag.evolve(population_size=20, generations=4, local_search=FloatHillClimb('x', rate=0.3), feasibility=feasibility,
+                generational_callback=lambda info: most_fit.append(info['most_fit']))
+
+            assert all(organism.is_feasible() for organism in most_fit if organism.feasible)
+
+
+def test_local_search_only_moves_to_feasible_values():
+    random.seed(0)
+    organism = Bag()
+    organism.x = [1.0, 1.0, 1.0, 1.0]
+    organism.fitness = organism.evaluate()
+
+    improved, num_evaluations = FloatHillClimb('x', budget=30).apply(organism, 'penalize')
+
+    assert improved
+    assert 4 < organism.fitness <= 5 and organism.is_feasible()
+
+
+class Noisy(Organism):
+    def __init__(self):
+        super().__init__()
+        self.add_trait('x', FloatSequenceTrait(4, 0, 10))
+        self.calls = []
+
+    def evaluate(self, fidelity: float=1) -> float:
+        self.calls.append((fidelity, threading.current_thread() is threading.main_thread()))
+        return sum(self.x)*fidelity
+
+
+def test_local_search_evaluates_at_the_given_fidelity():
+    random.seed(0)
+    organism = Noisy()
+    organism.fitness = organism.evaluate(fidelity=0.1)
+    organism.fidelity = 0.1
+    organism.calls.clear()
+
+    improved, num_evaluations = FloatHillClimb('x', budget=10).apply(organism, fidelity=1)
+
+    assert improved
+    assert organism.fidelity == 1 and organism.fitness == sum(organism.x)
+    # the organism is evaluated again at full fidelity before its candidates are compared against it
+    assert len(organism.calls) == num_evaluations == 11
+    assert all(fidelity == 1 for fidelity, on_main_thread in organism.calls)
+
+
+def test_local_search_evaluates_with_the_executor():
+    random.seed(0)
+    organism = Noisy()
+    organism.fitness = organism.evaluate()
+    organism.calls.clear()
+
+    with EvaluationExecutor(workers=1, backend='thread') as executor:
+        improved, num_evaluations = FloatHillClimb('x', budget=5).apply(organism, executor=executor)
+
+    assert improved
+    assert len(organism.calls) == num_evaluations == 5
+    assert not any(on_main_thread for fidelity, on_main_thread in organism.calls)
@@ -0,0 +1,44 @@
+import pytest
+from quickga import FloatSequenceTrait, Niching, Organism
+
+class Point(Organism):
+    def __init__(self):
+        super().__init__()
+        self.add_trait('x', FloatSequenceTrait(4, 0, 10))
+
+    def evaluate(self) -> float:
+        return sum(self.x)
+
+
+def points(positions: list) -> list:
+    population = [Point() for position in positions]
+    for organism, position in zip(population, positions):
+        organism.x = [position, 0, 0, 0]
+        organism.fitness = organism.evaluate()
+    return population
+
+
+def test_radius_must_be_positive():
+    for radius in [0, -1]:
+        with pytest.raises(Exception):
+            Niching('sharing', radius=radius)
+
+
+def test_sharing_divides_fitness_by_niche_count():
+    population = points([2, 3, 10])
+    shared = Niching('sharing', radius=2).selection_fitnesses(population)
+    assert shared == pytest.approx([2/1.5, 3/1.5, 10])
+
+
+def test_clearing_keeps_only_the_winner_of_each_niche():
+    population = points([2, 3, 10])
+    assert Niching('clearing', radius=2).selection_fitnesses(population) == [0, 3, 10]
+
+
+def test_select_scores_by_niched_fitness_without_changing_fitness():
+    population = points([2, 3, 10])
+    seen = Niching('clearing', radius=2).select(lambda pool, n: [organism.selection_fitness for organism in pool], population, 2)
+
+    assert seen == [0, 3, 10]
+    assert [organism.fitness for organism in population] == [2, 3, 10]
+    assert all(organism.selection_score is None for organism in population)
@@ -0,0 +1,58 @@
+import random
+from quickga import FloatSequenceTrait, NoveltySearch, Organism
+
+class Walker(Organism):
+    def __init__(self):
+        super().__init__()
+        self.add_trait('x', FloatSequenceTrait(4, 0, 10))
+
+    def evaluate(self) -> float:
+        return sum(self.x)
+
+    def behavior(self) -> list:
+        return self.x[:1]
+
+
+def walkers(positions: list) -> list:
+    population = [Walker() for position in positions]
+    for organism, position in zip(population, positions):
+        organism.x = [position, 0, 0, 0]
+        organism.fitness = organism.evaluate()
+    return population
+
+
+def test_novelty_is_mean_distance_to_k_nearest_behaviors():
+    population = walkers([0, 1, 3, 7])
+    novelty_search = NoveltySearch(k=2, insertion_type='most-novel', insertion_rate=0.25)
+    novelty_search.update(population)
+
+    assert [organism.novelty for organism in population] == [2, 1.5, 2.5, 5]
+    # the most novel behavior was archived, so it is now its own nearest neighbor
+    novelty_search.update(population)
+    assert population[3].novelty == 2
+
+
+def test_archive_grows_until_full():
+    random.seed(0)
+    novelty_search = NoveltySearch(k=3, archive_size=12, insertion_type='most-novel', insertion_rate=0.2)
+    sizes = []
+    for generation in range(5):
+        novelty_search.update(walkers([random.uniform(0, 10) for i in range(10)]))
+        sizes.append(novelty_search.statistics()['archive_size'])
+
+    assert sizes == [2, 4, 6, 8, 10]
+    for generation in range(5):
+        novelty_search.update(walkers([random.uniform(0, 10) for i in range(10)]))
+    assert len(novelty_search.archive) == 12
+
+
+def test_select_scores_by_novelty_without_changing_fitness():
+    population = walkers([0, 1, 3, 7])
+    novelty_search = NoveltySearch(k=2)
+    novelty_search.update(population)
+
+    seen = novelty_search.select(lambda pool, n: [organism.selection_fitness for organism in pool], population, 2)
+
+    assert seen == [2, 1.5, 2.5, 5]
+    assert [organism.fitness for organism in population] == [0, 1, 3, 7]
+    assert all(organism.selection_fitness == organism.fitness for organism in population)
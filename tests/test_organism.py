@@ -0,0 +1,42 @@
+import random
+from quickga import FloatSequenceTrait, FloatTrait, Organism, SequenceTrait
+
+class Tracked(Organism):
+    def __init__(self):
+        super().__init__()
+        self.add_trait('x', FloatSequenceTrait(4, 0, 10))
+        self.history = []
+
+    def evaluate(self) -> float:
+        self.history.append(sum(self.x))
+        return sum(self.x)
+
+
+def test_with_values_does_not_share_derived_class_attributes():
+    random.seed(0)
+    parent = Tracked()
+    parent.fitness = parent.evaluate()
+    child = parent.with_values({'x': [1, 2, 3, 4]})
+
+    assert child.x == [1, 2, 3, 4]
+    assert child.history == []
+    child.evaluate()
+    assert parent.history == [parent.fitness]
+    assert child.fitness == 0 and child.parents == []
+
+
+def test_with_values_does_not_generate_initial_values(monkeypatch):
+    parent = Tracked()
+    calls = []
+    for trait_class in [SequenceTrait, FloatTrait]:
+        original = trait_class.random_value
+        monkeypatch.setattr(trait_class, 'random_value', lambda self, original=original: calls.append(self) or original(self))
+
+    children = [parent.with_values({'x': [float(i)]*4}) for i in range(10)]
+
+    assert calls == []
+    assert [child.x for child in children] == [[float(i)]*4 for i in range(10)]
+    assert all(child.history == [] for child in children)
+    # organisms created through their class still get initial values
+    Tracked()
+    assert calls
@@ -0,0 +1,14 @@
+import pytest
+from quickga import ProblemContext
+
+def test_arrays_are_read_only():
+    for storage in ['shared-memory', 'mmap']:
+        context = ProblemContext({'weights': [1, 2, 3], 'distances': [[0.0, 1.5], [1.5, 0.0]]}, storage=storage)
+
+        assert context['weights'].tolist() == [1, 2, 3]
+        assert context['distances'][0, 1] == 1.5
+        with pytest.raises(TypeError):
+            context['weights'].values[0] = 5
+        with pytest.raises(TypeError):
+            context['distances'].values[1] = 5.0
+        context.close()
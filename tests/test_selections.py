@@ -0,0 +1,33 @@
+import math
+import random
+from quickga import BoltzmannSelection, FloatSequenceTrait, Organism, StochasticUniversalSampling
+
+class Point(Organism):
+    def __init__(self):
+        super().__init__()
+        self.add_trait('x', FloatSequenceTrait(4, 0, 10))
+
+    def evaluate(self) -> float:
+        return sum(self.x)
+
+
+def test_stochastic_universal_sampling_keeps_positive_fitnesses_proportional():
+    random.seed(0)
+    pool = [Point() for i in range(3)]
+    for organism, fitness in zip(pool, [1, 2, 7]):
+        organism.fitness = fitness
+
+    for trial in range(50):
+        indices = StochasticUniversalSampling().__self__.select_indices(pool, 20)
+        for i, fitness in enumerate([1, 2, 7]):
+            expected = 20*fitness/10
+            assert math.floor(expected) <= indices.count(i) <= math.ceil(expected)
+
+
+def test_boltzmann_selection_cools_once_per_generation_and_resets_each_run():
+    random.seed(0)
+    selection = BoltzmannSelection(temperature=2, cooling_rate=0.5, min_temperature=0.1)
+    for run in range(2):
+        # the first generation is random, so parents are only selected for the last two generations
+        Point.evolve(population_size=10, generations=3, selection_function=selection, duplicate_handling='replace')
+        assert math.isclose(selection.__self__.temperature, 2*0.5**2)
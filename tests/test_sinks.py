@@ -0,0 +1,52 @@
+import csv
+import json
+import pytest
+from quickga import CSVSink, FloatSequenceTrait, JSONLSink, Organism
+
+class Point(Organism):
+    def __init__(self):
+        super().__init__()
+        self.add_trait('x', FloatSequenceTrait(4, 0, 10))
+
+    def evaluate(self) -> float:
+        return sum(self.x)
+
+
+def test_buffered_generations_are_written_when_the_run_fails(tmp_path):
+    path = tmp_path/'stats.jsonl'
+    sink = JSONLSink(str(path), batch_size=10)
+
+    def callback(info):
+        if len(generations) == 2:
+            raise ValueError("the run failed")
+        generations.append(info)
+    generations = []
+
+    with pytest.raises(ValueError):
+        Point.evolve(population_size=10, generations=5, sinks=[sink], generational_callback=callback)
+
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [line['generation'] for line in lines] == [0, 1, 2]
+    assert sink.thread is None and sink.file.closed
+
+
+def test_csv_sink_raises_on_stats_which_are_not_columns(tmp_path):
+    sink = CSVSink(str(tmp_path/'stats.csv'), batch_size=1)
+    sink.write({'max_fitness': 1})
+    sink.write({'max_fitness': 2, 'locally_improved': 3})
+    # the error is raised on the background thread, and raised again by close
+    with pytest.raises(Exception, match='locally_improved'):
+        sink.close()
+
+
+def test_csv_sink_writes_columns_provided_up_front(tmp_path):
+    path = tmp_path/'stats.csv'
+    sink = CSVSink(str(path), columns=['generation', 'max_fitness', 'adaptation.rate'])
+    sink.write({'max_fitness': 1})
+    sink.write({'max_fitness': 2, 'adaptation': {'rate': 0.5}})
+    sink.close()
+
+    with open(path, newline='') as file:
+        rows = list(csv.DictReader(file))
+    assert rows == [{'generation': '0', 'max_fitness': '1', 'adaptation.rate': ''},
+        {'generation': '1', 'max_fitness': '2', 'adaptation.rate': '0.5'}]
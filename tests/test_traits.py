@@ -0,0 +1,82 @@
+import random
+import string
+import pytest
+from quickga import CompactCharSequenceTrait, Organism
+
+def test_compact_char_sequence_round_trips_through_bytes():
+    random.seed(0)
+    trait = CompactCharSequenceTrait(16, include=['lowercase', 'uppercase', 'punctuation'])
+    value = trait.random_value()
+
+    assert isinstance(value, bytearray) and len(value) == 16
+    assert bytearray(trait.to_string(value), 'ascii') == value
+    assert trait.encode(value) == [float(ord(character)) for character in trait.to_string(value)]
+    assert trait.match_count(value, trait.to_string(value)) == 16
+    assert trait.match_counts([value, bytearray(value)], bytes(value)) == [16, 16]
+
+
+def test_compact_char_sequence_compares_against_a_target():
+    trait = CompactCharSequenceTrait(5)
+    value = bytearray(b'hello')
+
+    assert trait.match_count(value, 'hallo') == 4
+    assert trait.hamming_distances([value, bytearray(b'world')], 'hello') == [0, 4]
+    assert trait.distance(value, bytearray(b'jelly')) == 2
+
+
+@pytest.mark.parametrize('crossover_type', ['uniform', '1-point', '2-point', 'n-point'])
+def test_compact_char_sequence_crossover_takes_each_character_from_a_parent(crossover_type):
+    random.seed(0)
+    trait = CompactCharSequenceTrait(20, crossover_type=crossover_type, n=3)
+    a, b = bytearray(b'a'*20), bytearray(b'B'*20)
+    for i in range(20):
+        child = trait.crossover(a, b)
+
+        assert isinstance(child, bytearray) and len(child) == 20
+        assert set(child) <= {ord('a'), ord('B')}
+    # the parents are not changed
+    assert a == bytearray(b'a'*20) and b == bytearray(b'B'*20)
+
+
+@pytest.mark.parametrize('mutation_type', ['swap', 'insertion', 'scramble', 'inversion'])
+def test_compact_char_sequence_reordering_mutations_keep_the_characters(mutation_type):
+    random.seed(0)
+    trait = CompactCharSequenceTrait(12, mutation_type=mutation_type, mutation_rate=1)
+    value = bytearray(b'abcdefghijkl')
+    mutated = trait.mutate(bytearray(value))
+
+    assert isinstance(mutated, bytearray)
+    assert sorted(mutated) == sorted(value)
+    assert trait.mutated
+
+
+def test_compact_char_sequence_random_reset_changes_one_character():
+    random.seed(0)
+    trait = CompactCharSequenceTrait(12, include=['uppercase'], mutation_rate=1)
+    for i in range(20):
+        value = bytearray(b'abcdefghijkl')
+        mutated = trait.mutate(bytearray(value))
+
+        assert isinstance(mutated, bytearray)
+        changed = [j for j in range(12) if mutated[j] != value[j]]
+        assert len(changed) == 1
+        assert chr(mutated[changed[0]]) in string.ascii_uppercase
+
+
+class Phrase(Organism):
+    target = 'evolution'
+
+    def __init__(self):
+        super().__init__()
+        self.add_trait('text', CompactCharSequenceTrait(len(self.target), include=['lowercase']))
+
+    def evaluate(self) -> float:
+        return self._traits['text'].match_count(self.text, self.target)
+
+
+def test_compact_char_sequence_evolves():
+    random.seed(0)
+    info = Phrase.evolve(population_size=100, generations=30)
+
+    assert isinstance(info[-1]['most_fit'].text, bytearray)
+    assert info[-1]['max_fitness'] > info[0]['max_fitness']
@@ -0,0 +1,39 @@
+from quickga import FloatSequenceTrait, Organism, RacingTuner, RandomSelection, TournamentSelection
+
+class Sphere(Organism):
+    def __init__(self):
+        super().__init__()
+        self.add_trait('x', FloatSequenceTrait(5, -5, 5))
+
+    def evaluate(self) -> float:
+        return 100-sum(x*x for x in self.x)
+
+
+def test_grid_creates_every_combination():
+    configurations = RacingTuner.grid({'crossover_rate': [0.6, 0.9], 'elite_rate': [0, 0.1, 0.2]})
+
+    assert len(configurations) == 6
+    assert {'crossover_rate': 0.9, 'elite_rate': 0.1} in configurations
+
+
+def test_racing_eliminates_a_clearly_worse_configuration():
+    # parents chosen at random without elites give no selection pressure, so the population does not improve
+    worse = {'selection_function': RandomSelection(), 'elite_rate': 0}
+    configurations = [{'selection_function': TournamentSelection(size), 'elite_rate': 0.1} for size in [2, 3, 4]]+[worse]
+    tuner = RacingTuner(Sphere, configurations, population_size=20, generations=12, reduction_factor=2, repeats=2,
+        workers=2, seed=0)
+
+    result = tuner.run()
+    rounds = result['rounds']
+
+    assert [round_info['generations'] for round_info in rounds] == tuner.budgets() == [3, 6, 12]
+    first_round = [configuration for configuration, score in rounds[0]['scores']]
+    assert first_round[-1] == worse
+    # the best half of each round survive and are raced again in the next round
+    for previous, current in zip(rounds, rounds[1:]):
+        survivors = [configuration for configuration, score in previous['scores'][:len(previous['scores'])//2]]
+        raced = [configuration for configuration, score in current['scores']]
+        assert len(raced) == len(survivors) and all(configuration in survivors for configuration in raced)
+    assert worse not in [configuration for configuration, score in rounds[1]['scores']]
+    assert result['best_configuration'] == rounds[-1]['scores'][0][0] and result['best_configuration'] != worse
+    assert result['generations'] == 2*(4*3+2*6+1*12)